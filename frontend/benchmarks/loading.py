@@ -0,0 +1,108 @@
+"""Measure how long a large organizations file takes to reach the first paint.
+
+Writes a synthetic college-wide data file to a temporary directory and opens
+it twice: once without a sidecar index (every organization fully parsed) and
+once with it (summaries only, details parsed when an organization is opened).
+Run offscreen with::
+
+    QT_QPA_PLATFORM=offscreen python -m frontend.benchmarks.loading
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from frontend.benchmarks.records import synthetic_org
+from frontend.utils.orgs_data import summary_index
+from frontend.utils.orgs_data.repository import OrganizationRepository
+
+def synthetic_dataset(path: str, orgs: int, branches: int, members: int, events: int, semesters: int) -> None:
+    organizations = []
+    for index in range(orgs):
+        org = json.loads(synthetic_org(members, 10, semesters, seed=index))
+        org.update({
+            "id": index + 1, "name": f"Organization {index + 1}", "is_joined": index % 7 == 0, "is_branch": False,
+            "logo_path": "No Photo", "details": "", "brief": "Synthetic organization", "description": "",
+            "events": [{"name": f"Event {e}", "date": "2025-01-01", "description": "Synthetic event"} for e in range(events)],
+        })
+        org["branches"] = []
+        for b in range(branches):
+            branch = json.loads(synthetic_org(members // 4, 5, 0, seed=index * 100 + b))
+            branch.update({"id": (index + 1) * 100 + b + 1, "name": f"Branch {b + 1} of {index + 1}", "is_joined": False,
+                           "is_branch": True, "logo_path": "No Photo", "events": []})
+            org["branches"].append(branch)
+        organizations.append(org)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({"organizations": organizations}, file, indent=4)
+
+def prepare(path: str, mode: str) -> None:
+    """Remove the sidecar index for a full parse, or make sure it exists for a summary load."""
+    index = summary_index.index_path(path)
+    if mode == "full parse":
+        if os.path.exists(index):
+            os.remove(index)
+    else:
+        # A full load writes the index.
+        OrganizationRepository(path).organizations()
+
+def timed(action: Callable[[], object]) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = action()
+    return (time.perf_counter() - start) * 1000, result
+
+def first_paint(path: str) -> Dict[str, float]:
+    """Time opening the student window on ``path`` until its organization grid has painted."""
+    from PyQt6 import QtWidgets
+
+    from frontend.views.default.Organizations.student_organization import MainWindow
+
+    OrganizationRepository._instance = OrganizationRepository(path)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    start = time.perf_counter()
+    window = MainWindow()
+    window.resize(1280, 800)
+    window.show()
+    window.repaint()
+    app.processEvents()
+    paint_ms = (time.perf_counter() - start) * 1000
+    organizations = window._load_data()
+    details_ms, _ = timed(lambda: window.show_org_details(organizations[len(organizations) // 2]))
+    members_ms, _ = timed(window._to_members_page)
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    OrganizationRepository._instance = None
+    return {"first paint (ms)": paint_ms, "open details (ms)": details_ms, "open members (ms)": members_ms}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark summary-first loading of the organizations file.")
+    parser.add_argument("--orgs", type=int, default=60, help="top-level organizations (default: %(default)s)")
+    parser.add_argument("--branches", type=int, default=3, help="branches per organization (default: %(default)s)")
+    parser.add_argument("--members", type=int, default=2000, help="members per organization (default: %(default)s)")
+    parser.add_argument("--events", type=int, default=50, help="events per organization (default: %(default)s)")
+    parser.add_argument("--semesters", type=int, default=8, help="semesters of officer history (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "organizations_data.json")
+        synthetic_dataset(path, args.orgs, args.branches, args.members, args.events, args.semesters)
+        print(f"{os.path.getsize(path) / 1e6:.1f} MB data file")
+
+        rows: Dict[str, Dict[str, float]] = {}
+        for mode in ("full parse", "summary index"):
+            prepare(path, mode)
+            rows.setdefault("load organizations (ms)", {})[mode], _ = timed(lambda: OrganizationRepository(path).organizations())
+            prepare(path, mode)
+            for name, value in first_paint(path).items():
+                rows.setdefault(name, {})[mode] = value
+
+    print(f"{'measurement':<28}{'full parse':>14}{'summary index':>16}")
+    for name, values in rows.items():
+        print(f"{name:<28}{values['full parse']:>14.1f}{values['summary index']:>16.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Compare the memory of compact records against the plain JSON rows they replace.
+
+Builds a synthetic alumni roster, parses it from JSON as the data file would
+be, and measures the Python heap it occupies as lists and dicts and after
+``records.compact``. Run with::
+
+    python -m frontend.benchmarks.records
+"""
+import argparse
+import json
+import random
+import sys
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+
+from frontend.utils.orgs_data.records import compact
+
+POSITIONS = ["Member"] * 20 + ["President", "Secretary", "Treasurer", "Vice - Internal Chairperson"]
+STATUSES = ["Active", "Inactive"]
+
+def synthetic_org(members: int, officers: int, semesters: int, seed: int = 0) -> str:
+    """Return one organization with the given roster sizes, encoded as the data file stores it."""
+    rng = random.Random(seed)
+    first = date(2000, 1, 1)
+    org = {
+        "id": 1,
+        "members": [
+            [f"Member {i} {rng.choice('ABCDEFGHIJ')}. Surname{rng.randrange(5000)}", rng.choice(POSITIONS),
+             rng.choice(STATUSES), (first + timedelta(days=rng.randrange(9000))).isoformat()]
+            for i in range(members)
+        ],
+        "applicants": [[f"Applicant {i}", "Member"] for i in range(members // 20)],
+    }
+    listings = [
+        {"name": f"Officer {i}", "position": rng.choice(POSITIONS),
+         "card_image_path": f"frontend/assets/organization/officers/{i}.jpg",
+         "photo_path": f"frontend/assets/organization/officers/{i}.jpg", "start_date": "07/08/2025"}
+        for i in range(officers)
+    ]
+    org["officers"] = listings
+    org["officer_history"] = {f"{2000 + year}-{2001 + year}": [dict(officer) for officer in listings] for year in range(semesters)}
+    return json.dumps(org)
+
+def heap_size(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated by ``build``'s result once it returns."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the memory of compact member and officer records.")
+    parser.add_argument("--members", type=int, default=50000, help="members in the roster (default: %(default)s)")
+    parser.add_argument("--officers", type=int, default=10, help="officers per semester (default: %(default)s)")
+    parser.add_argument("--semesters", type=int, default=20, help="semesters of officer history (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    text = synthetic_org(args.members, args.officers, args.semesters)
+
+    def compacted() -> Dict:
+        org = json.loads(text)
+        compact(org)
+        return org
+
+    # Warm the shared string table so it is not counted against either side.
+    compacted()
+    plain, compact_size = heap_size(lambda: json.loads(text)), heap_size(compacted)
+    members = args.members + args.members // 20
+    print(f"{'':<18}{'bytes':>14}{'bytes/member':>14}")
+    print(f"{'json rows':<18}{plain:>14,}{plain / members:>14.1f}")
+    print(f"{'compact records':<18}{compact_size:>14,}{compact_size / members:>14.1f}")
+    print(f"{'reduction':<18}{plain / compact_size:>13.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Measure cold start of the organization windows up to their first painted frame.
+
+Every run starts a fresh interpreter, so module imports, the QApplication and
+the first stylesheet polish are paid each time the way a user pays them. Each
+run is timed with the startup tracer (``frontend.utils.startup_trace``). The
+window is opened with the details and members pages left to be built on first
+navigation, and again with every page built before it is shown, as the window
+did before its pages were made lazy. Run offscreen with::
+
+    QT_QPA_PLATFORM=offscreen python -m frontend.benchmarks.startup
+
+With ``--budget`` the lazy-page medians are checked against the budgets in
+``startup_budget.json`` and the exit status is 1 if any phase is over budget.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+VIEWS = {
+    "student": "frontend.views.default.Organizations.student_organization",
+    "officer": "frontend.views.default.Organizations.officer_organization",
+}
+MODES = ("lazy pages", "eager pages")
+PHASES = ("import", "QApplication", "setupUi", "first data load", "build window", "first paint", "startup")
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+BUDGET_PATH = os.path.join(os.path.dirname(__file__), "startup_budget.json")
+
+def start_once(view: str, eager: bool) -> Dict[str, float]:
+    """Open one window in this process and return the milliseconds spent in each startup phase."""
+    import importlib
+
+    from frontend.utils import startup_trace
+
+    tracer = startup_trace.start()
+    from PyQt6 import QtCore, QtWidgets
+    with startup_trace.span("QApplication"):
+        app = QtWidgets.QApplication(sys.argv[:1])
+    module = importlib.import_module(VIEWS[view])
+    with startup_trace.span("build window"):
+        window = module.MainWindow()
+        if eager:
+            window.pages.ensure_all()
+    window.resize(1280, 800)
+    startup_trace.finish_on_first_paint(window)
+    window.show()
+    deadline = time.monotonic() + 10
+    while not tracer.finished and time.monotonic() < deadline:
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50)
+    tracer.finish()
+    # Delete the window while the QApplication still exists.
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return tracer.phases_ms()
+
+def run_child(view: str, eager: bool) -> Dict[str, float]:
+    command = [sys.executable, "-m", "frontend.benchmarks.startup", "--child", "--view", view]
+    if eager:
+        command.append("--eager")
+    output = subprocess.run(command, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def over_budget(view: str, medians: Dict[str, float], path: str) -> List[str]:
+    """Return a line for every phase whose median exceeds its budget for ``view`` in ``path``."""
+    with open(path, 'r', encoding='utf-8') as file:
+        budgets: Dict[str, float] = json.load(file).get(view, {})
+    return [f"{phase}: {medians.get(phase, 0.0):.1f} ms > {limit} ms"
+            for phase, limit in budgets.items() if medians.get(phase, 0.0) > limit]
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold start of the organization windows.")
+    parser.add_argument("--view", choices=sorted(VIEWS), default="student", help="window to open (default: %(default)s)")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per mode (default: %(default)s)")
+    parser.add_argument("--budget", nargs="?", const=BUDGET_PATH, metavar="FILE",
+                        help="fail if a lazy-page median exceeds its budget (default file: startup_budget.json)")
+    parser.add_argument("--eager", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(start_once(args.view, args.eager)))
+        return 0
+
+    rows: Dict[str, Dict[str, float]] = {}
+    for mode in MODES:
+        runs = [run_child(args.view, mode == "eager pages") for _ in range(args.runs)]
+        for name in PHASES:
+            rows.setdefault(name, {})[mode] = statistics.median(run.get(name, 0.0) for run in runs)
+
+    print(f"{args.view} window, median of {args.runs} cold starts (ms)")
+    print(f"{'phase':<22}{'lazy pages':>14}{'eager pages':>14}")
+    for name, values in rows.items():
+        print(f"{name:<22}{values['lazy pages']:>14.1f}{values['eager pages']:>14.1f}")
+
+    if args.budget:
+        failures = over_budget(args.view, {name: values["lazy pages"] for name, values in rows.items()}, args.budget)
+        for failure in failures:
+            print(f"over budget: {failure}")
+        return 1 if failures else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
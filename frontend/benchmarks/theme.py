@@ -0,0 +1,149 @@
+"""Compare the application stylesheet against per-widget inline stylesheets.
+
+Measures the cost of building and polishing officer and event cards, and of
+repainting the organization details page, once with the theme installed on
+the QApplication and once with the equivalent inline ``setStyleSheet`` calls
+the widgets used to make. Repaints are timed in alternating rounds and the
+median round is reported; a single round swings by 20% or more. Run
+offscreen with::
+
+    QT_QPA_PLATFORM=offscreen python -m frontend.benchmarks.theme
+"""
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from PyQt6 import QtWidgets
+
+from frontend.utils import theme
+
+# The inline sheets each role replaced, keyed by role or object name.
+INLINE_STYLESHEETS: Dict[str, str] = {
+    "panel": "QFrame { background-color: white; border-radius: 10px; }",
+    "joined_container": "QFrame { background-color: white; border-radius: 15px; }",
+    "other_container": "QFrame { background-color: white; border-radius: 15px; }",
+    "divider": "QFrame { background-color: black; }",
+    "joined_org_scrollable": "QScrollArea { background-color: white; }",
+    "college_org_scrollable": "QScrollArea { background-color: white; }",
+    "officers_scroll_area": "QScrollArea { background-color: white; border: none; }",
+    "list_view": "QTableView { border: none; border-radius: 10px; background-color: white; }",
+    "empty-state": "font-size: 20px;",
+    "officer-card": "QFrame { background-color: #fff; border: 1px solid #ccc; border-radius: 10px; padding: 10px; }",
+    "event-card": (
+        "QFrame { background-color: #fff; border: 1px solid #ccc; border-radius: 10px; padding: 5px; }"
+        "QFrame#eventHeader { background-color: #084924; color: #fff; border-top-left-radius: 10px;"
+        " border-top-right-radius: 10px; padding: 5px; }"
+    ),
+    "event-title": "font-size: 16px; font-weight: bold;",
+    "event-content": "padding: 10px; font-size: 12px;",
+    "dialog": "QDialog { background-color: white; border: 1px solid #ccc; border-radius: 10px; padding: 10px; }",
+    "primary": "background-color: #084924; color: white; border-radius: 5px;",
+    "highlight": "background-color: #FFD700; color: black; border-radius: 5px;",
+    "highlight-outlined": "background-color: #FFD700; color: black; border: 1px solid #ccc; border-radius: 5px;",
+    "secondary": "background-color: white; border: 1px solid #ccc; border-radius: 5px;",
+    "success": "background-color: green; color: white; border-radius: 5px;",
+    "danger": "background-color: red; color: white; border-radius: 5px;",
+    "close": "background-color: transparent; border: none; color: gray;",
+}
+
+def use_inline_stylesheets(root: QtWidgets.QWidget) -> None:
+    """Give ``root`` and its children the inline sheets they had before the theme existed."""
+    for widget in [root] + root.findChildren(QtWidgets.QWidget):
+        stylesheet = INLINE_STYLESHEETS.get(widget.objectName()) or INLINE_STYLESHEETS.get(widget.property("role") or "")
+        if stylesheet:
+            widget.setStyleSheet(stylesheet)
+
+def set_mode(app: QtWidgets.QApplication, mode: str, root: Optional[QtWidgets.QWidget] = None) -> None:
+    """Switch between the installed theme and inline sheets, for ``root``'s widgets if given."""
+    app.setStyleSheet("")
+    if root is not None:
+        for widget in [root] + root.findChildren(QtWidgets.QWidget):
+            widget.setStyleSheet("")
+    if mode == "theme":
+        theme.install(app)
+    elif root is not None:
+        use_inline_stylesheets(root)
+    app.processEvents()
+
+def timed(action: Callable[[], None], repeat: int) -> float:
+    """Return the mean wall time of ``action`` in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+def bench_cards(app: QtWidgets.QApplication, mode: str, count: int) -> Dict[str, float]:
+    from frontend.utils.orgs_custom_widgets.cards import EventCard, OfficerCard
+
+    set_mode(app, mode)
+    host = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(host)
+    officer = {"name": "Benchmark Officer", "position": "Member", "card_image_path": "No Photo"}
+    event = {"name": "Benchmark Event", "date": "2025-01-01", "description": "Benchmark event description"}
+    results = {}
+    for name, card_class, data in (("officer card", OfficerCard, officer), ("event card", EventCard, event)):
+        cards: List[QtWidgets.QWidget] = []
+
+        def build() -> None:
+            card = card_class(data, host)
+            if mode == "inline":
+                use_inline_stylesheets(card)
+            layout.addWidget(card)
+            card.ensurePolished()
+            for child in card.findChildren(QtWidgets.QWidget):
+                child.ensurePolished()
+            cards.append(card)
+
+        results[f"{name} construction (ms/card)"] = timed(build, count)
+        for card in cards:
+            card.deleteLater()
+        app.processEvents()
+    host.deleteLater()
+    return results
+
+def bench_repaint(app: QtWidgets.QApplication, repeat: int, rounds: int) -> Dict[str, Dict[str, float]]:
+    """Repaint the same details page under both modes, alternating, and return each mode's median round."""
+    from frontend.views.default.Organizations.student_organization import MainWindow
+
+    window = MainWindow()
+    window.resize(1280, 800)
+    window.show()
+    organizations = window._load_data()
+    if organizations:
+        window.show_org_details(organizations[0])
+
+    samples: Dict[str, List[float]] = {"inline": [], "theme": []}
+    for _ in range(rounds):
+        for mode, times in samples.items():
+            set_mode(app, mode, window)
+            window.repaint()
+            times.append(timed(window.repaint, repeat))
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return {"details page repaint (ms)": {mode: statistics.median(times) for mode, times in samples.items()}}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the application stylesheet against inline stylesheets.")
+    parser.add_argument("--cards", type=int, default=200, help="cards built per measurement (default: %(default)s)")
+    parser.add_argument("--repaints", type=int, default=50, help="full-page repaints per round (default: %(default)s)")
+    parser.add_argument("--rounds", type=int, default=15, help="alternating repaint rounds per mode (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    rows: Dict[str, Dict[str, float]] = {}
+    for mode in ("inline", "theme"):
+        for name, value in bench_cards(app, mode, args.cards).items():
+            rows.setdefault(name, {})[mode] = value
+    rows.update(bench_repaint(app, args.repaints, args.rounds))
+
+    print(f"{'measurement':<36}{'inline':>10}{'theme':>10}{'speedup':>10}")
+    for name, values in rows.items():
+        speedup = values["inline"] / values["theme"] if values["theme"] else float("inf")
+        print(f"{name:<36}{values['inline']:>10.3f}{values['theme']:>10.3f}{speedup:>9.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
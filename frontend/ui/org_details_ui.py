@@ -0,0 +1,256 @@
+# Form implementation generated from reading ui file 'org_details.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+class Ui_OrgDetailsPage(object):
+    def setupUi(self, org_details):
+        org_details.setObjectName("org_details")
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout(org_details)
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.header_org_details = QtWidgets.QHBoxLayout()
+        self.header_org_details.setObjectName("header_org_details")
+        self.burger_btn__details = QtWidgets.QPushButton(parent=org_details)
+        self.burger_btn__details.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
+        self.burger_btn__details.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/organization/icons/burger_ic.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.burger_btn__details.setIcon(icon)
+        self.burger_btn__details.setIconSize(QtCore.QSize(40, 40))
+        self.burger_btn__details.setObjectName("burger_btn__details")
+        self.header_org_details.addWidget(self.burger_btn__details)
+        self.header_label_2 = QtWidgets.QLabel(parent=org_details)
+        font = QtGui.QFont()
+        font.setPointSize(30)
+        font.setKerning(True)
+        self.header_label_2.setFont(font)
+        self.header_label_2.setObjectName("header_label_2")
+        self.header_org_details.addWidget(self.header_label_2)
+        spacerItem = QtWidgets.QSpacerItem(332, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.header_org_details.addItem(spacerItem)
+        self.back_btn = QtWidgets.QPushButton(parent=org_details)
+        self.back_btn.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.back_btn.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/organization/icons/Back IC.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.back_btn.setIcon(icon1)
+        self.back_btn.setIconSize(QtCore.QSize(30, 30))
+        self.back_btn.setObjectName("back_btn")
+        self.header_org_details.addWidget(self.back_btn)
+        self.verticalLayout_15.addLayout(self.header_org_details)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.org_details_container = QtWidgets.QFrame(parent=org_details)
+        self.org_details_container.setMinimumSize(QtCore.QSize(250, 0))
+        self.org_details_container.setMaximumSize(QtCore.QSize(500, 16777215))
+        self.org_details_container.setProperty("role", "panel")
+        self.org_details_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.org_details_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.org_details_container.setObjectName("org_details_container")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.org_details_container)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.header = QtWidgets.QLabel(parent=self.org_details_container)
+        self.header.setObjectName("header")
+        self.verticalLayout_10.addWidget(self.header, 0, QtCore.Qt.AlignmentFlag.AlignTop)
+        self.line = QtWidgets.QFrame(parent=self.org_details_container)
+        self.line.setMaximumSize(QtCore.QSize(16777215, 2))
+        self.line.setProperty("role", "divider")
+        self.line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_10.addWidget(self.line, 0, QtCore.Qt.AlignmentFlag.AlignTop)
+        self.status_btn = QtWidgets.QPushButton(parent=self.org_details_container)
+        self.status_btn.setObjectName("status_btn")
+        self.verticalLayout_10.addWidget(self.status_btn, 0, QtCore.Qt.AlignmentFlag.AlignTop)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 60, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_10.addItem(spacerItem1)
+        self.logo = QtWidgets.QLabel(parent=self.org_details_container)
+        self.logo.setMinimumSize(QtCore.QSize(200, 200))
+        self.logo.setScaledContents(True)
+        self.logo.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.logo.setObjectName("logo")
+        self.verticalLayout_10.addWidget(self.logo, 0, QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 60, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_10.addItem(spacerItem2)
+        self.org_name = QtWidgets.QLabel(parent=self.org_details_container)
+        self.org_name.setObjectName("org_name")
+        self.verticalLayout_10.addWidget(self.org_name, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.line_2 = QtWidgets.QFrame(parent=self.org_details_container)
+        self.line_2.setMaximumSize(QtCore.QSize(16777215, 2))
+        self.line_2.setProperty("role", "divider")
+        self.line_2.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.verticalLayout_10.addWidget(self.line_2)
+        self.org_type = QtWidgets.QLabel(parent=self.org_details_container)
+        self.org_type.setObjectName("org_type")
+        self.verticalLayout_10.addWidget(self.org_type, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_10.addItem(spacerItem3)
+        self.derscription_container = QtWidgets.QFrame(parent=self.org_details_container)
+        self.derscription_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.derscription_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.derscription_container.setObjectName("derscription_container")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.derscription_container)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.brief_btn = QtWidgets.QPushButton(parent=self.derscription_container)
+        self.brief_btn.setObjectName("brief_btn")
+        self.verticalLayout_9.addWidget(self.brief_btn)
+        self.brief_label = QtWidgets.QLabel(parent=self.derscription_container)
+        self.brief_label.setObjectName("brief_label")
+        self.verticalLayout_9.addWidget(self.brief_label, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.obj_btn = QtWidgets.QPushButton(parent=self.derscription_container)
+        self.obj_btn.setObjectName("obj_btn")
+        self.verticalLayout_9.addWidget(self.obj_btn)
+        self.obj_label = QtWidgets.QLabel(parent=self.derscription_container)
+        self.obj_label.setObjectName("obj_label")
+        self.verticalLayout_9.addWidget(self.obj_label, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.branch_btn = QtWidgets.QPushButton(parent=self.derscription_container)
+        self.branch_btn.setObjectName("branch_btn")
+        self.verticalLayout_9.addWidget(self.branch_btn)
+        self.obj_label_2 = QtWidgets.QLabel(parent=self.derscription_container)
+        self.obj_label_2.setObjectName("obj_label_2")
+        self.verticalLayout_9.addWidget(self.obj_label_2, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.verticalLayout_10.addWidget(self.derscription_container)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_10.addItem(spacerItem4)
+        self.horizontalLayout_6.addWidget(self.org_details_container)
+        spacerItem5 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem5)
+        self.officers_frame = QtWidgets.QFrame(parent=org_details)
+        self.officers_frame.setMinimumSize(QtCore.QSize(500, 0))
+        self.officers_frame.setProperty("role", "panel")
+        self.officers_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.officers_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.officers_frame.setObjectName("officers_frame")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.officers_frame)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.header_2 = QtWidgets.QLabel(parent=self.officers_frame)
+        self.header_2.setObjectName("header_2")
+        self.horizontalLayout_3.addWidget(self.header_2)
+        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem6)
+        self.view_members_btn = QtWidgets.QPushButton(parent=self.officers_frame)
+        font = QtGui.QFont()
+        font.setUnderline(True)
+        self.view_members_btn.setFont(font)
+        self.view_members_btn.setObjectName("view_members_btn")
+        self.horizontalLayout_3.addWidget(self.view_members_btn)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_3)
+        self.line_3 = QtWidgets.QFrame(parent=self.officers_frame)
+        self.line_3.setMaximumSize(QtCore.QSize(16777215, 2))
+        self.line_3.setProperty("role", "divider")
+        self.line_3.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_12.addWidget(self.line_3, 0, QtCore.Qt.AlignmentFlag.AlignTop)
+        self.officers_scroll_area = QtWidgets.QScrollArea(parent=self.officers_frame)
+        self.officers_scroll_area.setWidgetResizable(True)
+        self.officers_scroll_area.setObjectName("officers_scroll_area")
+        self.scroll_area_contents = QtWidgets.QWidget()
+        self.scroll_area_contents.setGeometry(QtCore.QRect(0, 0, 478, 582))
+        self.scroll_area_contents.setObjectName("scroll_area_contents")
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.scroll_area_contents)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.officer_cards_grid = QtWidgets.QGridLayout()
+        self.officer_cards_grid.setObjectName("officer_cards_grid")
+        spacerItem7 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.officer_cards_grid.addItem(spacerItem7, 0, 1, 1, 1)
+        self.verticalLayout_11.addLayout(self.officer_cards_grid)
+        self.officers_scroll_area.setWidget(self.scroll_area_contents)
+        self.verticalLayout_12.addWidget(self.officers_scroll_area)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label = QtWidgets.QLabel(parent=self.officers_frame)
+        self.label.setObjectName("label")
+        self.horizontalLayout_4.addWidget(self.label)
+        spacerItem8 = QtWidgets.QSpacerItem(273, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem8)
+        self.officer_history_dp = QtWidgets.QComboBox(parent=self.officers_frame)
+        self.officer_history_dp.setObjectName("officer_history_dp")
+        self.officer_history_dp.addItem("")
+        self.horizontalLayout_4.addWidget(self.officer_history_dp)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_4)
+        self.horizontalLayout_6.addWidget(self.officers_frame)
+        spacerItem9 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem9)
+        self.events_container = QtWidgets.QFrame(parent=org_details)
+        self.events_container.setMinimumSize(QtCore.QSize(250, 0))
+        self.events_container.setMaximumSize(QtCore.QSize(400, 16777215))
+        self.events_container.setProperty("role", "panel")
+        self.events_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.events_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.events_container.setObjectName("events_container")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.events_container)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.header_3 = QtWidgets.QLabel(parent=self.events_container)
+        self.header_3.setObjectName("header_3")
+        self.horizontalLayout_5.addWidget(self.header_3)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem10)
+        self.calendar_btn = QtWidgets.QPushButton(parent=self.events_container)
+        font = QtGui.QFont()
+        font.setUnderline(False)
+        self.calendar_btn.setFont(font)
+        self.calendar_btn.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/icons/organization/icons/calendar.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.calendar_btn.setIcon(icon2)
+        self.calendar_btn.setIconSize(QtCore.QSize(30, 30))
+        self.calendar_btn.setObjectName("calendar_btn")
+        self.horizontalLayout_5.addWidget(self.calendar_btn)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_5)
+        self.line_4 = QtWidgets.QFrame(parent=self.events_container)
+        self.line_4.setMaximumSize(QtCore.QSize(16777215, 2))
+        self.line_4.setProperty("role", "divider")
+        self.line_4.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line_4.setObjectName("line_4")
+        self.verticalLayout_13.addWidget(self.line_4)
+        self.scroll_area_events = QtWidgets.QScrollArea(parent=self.events_container)
+        self.scroll_area_events.setWidgetResizable(True)
+        self.scroll_area_events.setObjectName("scroll_area_events")
+        self.events_container_2 = QtWidgets.QWidget()
+        self.events_container_2.setGeometry(QtCore.QRect(0, 0, 336, 602))
+        self.events_container_2.setObjectName("events_container_2")
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.events_container_2)
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.scroll_area_events.setWidget(self.events_container_2)
+        self.verticalLayout_13.addWidget(self.scroll_area_events)
+        self.horizontalLayout_6.addWidget(self.events_container)
+        self.verticalLayout_15.addLayout(self.horizontalLayout_6)
+
+        self.retranslateUi(org_details)
+        QtCore.QMetaObject.connectSlotsByName(org_details)
+
+    def retranslateUi(self, org_details):
+        _translate = QtCore.QCoreApplication.translate
+        self.header_label_2.setText(_translate("OrgDetailsPage", "Organization"))
+        self.back_btn.setShortcut(_translate("OrgDetailsPage", "Esc"))
+        self.header.setText(_translate("OrgDetailsPage", "Organization Details"))
+        self.status_btn.setText(_translate("OrgDetailsPage", "Active"))
+        self.logo.setText(_translate("OrgDetailsPage", "Logo"))
+        self.org_name.setText(_translate("OrgDetailsPage", "OrgName"))
+        self.org_type.setText(_translate("OrgDetailsPage", "OrgType"))
+        self.brief_btn.setText(_translate("OrgDetailsPage", "Brief Overview"))
+        self.brief_label.setText(_translate("OrgDetailsPage", "BriefContent"))
+        self.obj_btn.setText(_translate("OrgDetailsPage", "Objectives"))
+        self.obj_label.setText(_translate("OrgDetailsPage", "ObjectivesContent"))
+        self.branch_btn.setText(_translate("OrgDetailsPage", "Branches"))
+        self.obj_label_2.setText(_translate("OrgDetailsPage", "BranchList"))
+        self.header_2.setText(_translate("OrgDetailsPage", "Organization Officers"))
+        self.view_members_btn.setText(_translate("OrgDetailsPage", "View Members"))
+        self.label.setText(_translate("OrgDetailsPage", "Semester"))
+        self.officer_history_dp.setItemText(0, _translate("OrgDetailsPage", "Officer History"))
+        self.header_3.setText(_translate("OrgDetailsPage", "Upcoming Events"))
@@ -1,13 +1,12 @@
 # Form implementation generated from reading ui file 'org_main.ui'
 #
-# Created by: PyQt6 UI code generator 6.4.2
+# Created by: PyQt6 UI code generator 6.11.0
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic6 is
 # run again.  Do not edit this file unless you know what you are doing.
 
 
 from PyQt6 import QtCore, QtGui, QtWidgets
-from . import resources_rc
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -85,10 +84,7 @@ class Ui_MainWindow(object):
         self.joined_container.setSizePolicy(sizePolicy)
         self.joined_container.setMinimumSize(QtCore.QSize(0, 400))
         self.joined_container.setMaximumSize(QtCore.QSize(16777215, 16777215))
-        self.joined_container.setStyleSheet("QFrame {\n"
-"    background-color: white;\n"
-"    border-radius: 15px;\n"
-"}")
+        self.joined_container.setProperty("role", "panel")
         self.joined_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.joined_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
         self.joined_container.setObjectName("joined_container")
@@ -104,18 +100,13 @@ class Ui_MainWindow(object):
         self.verticalLayout_7.addWidget(self.joined_label, 0, QtCore.Qt.AlignmentFlag.AlignTop)
         self.hr_line = QtWidgets.QFrame(parent=self.joined_container)
         self.hr_line.setMaximumSize(QtCore.QSize(16777215, 2))
-        self.hr_line.setStyleSheet("QFrame {\n"
-"    background-color: black;\n"
-"}")
+        self.hr_line.setProperty("role", "divider")
         self.hr_line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
         self.hr_line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
         self.hr_line.setObjectName("hr_line")
         self.verticalLayout_7.addWidget(self.hr_line, 0, QtCore.Qt.AlignmentFlag.AlignTop)
         self.verticalLayout_3.addLayout(self.verticalLayout_7)
         self.joined_org_scrollable = QtWidgets.QScrollArea(parent=self.joined_container)
-        self.joined_org_scrollable.setStyleSheet("QScrollArea {\n"
-"    background-color: white;\n"
-"}")
         self.joined_org_scrollable.setWidgetResizable(True)
         self.joined_org_scrollable.setObjectName("joined_org_scrollable")
         self.joined_org_scroll = QtWidgets.QWidget()
@@ -147,10 +138,7 @@ class Ui_MainWindow(object):
         self.other_container.setSizePolicy(sizePolicy)
         self.other_container.setMinimumSize(QtCore.QSize(0, 500))
         self.other_container.setMaximumSize(QtCore.QSize(16777215, 16777215))
-        self.other_container.setStyleSheet("QFrame {\n"
-"    background-color: white;\n"
-"    border-radius: 15px;\n"
-"}")
+        self.other_container.setProperty("role", "panel")
         self.other_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.other_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
         self.other_container.setObjectName("other_container")
@@ -165,18 +153,13 @@ class Ui_MainWindow(object):
         self.verticalLayout_5.addWidget(self.college_label, 0, QtCore.Qt.AlignmentFlag.AlignTop)
         self.hr_line_2 = QtWidgets.QFrame(parent=self.other_container)
         self.hr_line_2.setMaximumSize(QtCore.QSize(16777215, 2))
-        self.hr_line_2.setStyleSheet("QFrame {\n"
-"    background-color: black;\n"
-"}")
+        self.hr_line_2.setProperty("role", "divider")
         self.hr_line_2.setFrameShape(QtWidgets.QFrame.Shape.HLine)
         self.hr_line_2.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
         self.hr_line_2.setObjectName("hr_line_2")
         self.verticalLayout_5.addWidget(self.hr_line_2, 0, QtCore.Qt.AlignmentFlag.AlignTop)
         self.verticalLayout_6.addLayout(self.verticalLayout_5)
         self.college_org_scrollable = QtWidgets.QScrollArea(parent=self.other_container)
-        self.college_org_scrollable.setStyleSheet("QScrollArea {\n"
-"    background-color: white;\n"
-"}")
         self.college_org_scrollable.setWidgetResizable(True)
         self.college_org_scrollable.setObjectName("college_org_scrollable")
         self.college_org_scroll = QtWidgets.QWidget()
@@ -201,322 +184,9 @@ class Ui_MainWindow(object):
         self.stacked_widget.addWidget(self.landing_page)
         self.org_details = QtWidgets.QWidget()
         self.org_details.setObjectName("org_details")
-        self.verticalLayout_15 = QtWidgets.QVBoxLayout(self.org_details)
-        self.verticalLayout_15.setObjectName("verticalLayout_15")
-        self.header_org_details = QtWidgets.QHBoxLayout()
-        self.header_org_details.setObjectName("header_org_details")
-        self.burger_btn__details = QtWidgets.QPushButton(parent=self.org_details)
-        self.burger_btn__details.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
-        self.burger_btn__details.setText("")
-        self.burger_btn__details.setIcon(icon)
-        self.burger_btn__details.setIconSize(QtCore.QSize(40, 40))
-        self.burger_btn__details.setObjectName("burger_btn__details")
-        self.header_org_details.addWidget(self.burger_btn__details)
-        self.header_label_2 = QtWidgets.QLabel(parent=self.org_details)
-        font = QtGui.QFont()
-        font.setPointSize(30)
-        font.setKerning(True)
-        self.header_label_2.setFont(font)
-        self.header_label_2.setObjectName("header_label_2")
-        self.header_org_details.addWidget(self.header_label_2)
-        spacerItem2 = QtWidgets.QSpacerItem(332, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.header_org_details.addItem(spacerItem2)
-        self.back_btn = QtWidgets.QPushButton(parent=self.org_details)
-        self.back_btn.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
-        self.back_btn.setText("")
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap(":/icons/organization/icons/Back IC.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        self.back_btn.setIcon(icon2)
-        self.back_btn.setIconSize(QtCore.QSize(30, 30))
-        self.back_btn.setObjectName("back_btn")
-        self.header_org_details.addWidget(self.back_btn)
-        self.verticalLayout_15.addLayout(self.header_org_details)
-        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
-        self.org_details_container = QtWidgets.QFrame(parent=self.org_details)
-        self.org_details_container.setMinimumSize(QtCore.QSize(250, 0))
-        self.org_details_container.setMaximumSize(QtCore.QSize(500, 16777215))
-        self.org_details_container.setStyleSheet("QFrame {\n"
-"    background-color: white;\n"
-"    border-radius: 10px;\n"
-"}")
-        self.org_details_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.org_details_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.org_details_container.setObjectName("org_details_container")
-        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.org_details_container)
-        self.verticalLayout_10.setObjectName("verticalLayout_10")
-        self.header = QtWidgets.QLabel(parent=self.org_details_container)
-        self.header.setObjectName("header")
-        self.verticalLayout_10.addWidget(self.header, 0, QtCore.Qt.AlignmentFlag.AlignTop)
-        self.line = QtWidgets.QFrame(parent=self.org_details_container)
-        self.line.setMaximumSize(QtCore.QSize(16777215, 2))
-        self.line.setStyleSheet("QFrame {\n"
-"    background-color: black;\n"
-"}")
-        self.line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line.setObjectName("line")
-        self.verticalLayout_10.addWidget(self.line, 0, QtCore.Qt.AlignmentFlag.AlignTop)
-        self.status_btn = QtWidgets.QPushButton(parent=self.org_details_container)
-        self.status_btn.setObjectName("status_btn")
-        self.verticalLayout_10.addWidget(self.status_btn, 0, QtCore.Qt.AlignmentFlag.AlignTop)
-        spacerItem3 = QtWidgets.QSpacerItem(20, 60, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_10.addItem(spacerItem3)
-        self.logo = QtWidgets.QLabel(parent=self.org_details_container)
-        self.logo.setMinimumSize(QtCore.QSize(200, 200))
-        self.logo.setScaledContents(True)
-        self.logo.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
-        self.logo.setObjectName("logo")
-        self.verticalLayout_10.addWidget(self.logo, 0, QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignVCenter)
-        spacerItem4 = QtWidgets.QSpacerItem(20, 60, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_10.addItem(spacerItem4)
-        self.org_name = QtWidgets.QLabel(parent=self.org_details_container)
-        self.org_name.setObjectName("org_name")
-        self.verticalLayout_10.addWidget(self.org_name, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
-        self.line_2 = QtWidgets.QFrame(parent=self.org_details_container)
-        self.line_2.setMaximumSize(QtCore.QSize(16777215, 2))
-        self.line_2.setStyleSheet("QFrame {\n"
-"    background-color: black;\n"
-"}")
-        self.line_2.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line_2.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line_2.setObjectName("line_2")
-        self.verticalLayout_10.addWidget(self.line_2)
-        self.org_type = QtWidgets.QLabel(parent=self.org_details_container)
-        self.org_type.setObjectName("org_type")
-        self.verticalLayout_10.addWidget(self.org_type, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
-        spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_10.addItem(spacerItem5)
-        self.derscription_container = QtWidgets.QFrame(parent=self.org_details_container)
-        self.derscription_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.derscription_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.derscription_container.setObjectName("derscription_container")
-        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.derscription_container)
-        self.verticalLayout_9.setObjectName("verticalLayout_9")
-        self.brief_btn = QtWidgets.QPushButton(parent=self.derscription_container)
-        self.brief_btn.setObjectName("brief_btn")
-        self.verticalLayout_9.addWidget(self.brief_btn)
-        self.brief_label = QtWidgets.QLabel(parent=self.derscription_container)
-        self.brief_label.setObjectName("brief_label")
-        self.verticalLayout_9.addWidget(self.brief_label, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
-        self.obj_btn = QtWidgets.QPushButton(parent=self.derscription_container)
-        self.obj_btn.setObjectName("obj_btn")
-        self.verticalLayout_9.addWidget(self.obj_btn)
-        self.obj_label = QtWidgets.QLabel(parent=self.derscription_container)
-        self.obj_label.setObjectName("obj_label")
-        self.verticalLayout_9.addWidget(self.obj_label, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
-        self.branch_btn = QtWidgets.QPushButton(parent=self.derscription_container)
-        self.branch_btn.setObjectName("branch_btn")
-        self.verticalLayout_9.addWidget(self.branch_btn)
-        self.obj_label_2 = QtWidgets.QLabel(parent=self.derscription_container)
-        self.obj_label_2.setObjectName("obj_label_2")
-        self.verticalLayout_9.addWidget(self.obj_label_2, 0, QtCore.Qt.AlignmentFlag.AlignHCenter)
-        self.verticalLayout_10.addWidget(self.derscription_container)
-        spacerItem6 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_10.addItem(spacerItem6)
-        self.horizontalLayout_6.addWidget(self.org_details_container)
-        spacerItem7 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_6.addItem(spacerItem7)
-        self.officers_frame = QtWidgets.QFrame(parent=self.org_details)
-        self.officers_frame.setMinimumSize(QtCore.QSize(500, 0))
-        self.officers_frame.setStyleSheet("QFrame {\n"
-"    background-color: white;\n"
-"    border-radius: 10px;\n"
-"}")
-        self.officers_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.officers_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.officers_frame.setObjectName("officers_frame")
-        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.officers_frame)
-        self.verticalLayout_12.setObjectName("verticalLayout_12")
-        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_3.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
-        self.header_2 = QtWidgets.QLabel(parent=self.officers_frame)
-        self.header_2.setObjectName("header_2")
-        self.horizontalLayout_3.addWidget(self.header_2)
-        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_3.addItem(spacerItem8)
-        self.view_members_btn = QtWidgets.QPushButton(parent=self.officers_frame)
-        font = QtGui.QFont()
-        font.setUnderline(True)
-        self.view_members_btn.setFont(font)
-        self.view_members_btn.setObjectName("view_members_btn")
-        self.horizontalLayout_3.addWidget(self.view_members_btn)
-        self.verticalLayout_12.addLayout(self.horizontalLayout_3)
-        self.line_3 = QtWidgets.QFrame(parent=self.officers_frame)
-        self.line_3.setMaximumSize(QtCore.QSize(16777215, 2))
-        self.line_3.setStyleSheet("QFrame {\n"
-"    background-color: black;\n"
-"}")
-        self.line_3.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line_3.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line_3.setObjectName("line_3")
-        self.verticalLayout_12.addWidget(self.line_3, 0, QtCore.Qt.AlignmentFlag.AlignTop)
-        self.officers_scroll_area = QtWidgets.QScrollArea(parent=self.officers_frame)
-        self.officers_scroll_area.setStyleSheet("QScrollArea {\n"
-"    background-color: white;\n"
-"    border: none;\n"
-"}")
-        self.officers_scroll_area.setWidgetResizable(True)
-        self.officers_scroll_area.setObjectName("officers_scroll_area")
-        self.scroll_area_contents = QtWidgets.QWidget()
-        self.scroll_area_contents.setGeometry(QtCore.QRect(0, 0, 478, 582))
-        self.scroll_area_contents.setObjectName("scroll_area_contents")
-        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.scroll_area_contents)
-        self.verticalLayout_11.setObjectName("verticalLayout_11")
-        self.officer_cards_grid = QtWidgets.QGridLayout()
-        self.officer_cards_grid.setObjectName("officer_cards_grid")
-        spacerItem9 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.officer_cards_grid.addItem(spacerItem9, 0, 1, 1, 1)
-        self.verticalLayout_11.addLayout(self.officer_cards_grid)
-        self.officers_scroll_area.setWidget(self.scroll_area_contents)
-        self.verticalLayout_12.addWidget(self.officers_scroll_area)
-        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
-        self.label = QtWidgets.QLabel(parent=self.officers_frame)
-        self.label.setObjectName("label")
-        self.horizontalLayout_4.addWidget(self.label)
-        spacerItem10 = QtWidgets.QSpacerItem(273, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_4.addItem(spacerItem10)
-        self.officer_history_dp = QtWidgets.QComboBox(parent=self.officers_frame)
-        self.officer_history_dp.setObjectName("officer_history_dp")
-        self.officer_history_dp.addItem("")
-        self.horizontalLayout_4.addWidget(self.officer_history_dp)
-        self.verticalLayout_12.addLayout(self.horizontalLayout_4)
-        self.horizontalLayout_6.addWidget(self.officers_frame)
-        spacerItem11 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_6.addItem(spacerItem11)
-        self.events_container = QtWidgets.QFrame(parent=self.org_details)
-        self.events_container.setMinimumSize(QtCore.QSize(250, 0))
-        self.events_container.setMaximumSize(QtCore.QSize(400, 16777215))
-        self.events_container.setStyleSheet("QFrame {\n"
-"    background-color: white;\n"
-"    border-radius: 10px;\n"
-"}")
-        self.events_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.events_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.events_container.setObjectName("events_container")
-        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.events_container)
-        self.verticalLayout_13.setObjectName("verticalLayout_13")
-        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
-        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
-        self.header_3 = QtWidgets.QLabel(parent=self.events_container)
-        self.header_3.setObjectName("header_3")
-        self.horizontalLayout_5.addWidget(self.header_3)
-        spacerItem12 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.horizontalLayout_5.addItem(spacerItem12)
-        self.calendar_btn = QtWidgets.QPushButton(parent=self.events_container)
-        font = QtGui.QFont()
-        font.setUnderline(False)
-        self.calendar_btn.setFont(font)
-        self.calendar_btn.setText("")
-        icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap(":/icons/organization/icons/calendar.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
-        self.calendar_btn.setIcon(icon3)
-        self.calendar_btn.setIconSize(QtCore.QSize(30, 30))
-        self.calendar_btn.setObjectName("calendar_btn")
-        self.horizontalLayout_5.addWidget(self.calendar_btn)
-        self.verticalLayout_13.addLayout(self.horizontalLayout_5)
-        self.line_4 = QtWidgets.QFrame(parent=self.events_container)
-        self.line_4.setMaximumSize(QtCore.QSize(16777215, 2))
-        self.line_4.setStyleSheet("QFrame {\n"
-"    background-color: black;\n"
-"}")
-        self.line_4.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line_4.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line_4.setObjectName("line_4")
-        self.verticalLayout_13.addWidget(self.line_4)
-        self.scroll_area_events = QtWidgets.QScrollArea(parent=self.events_container)
-        self.scroll_area_events.setWidgetResizable(True)
-        self.scroll_area_events.setObjectName("scroll_area_events")
-        self.events_container_2 = QtWidgets.QWidget()
-        self.events_container_2.setGeometry(QtCore.QRect(0, 0, 336, 602))
-        self.events_container_2.setObjectName("events_container_2")
-        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.events_container_2)
-        self.verticalLayout_14.setObjectName("verticalLayout_14")
-        self.scroll_area_events.setWidget(self.events_container_2)
-        self.verticalLayout_13.addWidget(self.scroll_area_events)
-        self.horizontalLayout_6.addWidget(self.events_container)
-        self.verticalLayout_15.addLayout(self.horizontalLayout_6)
         self.stacked_widget.addWidget(self.org_details)
         self.view_members = QtWidgets.QWidget()
         self.view_members.setObjectName("view_members")
-        self.verticalLayout_18 = QtWidgets.QVBoxLayout(self.view_members)
-        self.verticalLayout_18.setObjectName("verticalLayout_18")
-        self.members_header = QtWidgets.QHBoxLayout()
-        self.members_header.setObjectName("members_header")
-        self.burger_btn_2 = QtWidgets.QPushButton(parent=self.view_members)
-        self.burger_btn_2.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
-        self.burger_btn_2.setText("")
-        self.burger_btn_2.setIcon(icon)
-        self.burger_btn_2.setIconSize(QtCore.QSize(40, 40))
-        self.burger_btn_2.setObjectName("burger_btn_2")
-        self.members_header.addWidget(self.burger_btn_2)
-        self.header_label_3 = QtWidgets.QLabel(parent=self.view_members)
-        font = QtGui.QFont()
-        font.setPointSize(30)
-        font.setKerning(True)
-        self.header_label_3.setFont(font)
-        self.header_label_3.setObjectName("header_label_3")
-        self.members_header.addWidget(self.header_label_3)
-        spacerItem13 = QtWidgets.QSpacerItem(332, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.members_header.addItem(spacerItem13)
-        self.search_container = QtWidgets.QFrame(parent=self.view_members)
-        self.search_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.search_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.search_container.setObjectName("search_container")
-        self.horizontalLayout_9 = QtWidgets.QHBoxLayout(self.search_container)
-        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
-        self.search_line_3 = QtWidgets.QLineEdit(parent=self.search_container)
-        self.search_line_3.setObjectName("search_line_3")
-        self.horizontalLayout_9.addWidget(self.search_line_3)
-        self.search_btn_3 = QtWidgets.QToolButton(parent=self.search_container)
-        self.search_btn_3.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
-        self.search_btn_3.setIcon(icon1)
-        self.search_btn_3.setIconSize(QtCore.QSize(30, 30))
-        self.search_btn_3.setObjectName("search_btn_3")
-        self.horizontalLayout_9.addWidget(self.search_btn_3)
-        self.members_header.addWidget(self.search_container)
-        self.back_btn_member = QtWidgets.QPushButton(parent=self.view_members)
-        self.back_btn_member.setText("")
-        self.back_btn_member.setIcon(icon2)
-        self.back_btn_member.setIconSize(QtCore.QSize(30, 30))
-        self.back_btn_member.setObjectName("back_btn_member")
-        self.members_header.addWidget(self.back_btn_member)
-        self.verticalLayout_18.addLayout(self.members_header)
-        self.list_container = QtWidgets.QFrame(parent=self.view_members)
-        self.list_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.list_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.list_container.setObjectName("list_container")
-        self.verticalLayout_17 = QtWidgets.QVBoxLayout(self.list_container)
-        self.verticalLayout_17.setObjectName("verticalLayout_17")
-        self.header_4 = QtWidgets.QWidget(parent=self.list_container)
-        self.header_4.setObjectName("header_4")
-        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.header_4)
-        self.verticalLayout_16.setObjectName("verticalLayout_16")
-        self.label_2 = QtWidgets.QLabel(parent=self.header_4)
-        self.label_2.setObjectName("label_2")
-        self.verticalLayout_16.addWidget(self.label_2)
-        self.line_5 = QtWidgets.QFrame(parent=self.header_4)
-        self.line_5.setMaximumSize(QtCore.QSize(16777215, 2))
-        self.line_5.setStyleSheet("Line {\n"
-"    background-color: black;\n"
-"}")
-        self.line_5.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        self.line_5.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        self.line_5.setObjectName("line_5")
-        self.verticalLayout_16.addWidget(self.line_5)
-        self.verticalLayout_17.addWidget(self.header_4)
-        self.list_view = QtWidgets.QTableView(parent=self.list_container)
-        self.list_view.setStyleSheet("QTableView {\n"
-"    border: none;\n"
-"    border-radius: 10px;\n"
-"    background-color: white;\n"
-"}")
-        self.list_view.setObjectName("list_view")
-        self.verticalLayout_17.addWidget(self.list_view)
-        self.verticalLayout_18.addWidget(self.list_container)
         self.stacked_widget.addWidget(self.view_members)
         self.verticalLayout.addWidget(self.stacked_widget)
         MainWindow.setCentralWidget(self.centralwidget)
@@ -538,26 +208,3 @@ class Ui_MainWindow(object):
         self.search_btn.setShortcut(_translate("MainWindow", "Return, Enter"))
         self.joined_label.setText(_translate("MainWindow", "Joined Organization(s)"))
         self.college_label.setText(_translate("MainWindow", "College Organization(s)"))
-        self.header_label_2.setText(_translate("MainWindow", "Organization"))
-        self.back_btn.setShortcut(_translate("MainWindow", "Esc"))
-        self.header.setText(_translate("MainWindow", "Organization Details"))
-        self.status_btn.setText(_translate("MainWindow", "Active"))
-        self.logo.setText(_translate("MainWindow", "Logo"))
-        self.org_name.setText(_translate("MainWindow", "OrgName"))
-        self.org_type.setText(_translate("MainWindow", "OrgType"))
-        self.brief_btn.setText(_translate("MainWindow", "Brief Overview"))
-        self.brief_label.setText(_translate("MainWindow", "BriefContent"))
-        self.obj_btn.setText(_translate("MainWindow", "Objectives"))
-        self.obj_label.setText(_translate("MainWindow", "ObjectivesContent"))
-        self.branch_btn.setText(_translate("MainWindow", "Branches"))
-        self.obj_label_2.setText(_translate("MainWindow", "BranchList"))
-        self.header_2.setText(_translate("MainWindow", "Organization Officers"))
-        self.view_members_btn.setText(_translate("MainWindow", "View Members"))
-        self.label.setText(_translate("MainWindow", "Semester"))
-        self.officer_history_dp.setItemText(0, _translate("MainWindow", "Officer History"))
-        self.header_3.setText(_translate("MainWindow", "Upcoming Events"))
-        self.header_label_3.setText(_translate("MainWindow", "Organization"))
-        self.search_btn_3.setText(_translate("MainWindow", "..."))
-        self.search_btn_3.setShortcut(_translate("MainWindow", "Return, Enter"))
-        self.back_btn_member.setShortcut(_translate("MainWindow", "Esc"))
-        self.label_2.setText(_translate("MainWindow", "Member List"))
\ No newline at end of file
@@ -0,0 +1,97 @@
+# Form implementation generated from reading ui file 'org_members.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+class Ui_OrgMembersPage(object):
+    def setupUi(self, view_members):
+        view_members.setObjectName("view_members")
+        self.verticalLayout_18 = QtWidgets.QVBoxLayout(view_members)
+        self.verticalLayout_18.setObjectName("verticalLayout_18")
+        self.members_header = QtWidgets.QHBoxLayout()
+        self.members_header.setObjectName("members_header")
+        self.burger_btn_2 = QtWidgets.QPushButton(parent=view_members)
+        self.burger_btn_2.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor))
+        self.burger_btn_2.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/organization/icons/burger_ic.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.burger_btn_2.setIcon(icon)
+        self.burger_btn_2.setIconSize(QtCore.QSize(40, 40))
+        self.burger_btn_2.setObjectName("burger_btn_2")
+        self.members_header.addWidget(self.burger_btn_2)
+        self.header_label_3 = QtWidgets.QLabel(parent=view_members)
+        font = QtGui.QFont()
+        font.setPointSize(30)
+        font.setKerning(True)
+        self.header_label_3.setFont(font)
+        self.header_label_3.setObjectName("header_label_3")
+        self.members_header.addWidget(self.header_label_3)
+        spacerItem = QtWidgets.QSpacerItem(332, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.members_header.addItem(spacerItem)
+        self.search_container = QtWidgets.QFrame(parent=view_members)
+        self.search_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.search_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.search_container.setObjectName("search_container")
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout(self.search_container)
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.search_line_3 = QtWidgets.QLineEdit(parent=self.search_container)
+        self.search_line_3.setObjectName("search_line_3")
+        self.horizontalLayout_9.addWidget(self.search_line_3)
+        self.search_btn_3 = QtWidgets.QToolButton(parent=self.search_container)
+        self.search_btn_3.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/organization/icons/search_ic.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.search_btn_3.setIcon(icon1)
+        self.search_btn_3.setIconSize(QtCore.QSize(30, 30))
+        self.search_btn_3.setObjectName("search_btn_3")
+        self.horizontalLayout_9.addWidget(self.search_btn_3)
+        self.members_header.addWidget(self.search_container)
+        self.back_btn_member = QtWidgets.QPushButton(parent=view_members)
+        self.back_btn_member.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/icons/organization/icons/Back IC.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.back_btn_member.setIcon(icon2)
+        self.back_btn_member.setIconSize(QtCore.QSize(30, 30))
+        self.back_btn_member.setObjectName("back_btn_member")
+        self.members_header.addWidget(self.back_btn_member)
+        self.verticalLayout_18.addLayout(self.members_header)
+        self.list_container = QtWidgets.QFrame(parent=view_members)
+        self.list_container.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.list_container.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.list_container.setObjectName("list_container")
+        self.verticalLayout_17 = QtWidgets.QVBoxLayout(self.list_container)
+        self.verticalLayout_17.setObjectName("verticalLayout_17")
+        self.header_4 = QtWidgets.QWidget(parent=self.list_container)
+        self.header_4.setObjectName("header_4")
+        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.header_4)
+        self.verticalLayout_16.setObjectName("verticalLayout_16")
+        self.label_2 = QtWidgets.QLabel(parent=self.header_4)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_16.addWidget(self.label_2)
+        self.line_5 = QtWidgets.QFrame(parent=self.header_4)
+        self.line_5.setMaximumSize(QtCore.QSize(16777215, 2))
+        self.line_5.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.line_5.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.line_5.setObjectName("line_5")
+        self.verticalLayout_16.addWidget(self.line_5)
+        self.verticalLayout_17.addWidget(self.header_4)
+        self.list_view = QtWidgets.QTableView(parent=self.list_container)
+        self.list_view.setObjectName("list_view")
+        self.verticalLayout_17.addWidget(self.list_view)
+        self.verticalLayout_18.addWidget(self.list_container)
+
+        self.retranslateUi(view_members)
+        QtCore.QMetaObject.connectSlotsByName(view_members)
+
+    def retranslateUi(self, view_members):
+        _translate = QtCore.QCoreApplication.translate
+        self.header_label_3.setText(_translate("OrgMembersPage", "Organization"))
+        self.search_btn_3.setText(_translate("OrgMembersPage", "..."))
+        self.search_btn_3.setShortcut(_translate("OrgMembersPage", "Return, Enter"))
+        self.back_btn_member.setShortcut(_translate("OrgMembersPage", "Esc"))
+        self.label_2.setText(_translate("OrgMembersPage", "Member List"))
@@ -0,0 +1,284 @@
+"""Compiled resource bundle for the Organizations images.
+
+The build step packs every image under ``frontend/assets/organization`` into
+``org_assets.rcc``, a binary Qt resource file that is zlib-compressed entry
+by entry. It also packs downscaled copies at the sizes the views display, and
+every entry of ``org_assets.qrc`` at its usual ``:/icons/...`` path. Build it
+with::
+
+    python -m frontend.utils.asset_bundle
+
+``register`` maps the bundle into memory at startup. After that, ``resolve``
+turns data-file paths such as ``frontend/assets/organization/sample_orgs/x.jpg``
+into ``:/organization/sample_orgs/x.jpg``, and looking an image up no longer
+touches the filesystem. Without a bundle, paths resolve to files on disk as
+before.
+
+The file is written by this module rather than by Qt's ``rcc`` tool because
+PyQt6 does not ship ``rcc``. The layout follows format version 1 of Qt's
+resource compiler, and the build maps the file it wrote and reads every
+entry back through Qt before keeping it.
+"""
+import argparse
+import os
+import struct
+import sys
+import xml.etree.ElementTree as ElementTree
+import zlib
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from PyQt6 import QtCore, QtGui
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+ASSETS_DIR = os.path.join(BASE_DIR, "frontend", "assets")
+QRC_PATH = os.path.join(ASSETS_DIR, "org_assets.qrc")
+BUNDLE_PATH = os.path.join(ASSETS_DIR, "org_assets.rcc")
+PACKED_DIRS = ("organization/icons", "organization/sample_orgs", "organization/sample_officers")
+# Directories whose images are shown at card and avatar sizes, and get pre-scaled copies.
+SCALED_DIRS = ("organization/sample_orgs", "organization/sample_officers")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+SCALED_PREFIX = "scaled"
+ASSETS_MARKER = "frontend/assets/"
+
+# rcc's defaults: keep an entry compressed only if that saves at least 30%.
+COMPRESSION_LEVEL = 9
+COMPRESSION_THRESHOLD = 70
+
+_registered: Optional[str] = None
+
+def register(path: str = BUNDLE_PATH) -> bool:
+    """Map the bundle into the Qt resource system once; return False if there is no bundle to map."""
+    global _registered
+    if _registered == path:
+        return True
+    if not os.path.exists(path):
+        return False
+    if not QtCore.QResource.registerResource(path):
+        print(f"Error loading resource bundle {path}")
+        return False
+    _registered = path
+    resolve.cache_clear()
+    return True
+
+def resource_path(path: str) -> Optional[str]:
+    """Return the ``:/`` path an asset file would have in the bundle, or None if it is not an asset.
+
+    Absolute paths map too, including ones written on another checkout of the
+    project, as long as they point into a ``frontend/assets`` directory.
+    """
+    if path.startswith(":/"):
+        return path
+    normalized = path.replace("\\", "/")
+    position = normalized.rfind(ASSETS_MARKER)
+    if position == -1 or (position > 0 and normalized[position - 1] != "/"):
+        return None
+    return f":/{normalized[position + len(ASSETS_MARKER):]}"
+
+@lru_cache(maxsize=4096)
+def resolve(path: str) -> str:
+    """Resolve an image path from the data file to its bundled resource, else to the file on disk.
+
+    Bundled lookups are in-memory; other paths are checked on disk once per
+    path and remembered.
+    """
+    resource = resource_path(path)
+    if resource is not None and QtCore.QFile.exists(resource):
+        return resource
+    abs_path = os.path.join(BASE_DIR, path)
+    return abs_path if os.path.exists(abs_path) else path
+
+def scaled_paths(resource: str, width: int, height: int) -> Tuple[str, str]:
+    """The ``:/`` paths a pre-scaled copy of ``resource`` is packed under, as JPEG or as PNG."""
+    stem = f":/{SCALED_PREFIX}/{width}x{height}/{resource[2:]}"
+    return f"{stem}.jpg", f"{stem}.png"
+
+def load_scaled(resource: str, width: int, height: int) -> QtGui.QImage:
+    """Return a bundled image scaled to fit ``width`` x ``height``, using its pre-scaled copy when packed."""
+    from frontend.utils.orgs_custom_widgets.image_cache import decode_scaled
+
+    for scaled in scaled_paths(resource, width, height):
+        if QtCore.QFile.exists(scaled):
+            image = QtGui.QImage(scaled)
+            if not image.isNull():
+                return image
+    return decode_scaled(resource, width, height)
+
+def qt_hash(name: str) -> int:
+    """Qt's ``qt_hash``, which orders the children of each directory in a resource file."""
+    h = 0
+    encoded = name.encode("utf-16-be")
+    for i in range(0, len(encoded), 2):
+        h = (h << 4) + (encoded[i] << 8 | encoded[i + 1])
+        h ^= (h & 0xf0000000) >> 23
+        h &= 0x0fffffff
+    return h
+
+def write_rcc(entries: Dict[str, bytes], path: str, level: int = COMPRESSION_LEVEL,
+              threshold: int = COMPRESSION_THRESHOLD) -> None:
+    """Write ``entries`` (resource path without ``:/`` -> contents) as a binary Qt resource file."""
+    root: Dict[str, object] = {}
+    for name, contents in entries.items():
+        directory = root
+        *parents, leaf = name.split("/")
+        for part in parents:
+            directory = directory.setdefault(part, {})
+        directory[leaf] = contents
+
+    data = bytearray()
+    blobs: Dict[bytes, Tuple[int, bool]] = {}
+
+    def add_blob(contents: bytes) -> Tuple[int, bool]:
+        # Entries with the same contents (aliases) share one blob.
+        if contents not in blobs:
+            packed = struct.pack(">I", len(contents)) + zlib.compress(contents, level)
+            compressed = len(packed) * 100 <= len(contents) * threshold
+            blob = packed if compressed else contents
+            blobs[contents] = (len(data), compressed)
+            data.extend(struct.pack(">I", len(blob)) + blob)
+        return blobs[contents]
+
+    names = bytearray()
+    name_offsets: Dict[str, int] = {}
+
+    def add_name(name: str) -> int:
+        if name not in name_offsets:
+            encoded = name.encode("utf-16-be")
+            name_offsets[name] = len(names)
+            names.extend(struct.pack(">HI", len(encoded) // 2, qt_hash(name)) + encoded)
+        return name_offsets[name]
+
+    # Number the nodes breadth-first, so the children of each directory sit in
+    # consecutive slots, ordered by hash for Qt's binary search.
+    nodes: List[Tuple[Optional[str], object]] = [(None, root)]
+    first_child: Dict[int, int] = {}
+    index = 0
+    while index < len(nodes):
+        contents = nodes[index][1]
+        if isinstance(contents, dict):
+            first_child[index] = len(nodes)
+            nodes.extend(sorted(contents.items(), key=lambda item: qt_hash(item[0])))
+        index += 1
+
+    tree = bytearray()
+    for index, (name, contents) in enumerate(nodes):
+        name_offset = add_name(name) if name is not None else 0
+        if isinstance(contents, dict):
+            tree.extend(struct.pack(">IHII", name_offset, 0x02, len(contents), first_child[index]))
+        else:
+            offset, compressed = add_blob(contents)
+            # Language C (1), any territory (0): the entry every locale falls back to.
+            tree.extend(struct.pack(">IHHHI", name_offset, 0x01 if compressed else 0x00, 0, 1, offset))
+
+    header_size = 20
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(b"qres" + struct.pack(">IIII", 1, tree_offset, data_offset, names_offset))
+        file.write(data)
+        file.write(names)
+        file.write(tree)
+    os.replace(tmp_path, path)
+
+def verify_rcc(entries: Dict[str, bytes], path: str) -> List[str]:
+    """Map the resource file at ``path`` and return a line for every entry Qt cannot read back as packed."""
+    if not QtCore.QResource.registerResource(path):
+        return [f"{path} is not a valid resource file"]
+    problems = []
+    try:
+        for name, contents in entries.items():
+            file = QtCore.QFile(f":/{name}")
+            if not file.exists() or not file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
+                problems.append(f":/{name} is missing")
+                continue
+            read_back = bytes(file.readAll())
+            file.close()
+            if len(read_back) != len(contents):
+                problems.append(f":/{name} reads back {len(read_back)} bytes, expected {len(contents)}")
+            elif read_back != contents:
+                problems.append(f":/{name} reads back different contents than were packed")
+    finally:
+        QtCore.QResource.unregisterResource(path)
+    return problems
+
+def qrc_entries(qrc_path: str = QRC_PATH) -> Iterator[Tuple[str, str]]:
+    """Yield (resource path, file) for every entry of a .qrc file, honouring prefixes and aliases."""
+    directory = os.path.dirname(qrc_path)
+    for resource in ElementTree.parse(qrc_path).getroot().iter("qresource"):
+        prefix = resource.get("prefix", "").strip("/")
+        for entry in resource.iter("file"):
+            name = (entry.get("alias") or entry.text).strip("/")
+            yield f"{prefix}/{name}" if prefix else name, os.path.join(directory, entry.text)
+
+def packed_images(assets_dir: str = ASSETS_DIR) -> Iterator[str]:
+    """Yield the path, relative to ``assets_dir``, of every image in ``PACKED_DIRS``."""
+    for packed_dir in PACKED_DIRS:
+        for directory, _dirs, files in os.walk(os.path.join(assets_dir, packed_dir)):
+            for file_name in sorted(files):
+                if file_name.lower().endswith(IMAGE_EXTENSIONS):
+                    yield os.path.relpath(os.path.join(directory, file_name), assets_dir).replace(os.sep, "/")
+
+def encode_image(image: QtGui.QImage) -> Tuple[bytes, str]:
+    """Encode a pre-scaled copy the way the thumbnail store does: PNG with transparency, else JPEG."""
+    buffer = QtCore.QBuffer()
+    buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+    if image.hasAlphaChannel():
+        image.save(buffer, "PNG")
+        return bytes(buffer.data()), "png"
+    image.save(buffer, "JPG", 90)
+    return bytes(buffer.data()), "jpg"
+
+def bundle_entries(qrc_path: str = QRC_PATH, assets_dir: str = ASSETS_DIR) -> Dict[str, bytes]:
+    """Collect the contents of every resource the bundle packs, keyed by resource path."""
+    from frontend.utils.orgs_custom_widgets.image_cache import decode_scaled
+    from frontend.utils.orgs_custom_widgets.thumbnails import CARD_IMAGE_SIZE, LOGO_SIZE, PHOTO_SIZE
+
+    files: Dict[str, str] = dict(qrc_entries(qrc_path)) if os.path.exists(qrc_path) else {}
+    for relative in packed_images(assets_dir):
+        files[relative] = os.path.join(assets_dir, relative)
+
+    entries: Dict[str, bytes] = {}
+    for name, file_path in files.items():
+        try:
+            with open(file_path, 'rb') as file:
+                entries[name] = file.read()
+        except OSError as e:
+            print(f"Error packing {file_path}: {str(e)}")
+
+    for relative in packed_images(assets_dir):
+        if not relative.startswith(SCALED_DIRS):
+            continue
+        for width, height in (LOGO_SIZE, CARD_IMAGE_SIZE, PHOTO_SIZE):
+            image = decode_scaled(os.path.join(assets_dir, relative), width, height)
+            if image.isNull():
+                print(f"Skipped unreadable image: {relative}")
+                break
+            contents, extension = encode_image(image)
+            entries[f"{SCALED_PREFIX}/{width}x{height}/{relative}.{extension}"] = contents
+    return entries
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Pack the Organizations images into a compressed Qt resource bundle.")
+    parser.add_argument("--qrc", default=QRC_PATH, help="resource list whose entries keep their paths (default: %(default)s)")
+    parser.add_argument("--output", default=BUNDLE_PATH, help="bundle to write (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    # Keep a reference so image format plugins stay loaded while images are scaled.
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv[:1])
+    entries = bundle_entries(args.qrc)
+    write_rcc(entries, args.output)
+    problems = verify_rcc(entries, args.output)
+    for problem in problems:
+        print(f"Error in resource bundle: {problem}")
+    if problems:
+        os.remove(args.output)
+        return 1
+    # Aliases share their contents, so count each file once.
+    source_bytes = sum(len(contents) for contents in set(entries.values()))
+    print(f"{len(entries)} resource(s), {source_bytes / 1e6:.1f} MB packed into {os.path.getsize(args.output) / 1e6:.1f} MB at {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Pages of a QStackedWidget that are built the first time they are shown.
+
+The main window's .ui file keeps an empty placeholder widget for each lazy
+page so page indices stay the same; the page's own generated ``Ui_*`` class
+fills it in on first use. Its widgets are then copied onto the window's
+``ui`` object, so code written against a single ``Ui_MainWindow`` keeps
+working once the page exists.
+"""
+from typing import Callable, Dict, Optional, Tuple
+
+from PyQt6 import QtCore, QtWidgets
+
+class LazyPages(QtCore.QObject):
+    """Builds registered pages of ``ui.stacked_widget`` on demand."""
+
+    def __init__(self, ui, parent=None):
+        super().__init__(parent)
+        self.ui = ui
+        self._pending: Dict[int, Tuple[type, Optional[Callable[[], None]]]] = {}
+        # Covers any navigation that did not call ensure() first.
+        ui.stacked_widget.currentChanged.connect(self.ensure)
+
+    def add(self, index: int, page_ui_class: type, on_built: Optional[Callable[[], None]] = None) -> None:
+        """Register page ``index`` to be built by ``page_ui_class``, then set up by ``on_built``."""
+        self._pending[index] = (page_ui_class, on_built)
+
+    def is_built(self, index: int) -> bool:
+        return index not in self._pending
+
+    def ensure(self, index: int) -> bool:
+        """Build page ``index`` if it has not been built yet; return True if it was built now."""
+        entry = self._pending.pop(index, None)
+        if entry is None:
+            return False
+        page_ui_class, on_built = entry
+        page: QtWidgets.QWidget = self.ui.stacked_widget.widget(index)
+        page_ui = page_ui_class()
+        page_ui.setupUi(page)
+        vars(self.ui).update(vars(page_ui))
+        if on_built is not None:
+            on_built()
+        return True
+
+    def ensure_all(self) -> None:
+        """Build every page still pending, e.g. to measure the cost of building them up front."""
+        for index in sorted(self._pending):
+            self.ensure(index)
@@ -0,0 +1,65 @@
+"""Debug counts of live QObjects, for finding widgets that outlive their page.
+
+Run with ``VHUB_DEBUG_OBJECTS=1`` and every window that calls ``install``
+prints, whenever its stacked widget changes page, the classes whose live
+count grew since that page was last shown. After each page has been visited
+once, a session that frees what it builds prints nothing more.
+"""
+import gc
+import os
+from collections import Counter
+from typing import Dict, Optional
+
+from PyQt6 import QtCore, QtWidgets, sip
+
+ENABLED = os.environ.get("VHUB_DEBUG_OBJECTS", "") not in ("", "0")
+
+def live_objects() -> Counter:
+    """Count live QObjects by class.
+
+    Covers everything reachable from the application and its top-level
+    widgets, plus parentless objects that Python still holds.
+    """
+    objects: Dict[int, QtCore.QObject] = {}
+    app = QtCore.QCoreApplication.instance()
+    roots = [app] if app is not None else []
+    if isinstance(app, QtWidgets.QApplication):
+        roots += app.topLevelWidgets()
+    for root in roots:
+        for obj in [root, *root.findChildren(QtCore.QObject)]:
+            objects[sip.unwrapinstance(obj)] = obj
+    for obj in gc.get_objects():
+        if isinstance(obj, QtCore.QObject) and not sip.isdeleted(obj):
+            objects.setdefault(sip.unwrapinstance(obj), obj)
+    return Counter(type(obj).__name__ for obj in objects.values())
+
+class ObjectCensus(QtCore.QObject):
+    """Reports live-object growth per page of a QStackedWidget."""
+
+    def __init__(self, stacked_widget: QtWidgets.QStackedWidget, name: str, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self._last_seen: Dict[int, Counter] = {}
+        stacked_widget.currentChanged.connect(self._on_page_changed)
+
+    def _on_page_changed(self, index: int) -> None:
+        # Count once the page is built and widgets released by the old one are deleted.
+        QtCore.QTimer.singleShot(0, lambda: self.report(index))
+
+    def report(self, index: int) -> Counter:
+        """Print the growth since page ``index`` was last shown and return it."""
+        # Objects already released with deleteLater() are not leaks.
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete.value)
+        counts = live_objects()
+        growth = counts - self._last_seen.get(index, counts)
+        self._last_seen[index] = counts
+        if growth:
+            grown = ", ".join(f"+{count} {name}" for name, count in growth.most_common())
+            print(f"[objects] {self.name} page {index}: {sum(counts.values())} live; {grown}")
+        return growth
+
+def install(window: QtWidgets.QMainWindow) -> Optional[ObjectCensus]:
+    """Watch ``window.ui.stacked_widget`` when ``VHUB_DEBUG_OBJECTS`` is set; otherwise do nothing."""
+    if not ENABLED:
+        return None
+    return ObjectCensus(window.ui.stacked_widget, type(window).__module__.rsplit(".", 1)[-1], window)
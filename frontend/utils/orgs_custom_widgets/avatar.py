@@ -0,0 +1,66 @@
+import hashlib
+import os
+from typing import Optional
+
+from PyQt6 import QtCore, QtGui
+
+from frontend.utils.orgs_custom_widgets.thumbnails import ThumbnailStore
+
+BORDER_COLOR = "#084924"
+
+# Set VHUB_AVATAR_CACHE_DIR to keep rendered avatars on disk between runs.
+AVATAR_CACHE_DIR: Optional[str] = os.environ.get("VHUB_AVATAR_CACHE_DIR") or None
+
+def avatar_shape(border_width: int, color: str = BORDER_COLOR) -> str:
+    """Return the PixmapCache shape tag for an avatar with the given border."""
+    return f"avatar:{border_width}:{QtGui.QColor(color).name()}"
+
+def render_avatar(image: QtGui.QImage, size: int, border_width: int = 4, color: str = BORDER_COLOR) -> QtGui.QImage:
+    """Render ``image`` as a bordered circle of ``size`` pixels in a single paint pass.
+
+    The image is drawn centered through an elliptical clip path and the border
+    is stroked on top, so no intermediate pixmaps or masks are needed. Works on
+    QImage, so it is safe to call from worker threads.
+    """
+    avatar = QtGui.QImage(size, size, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+    avatar.fill(QtCore.Qt.GlobalColor.transparent)
+    inset = border_width / 2
+    circle = QtCore.QRectF(inset, inset, size - border_width, size - border_width)
+
+    with QtGui.QPainter(avatar) as painter:
+        painter.setRenderHints(QtGui.QPainter.RenderHint.Antialiasing | QtGui.QPainter.RenderHint.SmoothPixmapTransform)
+        clip = QtGui.QPainterPath()
+        clip.addEllipse(circle)
+        painter.setClipPath(clip)
+        painter.drawImage(QtCore.QPointF((size - image.width()) / 2, (size - image.height()) / 2), image)
+        painter.setClipping(False)
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        painter.setPen(QtGui.QPen(QtGui.QColor(color), border_width))
+        painter.drawEllipse(circle)
+
+    return avatar
+
+def load_avatar(path: str, size: int, border_width: int = 4, color: str = BORDER_COLOR,
+                cache_dir: Optional[str] = AVATAR_CACHE_DIR) -> QtGui.QImage:
+    """Decode ``path`` and render it as an avatar, reusing a pre-rendered PNG from ``cache_dir`` if present."""
+    cached_file = None
+    if cache_dir:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        digest = hashlib.sha1(f"{path}|{mtime_ns}|{size}|{avatar_shape(border_width, color)}".encode()).hexdigest()
+        cached_file = os.path.join(cache_dir, f"{digest}.png")
+        if os.path.exists(cached_file):
+            cached = QtGui.QImage(cached_file)
+            if not cached.isNull():
+                return cached
+
+    image = ThumbnailStore.instance().load(path, size, size)
+    if image.isNull():
+        return image
+    avatar = render_avatar(image, size, border_width, color)
+    if cached_file:
+        os.makedirs(cache_dir, exist_ok=True)
+        avatar.save(cached_file, "PNG")
+    return avatar
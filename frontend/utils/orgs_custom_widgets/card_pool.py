@@ -0,0 +1,35 @@
+from typing import Callable, List, Sequence
+
+from PyQt6 import QtWidgets
+
+class CardPool:
+    """Fixed set of card slots that are rebound to new data instead of rebuilt.
+
+    ``create(slot)`` builds the card for a slot index and places it in its
+    layout; it runs once per slot for the lifetime of the pool. Cards must
+    implement ``bind(data)``. Up to ``spare`` slots beyond the current data are
+    hidden and kept for the next refresh; cards past those are deleted, so one
+    very long list does not keep its cards alive for the rest of the session.
+    """
+
+    def __init__(self, create: Callable[[int], QtWidgets.QWidget], spare: int = 12):
+        self._create = create
+        self._spare = spare
+        self._cards: List[QtWidgets.QWidget] = []
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def show(self, items: Sequence) -> List[QtWidgets.QWidget]:
+        """Bind ``items`` to the first slots, growing the pool if needed, and hide the rest."""
+        while len(self._cards) < len(items):
+            self._cards.append(self._create(len(self._cards)))
+        for card, item in zip(self._cards, items):
+            card.bind(item)
+            card.show()
+        for card in self._cards[len(items):]:
+            card.hide()
+        for card in self._cards[len(items) + self._spare:]:
+            card.deleteLater()
+        del self._cards[len(items) + self._spare:]
+        return self._cards[:len(items)]
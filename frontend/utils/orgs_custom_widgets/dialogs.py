@@ -1,18 +1,15 @@
 from PyQt6 import QtWidgets, QtCore, QtGui
 from PyQt6.QtWidgets import QFileDialog
 
+from frontend.utils import theme
+
 class OfficerDialog(QtWidgets.QDialog):
     def __init__(self, officer_data, parent=None):
         super().__init__(parent)
+        # Dialogs are opened with exec() each time; free them (and their pixmaps) as soon as they close.
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
         self.setWindowFlags(QtCore.Qt.WindowType.FramelessWindowHint)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-                border: 1px solid #ccc;
-                border-radius: 10px;
-                padding: 10px;
-            }
-        """)
+        theme.set_role(self, "dialog")
         self.setFixedSize(400, 300)  # Adjust size as needed
 
         main_layout = QtWidgets.QVBoxLayout(self)
@@ -23,7 +20,7 @@ class OfficerDialog(QtWidgets.QDialog):
         top_layout.addItem(spacer)
         close_btn = QtWidgets.QPushButton("X")
         close_btn.setFixedSize(20, 20)
-        close_btn.setStyleSheet("background-color: transparent; border: none; color: gray;")
+        theme.set_role(close_btn, "close")
         close_btn.clicked.connect(self.close)
         top_layout.addWidget(close_btn)
         main_layout.addLayout(top_layout)
@@ -48,16 +45,16 @@ class OfficerDialog(QtWidgets.QDialog):
 
         # Buttons
         cv_btn = QtWidgets.QPushButton("Curriculum Vitae")
-        cv_btn.setStyleSheet("background-color: #084924; color: white; border-radius: 5px;")
+        theme.set_role(cv_btn, "primary")
         contact_btn = QtWidgets.QPushButton("Contact Me")
-        contact_btn.setStyleSheet("background-color: white; border: 1px solid #ccc; border-radius: 5px;")
+        theme.set_role(contact_btn, "secondary")
         main_layout.addWidget(cv_btn)
         main_layout.addWidget(contact_btn)
 
         # Edit button (only if current user is the officer)
         if parent.officer_name == officer_data.get("name"):
             edit_btn = QtWidgets.QPushButton("Edit")
-            edit_btn.setStyleSheet("background-color: #FFD700; color: black; border: 1px solid #ccc; border-radius: 5px;")
+            theme.set_role(edit_btn, "highlight-outlined")
             edit_btn.clicked.connect(lambda: self.open_edit_officer(officer_data))
             main_layout.addWidget(edit_btn)
 
@@ -76,17 +73,11 @@ class OfficerDialog(QtWidgets.QDialog):
 class EditOfficerDialog(QtWidgets.QDialog):
     def __init__(self, officer_data, parent=None):
         super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
         self.officer_data = officer_data.copy()
         self.setWindowTitle("Edit Officer Details")
         self.setFixedSize(500, 400)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-                border: 1px solid #ccc;
-                border-radius: 10px;
-                padding: 10px;
-            }
-        """)
+        theme.set_role(self, "dialog")
 
         main_layout = QtWidgets.QVBoxLayout(self)
 
@@ -140,17 +131,11 @@ class EditOfficerDialog(QtWidgets.QDialog):
 class EditMemberDialog(QtWidgets.QDialog):
     def __init__(self, member_data: list, parent=None):
         super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
         self.member_data = member_data
         self.setWindowTitle("Edit Member Position")
         self.setFixedSize(300, 200)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-                border: 1px solid #ccc;
-                border-radius: 10px;
-                padding: 10px;
-            }
-        """)
+        theme.set_role(self, "dialog")
 
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.addWidget(QtWidgets.QLabel("Position:"))
@@ -0,0 +1,82 @@
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PyQt6 import QtCore, QtGui
+
+CacheKey = Tuple[str, Optional[int], int, int, str]
+
+class PixmapCache:
+    """Process-wide LRU cache of decoded and scaled pixmaps.
+
+    Entries are keyed by (path, mtime, target size, shape) so an image edited
+    on disk is decoded again, and the least recently used entries are evicted
+    once the total pixel data exceeds ``max_bytes``.
+    """
+
+    _instance: Optional["PixmapCache"] = None
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, QtGui.QPixmap]" = OrderedDict()
+        self._bytes = 0
+
+    @classmethod
+    def instance(cls) -> "PixmapCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    @staticmethod
+    def key(path: str, width: int, height: int, shape: str) -> CacheKey:
+        if not path or path == "No Photo" or path.startswith(":/"):
+            # Nothing to stat: no image, or a bundled resource that cannot change while the app runs.
+            return (path, None, width, height, shape)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except (OSError, ValueError):
+            mtime_ns = None
+        return (path, mtime_ns, width, height, shape)
+
+    def get(self, key: CacheKey) -> Optional[QtGui.QPixmap]:
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self._entries.move_to_end(key)
+        return pixmap
+
+    def put(self, key: CacheKey, pixmap: QtGui.QPixmap) -> None:
+        if key in self._entries:
+            self._bytes -= self._cost(self._entries.pop(key))
+        self._entries[key] = pixmap
+        self._bytes += self._cost(pixmap)
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._cost(evicted)
+
+    @staticmethod
+    def _cost(pixmap: QtGui.QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 1) // 8
+
+def decode_scaled(path: str, width: int, height: int) -> QtGui.QImage:
+    """Decode an image directly at the size that fits ``width`` x ``height``.
+
+    QImageReader lets JPEG and other decoders skip work for pixels that would be
+    thrown away by scaling, which is much cheaper than decoding the full image.
+    """
+    reader = QtGui.QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid() and (size.width() > width or size.height() > height):
+        reader.setScaledSize(size.scaled(width, height, QtCore.Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if not image.isNull() and (image.width() > width or image.height() > height):
+        image = image.scaled(width, height, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
+    return image
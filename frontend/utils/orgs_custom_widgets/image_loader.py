@@ -0,0 +1,177 @@
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple
+
+from PyQt6 import QtCore, QtGui, sip
+
+from frontend.utils import asset_bundle
+from frontend.utils.orgs_custom_widgets.avatar import BORDER_COLOR, avatar_shape, load_avatar
+from frontend.utils.orgs_custom_widgets.image_cache import CacheKey, PixmapCache
+from frontend.utils.orgs_custom_widgets.thumbnails import ThumbnailStore
+
+Token = Tuple[int, Hashable]
+
+class _DecodeSignals(QtCore.QObject):
+    decoded = QtCore.pyqtSignal(object, QtGui.QImage)
+    skipped = QtCore.pyqtSignal(object, object)
+
+class _DecodeTask(QtCore.QRunnable):
+    def __init__(self, loader: "ImageLoader", key: CacheKey, produce: Callable[[], QtGui.QImage]):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.produce = produce
+
+    def run(self):
+        if not self.loader.is_wanted(self.key):
+            self.loader.signals.skipped.emit(self.key, self.produce)
+            return
+        self.loader.signals.decoded.emit(self.key, self.produce())
+
+class ImageLoader(QtCore.QObject):
+    """Decodes images on a QThreadPool and hands the scaled pixmaps back on the GUI thread.
+
+    Each request belongs to an ``owner`` QObject and an optional ``slot``. Only
+    the newest request per (owner, slot) is delivered, and nothing is delivered
+    once the owner is destroyed or ``cancel`` is called for it. Decoded pixmaps
+    are stored in the shared PixmapCache either way.
+    """
+
+    _instance: Optional["ImageLoader"] = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.signals = _DecodeSignals(self)
+        self.signals.decoded.connect(self._on_decoded)
+        self.signals.skipped.connect(self._on_skipped)
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, min(4, QtCore.QThread.idealThreadCount() - 1)))
+        self._waiting: Dict[CacheKey, Dict[Token, Tuple[QtCore.QObject, Callable[[QtGui.QPixmap], None]]]] = {}
+        self._token_keys: Dict[Token, CacheKey] = {}
+        self._in_flight: Set[CacheKey] = set()
+        # Owners whose destroyed signal drops their requests (and the callbacks holding their widgets).
+        self._watched: Set[int] = set()
+
+    @classmethod
+    def instance(cls) -> "ImageLoader":
+        if cls._instance is None:
+            cls._instance = cls(QtCore.QCoreApplication.instance())
+        return cls._instance
+
+    def request(self, owner: QtCore.QObject, path: str, width: int, height: int,
+                callback: Callable[[QtGui.QPixmap], None], slot: Hashable = None) -> Optional[QtGui.QPixmap]:
+        """Return the scaled image at ``path`` if it is cached, else decode it in the background.
+
+        Missing paths return a null pixmap right away. When None is returned,
+        ``callback`` later runs on the GUI thread with the decoded pixmap (null
+        if the file could not be read). Paths from the data file are resolved
+        through ``asset_bundle``, so bundled images are read from memory.
+        """
+        path = asset_bundle.resolve(path)
+        key = PixmapCache.key(path, width, height, "scaled")
+        return self._request(owner, slot, key, lambda: ThumbnailStore.instance().load(path, width, height), callback)
+
+    def request_avatar(self, owner: QtCore.QObject, path: str, size: int, border_width: int,
+                       callback: Callable[[QtGui.QPixmap], None], color: str = BORDER_COLOR) -> Optional[QtGui.QPixmap]:
+        """Like ``request``, but for the bordered circular avatar rendered by ``render_avatar``."""
+        path = asset_bundle.resolve(path)
+        key = PixmapCache.key(path, size, size, avatar_shape(border_width, color))
+        return self._request(owner, None, key, lambda: load_avatar(path, size, border_width, color), callback)
+
+    def prefetch_avatar(self, owner: QtCore.QObject, path: str, size: int, border_width: int, color: str = BORDER_COLOR) -> None:
+        """Render an avatar into the cache ahead of time, e.g. for dialogs that may be opened next."""
+        path = asset_bundle.resolve(path)
+        key = PixmapCache.key(path, size, size, avatar_shape(border_width, color))
+        self._request(owner, ("prefetch", key), key, lambda: load_avatar(path, size, border_width, color), lambda _pixmap: None)
+
+    def _request(self, owner: QtCore.QObject, slot: Hashable, key: CacheKey,
+                 produce: Callable[[], QtGui.QImage], callback: Callable[[QtGui.QPixmap], None]) -> Optional[QtGui.QPixmap]:
+        token = (id(owner), slot)
+        self._forget(token)
+        path = key[0]
+        if not path or path == "No Photo":
+            return QtGui.QPixmap()
+
+        pixmap = PixmapCache.instance().get(key)
+        if pixmap is not None:
+            return pixmap
+
+        self._waiting.setdefault(key, {})[token] = (owner, callback)
+        self._token_keys[token] = key
+        if token[0] not in self._watched:
+            self._watched.add(token[0])
+            owner_id = token[0]
+            owner.destroyed.connect(lambda _obj=None, owner_id=owner_id: self._on_owner_destroyed(owner_id))
+        if key not in self._in_flight:
+            self._in_flight.add(key)
+            self._pool.start(_DecodeTask(self, key, produce))
+        return None
+
+    def load_into(self, label, path: str, width: int, height: int, missing_text: str) -> None:
+        """Show a placeholder on ``label`` now and swap in the image once it is decoded."""
+        def show(pixmap: QtGui.QPixmap) -> None:
+            if pixmap.isNull():
+                label.setText(missing_text)
+            else:
+                label.setPixmap(pixmap)
+
+        pixmap = self.request(label, path, width, height, show)
+        if pixmap is None:
+            label.setPixmap(placeholder(width, height))
+        else:
+            show(pixmap)
+
+    def cancel(self, owner: QtCore.QObject) -> None:
+        """Drop every pending request of ``owner``; queued decodes nobody waits for are skipped."""
+        self._cancel_owner(id(owner))
+
+    def is_wanted(self, key: CacheKey) -> bool:
+        return bool(self._waiting.get(key))
+
+    def _cancel_owner(self, owner_id: int) -> None:
+        for token in [token for token in self._token_keys if token[0] == owner_id]:
+            self._forget(token)
+
+    def _on_owner_destroyed(self, owner_id: int) -> None:
+        self._watched.discard(owner_id)
+        self._cancel_owner(owner_id)
+
+    def _forget(self, token: Token) -> None:
+        key = self._token_keys.pop(token, None)
+        if key is not None:
+            waiters = self._waiting.get(key)
+            if waiters is not None:
+                waiters.pop(token, None)
+                if not waiters:
+                    del self._waiting[key]
+
+    def _on_skipped(self, key: CacheKey, produce: Callable[[], QtGui.QImage]) -> None:
+        # Requested again after the worker found nobody waiting: decode it after all.
+        if self.is_wanted(key):
+            self._pool.start(_DecodeTask(self, key, produce))
+        else:
+            self._in_flight.discard(key)
+
+    def _on_decoded(self, key: CacheKey, image: QtGui.QImage) -> None:
+        self._in_flight.discard(key)
+        pixmap = QtGui.QPixmap.fromImage(image)
+        PixmapCache.instance().put(key, pixmap)
+        for token, (owner, callback) in self._waiting.pop(key, {}).items():
+            self._token_keys.pop(token, None)
+            # Owners deleted while their image was decoding get nothing.
+            if not sip.isdeleted(owner):
+                callback(pixmap)
+
+def placeholder(width: int, height: int, radius: float = 10) -> QtGui.QPixmap:
+    """Return a light grey rounded placeholder shown while an image is decoding."""
+    cache = PixmapCache.instance()
+    key: CacheKey = ("", None, width, height, f"placeholder:{radius}")
+    pixmap = cache.get(key)
+    if pixmap is None:
+        pixmap = QtGui.QPixmap(width, height)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        with QtGui.QPainter(pixmap) as painter:
+            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            painter.setPen(QtCore.Qt.PenStyle.NoPen)
+            painter.setBrush(QtGui.QColor("#eee"))
+            painter.drawRoundedRect(QtCore.QRectF(0, 0, width, height), radius, radius)
+        cache.put(key, pixmap)
+    return pixmap
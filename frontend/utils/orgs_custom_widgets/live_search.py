@@ -0,0 +1,67 @@
+from typing import Callable
+
+from PyQt6 import QtCore, QtWidgets
+
+class _SearchSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(int, str, object)
+
+class _SearchTask(QtCore.QRunnable):
+    def __init__(self, search: "LiveSearch", generation: int, text: str):
+        super().__init__()
+        self.search = search
+        self.generation = generation
+        self.text = text
+
+    def run(self):
+        if self.search.is_stale(self.generation):
+            return
+        result = self.search.match(self.text)
+        self.search.signals.finished.emit(self.generation, self.text, result)
+
+class LiveSearch(QtCore.QObject):
+    """Search-as-you-type for a QLineEdit.
+
+    Keystrokes are debounced, ``match`` runs on a single background thread and
+    only the result of the newest query is delivered through ``results_ready``.
+    Queries that are superseded before they start are dropped from the queue;
+    results of queries superseded while running are discarded.
+    """
+
+    results_ready = QtCore.pyqtSignal(str, object)
+
+    def __init__(self, line_edit: QtWidgets.QLineEdit, match: Callable[[str], object], parent=None, delay_ms: int = 250):
+        super().__init__(parent)
+        self.line_edit = line_edit
+        self.match = match
+        self.signals = _SearchSignals(self)
+        self.signals.finished.connect(self._on_finished)
+        self._generation = 0
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._dispatch)
+        line_edit.textChanged.connect(self._on_text_changed)
+
+    def is_stale(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def cancel(self) -> None:
+        """Forget any pending or running query."""
+        self._generation += 1
+        self._timer.stop()
+        self._pool.clear()
+
+    def _on_text_changed(self, _text: str) -> None:
+        self.cancel()
+        self._timer.start()
+
+    def _dispatch(self) -> None:
+        self._pool.clear()
+        text = self.line_edit.text().strip().lower()
+        self._pool.start(_SearchTask(self, self._generation, text))
+
+    def _on_finished(self, generation: int, text: str, result: object) -> None:
+        if not self.is_stale(generation):
+            self.results_ready.emit(text, result)
@@ -0,0 +1,254 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+from frontend.utils.orgs_custom_widgets.image_loader import ImageLoader, placeholder
+
+OrgRole = QtCore.Qt.ItemDataRole.UserRole + 1
+LogoPathRole = QtCore.Qt.ItemDataRole.UserRole + 2
+
+class OrgCardModel(QtCore.QAbstractListModel):
+    """List model of organization or branch dicts shown as cards."""
+
+    def __init__(self, resolve_logo: Callable[[str], str], parent=None):
+        super().__init__(parent)
+        self._orgs: List[Dict] = []
+        self._resolve_logo = resolve_logo
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._orgs)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        org = self._orgs[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return org["name"]
+        if role == OrgRole:
+            return org
+        if role == LogoPathRole:
+            return self._resolve_logo(org["logo_path"])
+        return None
+
+    def set_orgs(self, orgs: List[Dict]) -> bool:
+        """Show ``orgs``, changing only the rows whose organization id differs from what is shown.
+
+        Rows are matched by id: cards no longer listed are removed, new ones
+        are inserted where they belong and kept cards stay put. A reordering
+        of kept cards falls back to a reset. Returns True if any row was
+        added or removed.
+        """
+        orgs = list(orgs)
+        new_ids = [org["id"] for org in orgs]
+        wanted = set(new_ids)
+        # Remove from the bottom up so the rows still to remove keep their numbers.
+        removed = [row for row, org in enumerate(self._orgs) if org["id"] not in wanted]
+        kept_ids = [org["id"] for org in self._orgs if org["id"] in wanted]
+        kept = set(kept_ids)
+        if kept_ids != [org_id for org_id in new_ids if org_id in kept]:
+            self.beginResetModel()
+            self._orgs = orgs
+            self.endResetModel()
+            return True
+        for first, last in reversed(_runs(removed)):
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._orgs[first:last + 1]
+            self.endRemoveRows()
+        inserted = [row for row, org_id in enumerate(new_ids) if org_id not in kept]
+        for first, last in _runs(inserted):
+            self.beginInsertRows(QtCore.QModelIndex(), first, last)
+            self._orgs[first:first] = orgs[first:last + 1]
+            self.endInsertRows()
+        # Kept cards may be a fresh copy of the same organization after a reload.
+        for row, org in enumerate(orgs):
+            if self._orgs[row] is not org:
+                self._orgs[row] = org
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+        return bool(removed or inserted)
+
+def _runs(rows: List[int]) -> List[Tuple[int, int]]:
+    """Group sorted row numbers into (first, last) runs of consecutive rows."""
+    runs: List[Tuple[int, int]] = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1] = (runs[-1][0], row)
+        else:
+            runs.append((row, row))
+    return runs
+
+class OrgCardDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints an organization card (logo, optional description, buttons) without child widgets."""
+
+    button_clicked = QtCore.pyqtSignal(str, object)
+
+    MARGIN = 10
+    PADDING = 10
+    LOGO_SIZE = 200
+    DESCRIPTION_HEIGHT = 60
+    BUTTON_HEIGHT = 30
+    SPACING = 8
+    CARD_WIDTH = 250
+
+    def __init__(self, show_description: bool, parent=None):
+        super().__init__(parent)
+        self.show_description = show_description
+        self.buttons = ["details", "apply"] if show_description else ["details"]
+        self._hovered: Optional[tuple] = None
+        self._pressed: Optional[tuple] = None
+
+    def sizeHint(self, option, index):
+        height = self.PADDING * 2 + self.LOGO_SIZE + self.SPACING
+        if self.show_description:
+            height += self.DESCRIPTION_HEIGHT + self.SPACING
+        height += len(self.buttons) * (self.BUTTON_HEIGHT + self.SPACING) - self.SPACING
+        return QtCore.QSize(self.CARD_WIDTH + self.MARGIN * 2, height + self.MARGIN * 2)
+
+    def _card_rect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        return rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+
+    def _layout(self, rect: QtCore.QRect) -> Dict[str, QtCore.QRect]:
+        """Return the sub-rectangles of a card; shared by painting and hit-testing."""
+        inner = self._card_rect(rect).adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        parts = {"logo": QtCore.QRect(inner.center().x() - self.LOGO_SIZE // 2, inner.top(), self.LOGO_SIZE, self.LOGO_SIZE)}
+        y = parts["logo"].bottom() + 1 + self.SPACING
+        if self.show_description:
+            parts["description"] = QtCore.QRect(inner.left(), y, inner.width(), self.DESCRIPTION_HEIGHT)
+            y += self.DESCRIPTION_HEIGHT + self.SPACING
+        for name in self.buttons:
+            parts[name] = QtCore.QRect(inner.left(), y, inner.width(), self.BUTTON_HEIGHT)
+            y += self.BUTTON_HEIGHT + self.SPACING
+        return parts
+
+    def _button_text(self, name: str, org: Dict) -> str:
+        return org["details"] if name == "details" else "Apply"
+
+    def paint(self, painter, option, index):
+        org = index.data(OrgRole)
+        parts = self._layout(option.rect)
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setPen(QtGui.QPen(QtGui.QColor("#ccc"), 1))
+        painter.setBrush(QtGui.QColor("#fff"))
+        painter.drawRoundedRect(QtCore.QRectF(self._card_rect(option.rect)).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+
+        painter.setPen(option.palette.color(QtGui.QPalette.ColorRole.Text))
+        view = self.parent()
+        logo_path = index.data(LogoPathRole)
+        pixmap = ImageLoader.instance().request(
+            view, logo_path, self.LOGO_SIZE, self.LOGO_SIZE, lambda _pixmap: view.viewport().update(), slot=logo_path
+        )
+        if pixmap is None:
+            painter.drawPixmap(parts["logo"], placeholder(self.LOGO_SIZE, self.LOGO_SIZE))
+        elif pixmap.isNull():
+            painter.drawText(parts["logo"], QtCore.Qt.AlignmentFlag.AlignCenter, "No Logo")
+        else:
+            target = QtWidgets.QStyle.alignedRect(
+                QtCore.Qt.LayoutDirection.LeftToRight, QtCore.Qt.AlignmentFlag.AlignCenter, pixmap.size(), parts["logo"]
+            )
+            painter.drawPixmap(target, pixmap)
+
+        if self.show_description:
+            painter.drawText(
+                parts["description"], QtCore.Qt.AlignmentFlag.AlignCenter | QtCore.Qt.TextFlag.TextWordWrap, org["description"]
+            )
+
+        for name in self.buttons:
+            button = QtWidgets.QStyleOptionButton()
+            button.rect = parts[name]
+            button.text = self._button_text(name, org)
+            button.palette = option.palette
+            button.state = QtWidgets.QStyle.StateFlag.State_Enabled
+            key = (index.row(), name)
+            if self._hovered == key:
+                button.state |= QtWidgets.QStyle.StateFlag.State_MouseOver
+            button.state |= QtWidgets.QStyle.StateFlag.State_Sunken if self._pressed == key else QtWidgets.QStyle.StateFlag.State_Raised
+            style.drawControl(QtWidgets.QStyle.ControlElement.CE_PushButton, button, painter, widget)
+        painter.restore()
+
+    def _button_at(self, option, pos: QtCore.QPoint) -> Optional[str]:
+        parts = self._layout(option.rect)
+        return next((name for name in self.buttons if parts[name].contains(pos)), None)
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type not in (QtCore.QEvent.Type.MouseMove, QtCore.QEvent.Type.MouseButtonPress, QtCore.QEvent.Type.MouseButtonRelease):
+            return False
+
+        name = self._button_at(option, event.position().toPoint())
+        key = (index.row(), name) if name else None
+        if event_type == QtCore.QEvent.Type.MouseMove:
+            self.set_hovered(key)
+            return False
+        if event.button() != QtCore.Qt.MouseButton.LeftButton:
+            return False
+        if event_type == QtCore.QEvent.Type.MouseButtonPress:
+            self._pressed = key
+            self._repaint(option)
+            return key is not None
+
+        clicked = key is not None and key == self._pressed
+        self._pressed = None
+        self._repaint(option)
+        if clicked:
+            self.button_clicked.emit(name, index.data(OrgRole))
+        return clicked
+
+    def set_hovered(self, key: Optional[tuple]) -> None:
+        if key != self._hovered:
+            self._hovered = key
+            if view := self.parent():
+                view.viewport().update()
+
+    def _repaint(self, option) -> None:
+        if view := self.parent():
+            view.viewport().update(option.rect)
+
+class OrgCardView(QtWidgets.QListView):
+    """Virtualized, wrapping grid of organization cards.
+
+    Only the cards inside the viewport are painted, so refresh time and memory
+    stay flat regardless of how many organizations or branches are listed.
+    """
+
+    details_clicked = QtCore.pyqtSignal(object)
+    apply_clicked = QtCore.pyqtSignal(object)
+
+    def __init__(self, show_description: bool, resolve_logo: Callable[[str], str], parent=None):
+        super().__init__(parent)
+        self.setViewMode(QtWidgets.QListView.ViewMode.IconMode)
+        self.setFlow(QtWidgets.QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        self.setMovement(QtWidgets.QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.setMouseTracking(True)
+
+        self.card_model = OrgCardModel(resolve_logo, self)
+        self.card_delegate = OrgCardDelegate(show_description, self)
+        self.card_delegate.button_clicked.connect(self._on_button_clicked)
+        self.setModel(self.card_model)
+        self.setItemDelegate(self.card_delegate)
+
+    def set_orgs(self, orgs: List[Dict]) -> None:
+        if self.card_model.set_orgs(orgs):
+            # Logos still decoding for removed cards are no longer needed; the
+            # repaint requests the ones for cards that are still visible again.
+            ImageLoader.instance().cancel(self)
+            self.card_delegate.set_hovered(None)
+            self.viewport().update()
+
+    def leaveEvent(self, event):
+        self.card_delegate.set_hovered(None)
+        super().leaveEvent(event)
+
+    def _on_button_clicked(self, name: str, org: Dict) -> None:
+        (self.details_clicked if name == "details" else self.apply_clicked).emit(org)
@@ -1,11 +1,115 @@
+from datetime import date
+from enum import IntEnum
+from typing import Dict, Optional, Set, Tuple
+
+from PyQt6 import QtCore, QtWidgets
 from PyQt6.QtCore import QAbstractTableModel, Qt
 
-class ViewMembers(QAbstractTableModel):
-    def __init__(self, data, is_managing: bool = False):
-        super().__init__()
-        self._data = data
+from frontend.utils import theme
+from frontend.utils.orgs_data.records import APPLICANT_SCHEMA, MEMBER_ID, MEMBER_SCHEMA, Roster, RosterRow
+
+# Data role of the Actions column: a tuple of (name, text, theme role) buttons.
+ActionsRole = Qt.ItemDataRole.UserRole + 1
+# Data role holding a typed key (int or casefolded str) to sort a column by.
+SortRole = Qt.ItemDataRole.UserRole + 2
+
+# Officer positions from most to least senior; other positions sort after these.
+POSITION_RANK = {
+    position: rank for rank, position in enumerate(
+        ["President", "Vice - Internal Chairperson", "Vice - External Chairperson", "Secretary", "Treasurer", "Member"]
+    )
+}
+
+class MemberStatus(IntEnum):
+    ACTIVE = 0
+    INACTIVE = 1
+    UNKNOWN = 2
+
+    @classmethod
+    def parse(cls, text: str) -> "MemberStatus":
+        return cls.__members__.get(str(text).upper(), cls.UNKNOWN)
+
+MEMBER_ACTIONS = (("edit", "Edit", "success"), ("kick", "Kick", "danger"))
+APPLICANT_ACTIONS = (("details", "Details", "highlight"), ("accept", "Accept", "success"), ("decline", "Decline", "danger"))
+
+class _RecordTableModel(QAbstractTableModel):
+    """Table over a Roster that is updated in place, one row at a time.
+
+    The model reads the roster's columns directly instead of copying rows, so
+    callers change the roster (through ``RecordIndex``) first and then report
+    the change with ``insert_rows``, ``remove_row`` or ``update_row``.
+    """
+
+    SCHEMA = MEMBER_SCHEMA
+
+    def __init__(self, data, parent=None):
+        super().__init__(parent)
+        self._data = self._as_roster(data)
+
+    def _as_roster(self, data) -> Roster:
+        return data if isinstance(data, Roster) else Roster(self.SCHEMA, data)
+
+    def roster(self) -> Roster:
+        return self._data
+
+    def record(self, row: int) -> RosterRow:
+        return self._data[row]
+
+    def set_records(self, data) -> None:
+        """Replace every row, e.g. for a new search result or organization."""
+        self.beginResetModel()
+        self._data = self._as_roster(data)
+        self.endResetModel()
+
+    def insert_rows(self, first: int, count: int = 1) -> None:
+        """Report ``count`` rows the roster gained from ``first`` on, as one change."""
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + count - 1)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> None:
+        """Report a row the roster lost at ``row``."""
+        self.remove_rows([row])
+
+    def remove_rows(self, rows) -> None:
+        """Report several rows the roster lost, as one change."""
+        rows = sorted(set(rows))
+        if not rows:
+            return
+        if rows[-1] - rows[0] + 1 != len(rows):
+            # Scattered rows: one reset is cheaper than a signal per run.
+            self.beginResetModel()
+            self.endResetModel()
+            return
+        self.beginRemoveRows(QtCore.QModelIndex(), rows[0], rows[-1])
+        self.endRemoveRows()
+        if rows[0] < len(self._data):
+            # Rows below shift up, so their "No." column changes.
+            self.dataChanged.emit(self.index(rows[0], 0), self.index(len(self._data) - 1, 0))
+
+    def update_row(self, row: int) -> None:
+        """Repaint one row after its record was edited in place."""
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+class ViewMembers(_RecordTableModel):
+    def __init__(self, data, is_managing: bool = False, parent=None):
+        super().__init__(data, parent)
         self.is_managing = is_managing
-        self._headers = ["No.", "Name", "Position", "Status", "Join Date"] + (["Actions"] if is_managing else [])
+        self._headers = self._headers_for(is_managing)
+
+    @staticmethod
+    def _headers_for(is_managing: bool):
+        return ["No.", "Name", "Position", "Status", "Join Date"] + (["Actions"] if is_managing else [])
+
+    def set_records(self, data, is_managing: Optional[bool] = None) -> None:
+        """Replace every row, switching the Actions column on or off if ``is_managing`` is given."""
+        self.beginResetModel()
+        self._data = self._as_roster(data)
+        if is_managing is not None:
+            self.is_managing = is_managing
+            self._headers = self._headers_for(is_managing)
+        self.endResetModel()
 
     def rowCount(self, parent=None):
         return len(self._data)
@@ -14,30 +118,125 @@ class ViewMembers(QAbstractTableModel):
         return len(self._headers)
     
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.row() >= len(self._data):
+            return None
         if role == Qt.ItemDataRole.DisplayRole:
             col = index.column()
             if col == 0:
                 return str(index.row() + 1)
             elif col < len(self._headers) - 1 or not self.is_managing:
-                return self._data[index.row()][col - 1]
+                return self._data.value(index.row(), col - 1)
+        elif role == SortRole:
+            return self._sort_key(index.row(), index.column())
+        elif role == ActionsRole and self.is_managing and index.column() == len(self._headers) - 1:
+            return MEMBER_ACTIONS
         return None
 
+    def _sort_key(self, row: int, col: int):
+        if col == 0 or col > 4:
+            return row
+        if col == 4:
+            return self._data.key(row, 3)
+        value = self._data.value(row, col - 1)
+        if col == 2:
+            return POSITION_RANK.get(value, len(POSITION_RANK))
+        if col == 3:
+            return int(MemberStatus.parse(value))
+        return str(value).casefold()
+
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole:
             if orientation == Qt.Orientation.Horizontal:
                 return self._headers[section]
         return None
+
+class MemberFilterProxy(QtCore.QSortFilterProxyModel):
+    """Sorts and filters a ViewMembers source in place, without copying member lists.
+
+    Rows can be restricted to a set of search matches (member ids), a status
+    and a minimum join date; all filters combine.
+    """
+
+    def __init__(self, source: ViewMembers, parent=None):
+        super().__init__(parent)
+        self._matches: Optional[Set[int]] = None
+        self._status: Optional[MemberStatus] = None
+        self._joined_after = 0
+        self.setSourceModel(source)
+        self.setSortRole(SortRole)
+
+    def set_matches(self, matches: Optional[Set[int]]) -> None:
+        """Show only members whose id is in ``matches``; None shows everyone."""
+        if matches is not None or self._matches is not None:
+            self._matches = matches
+            self.invalidateRowsFilter()
+
+    def set_status(self, status: Optional[MemberStatus]) -> None:
+        if status != self._status:
+            self._status = status
+            self.invalidateRowsFilter()
+
+    def set_joined_after(self, day: Optional[date]) -> None:
+        """Show only members who joined after ``day``; None removes the limit."""
+        ordinal = day.toordinal() if day else 0
+        if ordinal != self._joined_after:
+            self._joined_after = ordinal
+            self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._matches is None and self._status is None and not self._joined_after:
+            return True
+        members = self.sourceModel().roster()
+        if self._matches is not None and members.key(source_row, MEMBER_ID) not in self._matches:
+            return False
+        if self._status is not None and MemberStatus.parse(members.value(source_row, 2)) != self._status:
+            return False
+        # Join dates are stored as day ordinals; anything that is not a date is <= 0.
+        return not self._joined_after or members.key(source_row, 3) > self._joined_after
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Number rows as shown rather than by their position in the source.
+        if role == Qt.ItemDataRole.DisplayRole and index.column() == 0:
+            return str(index.row() + 1)
+        return super().data(index, role)
+
+    def source_row(self, row: int) -> int:
+        return self.mapToSource(self.index(row, 0)).row()
+
+class MemberFilterBar(QtWidgets.QWidget):
+    """Status and join date inputs that drive a MemberFilterProxy."""
+
+    def __init__(self, proxy: MemberFilterProxy, parent=None):
+        super().__init__(parent)
+        self.proxy = proxy
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.status_box = QtWidgets.QComboBox()
+        self.status_box.addItem("All Statuses", None)
+        for status in (MemberStatus.ACTIVE, MemberStatus.INACTIVE):
+            self.status_box.addItem(status.name.title(), status)
+        self.status_box.currentIndexChanged.connect(lambda _index: self.proxy.set_status(self.status_box.currentData()))
+
+        self.joined_after = QtWidgets.QDateEdit()
+        self.joined_after.setCalendarPopup(True)
+        self.joined_after.setDisplayFormat("'Joined after' yyyy-MM-dd")
+        self.joined_after.setMinimumDate(QtCore.QDate(2000, 1, 1))
+        self.joined_after.setSpecialValueText("Joined any time")
+        self.joined_after.setDate(self.joined_after.minimumDate())
+        self.joined_after.dateChanged.connect(self._on_date_changed)
+
+        layout.addWidget(self.status_box)
+        layout.addWidget(self.joined_after)
+
+    def _on_date_changed(self, day: QtCore.QDate) -> None:
+        self.proxy.set_joined_after(None if day == self.joined_after.minimumDate() else day.toPyDate())
     
-    def flags(self, index, parent=None):
-        flags = super().flags(index)
-        if self.is_managing and index.column() == len(self._headers) - 1:
-            flags |= Qt.ItemFlag.ItemIsEditable
-        return flags
-    
-class ViewApplicants(QAbstractTableModel):
-    def __init__(self, data):
-        super().__init__()
-        self._data = data
+class ViewApplicants(_RecordTableModel):
+    SCHEMA = APPLICANT_SCHEMA
+
+    def __init__(self, data, parent=None):
+        super().__init__(data, parent)
         self._headers = ["No.", "Name", "Position", "Actions"]
 
     def rowCount(self, parent=None):
@@ -47,12 +246,16 @@ class ViewApplicants(QAbstractTableModel):
         return len(self._headers)
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.row() >= len(self._data):
+            return None
         if role == Qt.ItemDataRole.DisplayRole:
             col = index.column()
             if col == 0:
                 return str(index.row() + 1)  # Row numbering
             elif col < len(self._headers) - 1:
-                return self._data[index.row()][col - 1]  # Name, Position
+                return self._data.value(index.row(), col - 1)  # Name, Position
+        elif role == ActionsRole and index.column() == len(self._headers) - 1:
+            return APPLICANT_ACTIONS
         return None
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
@@ -60,8 +263,109 @@ class ViewApplicants(QAbstractTableModel):
             return self._headers[section]
         return None
 
-    def flags(self, index):
-        flags = super().flags(index)
-        if index.column() == len(self._headers) - 1:  # Actions column
-            flags |= Qt.ItemFlag.ItemIsEditable
-        return flags
\ No newline at end of file
+class ActionDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints the buttons of an Actions column and reports clicks on them.
+
+    Cells that carry an ``ActionsRole`` tuple are drawn as a row of themed
+    buttons; every other cell is painted normally. No widgets are created per
+    row, so tables of any size keep a constant widget count.
+    """
+
+    action_clicked = QtCore.pyqtSignal(str, int)
+
+    MARGIN = 5
+    SPACING = 5
+
+    def __init__(self, view: QtWidgets.QAbstractItemView):
+        super().__init__(view)
+        self._hovered: Optional[Tuple[int, str]] = None
+        self._pressed: Optional[Tuple[int, str]] = None
+        # One hidden button per theme role supplies the stylesheet look to paint with.
+        self._style_buttons: Dict[str, QtWidgets.QPushButton] = {}
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def _style_button(self, role: str) -> QtWidgets.QPushButton:
+        button = self._style_buttons.get(role)
+        if button is None:
+            button = QtWidgets.QPushButton(self.parent())
+            button.hide()
+            theme.set_role(button, role)
+            button.ensurePolished()
+            self._style_buttons[role] = button
+        return button
+
+    def _layout(self, rect: QtCore.QRect, actions) -> Dict[str, QtCore.QRect]:
+        """Return the button rectangles of a cell; shared by painting and hit-testing."""
+        inner = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        width = (inner.width() - self.SPACING * (len(actions) - 1)) // len(actions)
+        height = min(inner.height(), self._style_button(actions[0][2]).sizeHint().height())
+        top = inner.top() + (inner.height() - height) // 2
+        return {
+            name: QtCore.QRect(inner.left() + i * (width + self.SPACING), top, width, height)
+            for i, (name, _text, _role) in enumerate(actions)
+        }
+
+    def paint(self, painter, option, index):
+        actions = index.data(ActionsRole)
+        if not actions:
+            super().paint(painter, option, index)
+            return
+
+        parts = self._layout(option.rect, actions)
+        painter.save()
+        for name, text, role in actions:
+            button = self._style_button(role)
+            opt = QtWidgets.QStyleOptionButton()
+            opt.initFrom(button)
+            opt.rect = parts[name]
+            opt.text = text
+            opt.state = QtWidgets.QStyle.StateFlag.State_Enabled
+            key = (index.row(), name)
+            if self._hovered == key:
+                opt.state |= QtWidgets.QStyle.StateFlag.State_MouseOver
+            opt.state |= QtWidgets.QStyle.StateFlag.State_Sunken if self._pressed == key else QtWidgets.QStyle.StateFlag.State_Raised
+            painter.setFont(button.font())
+            button.style().drawControl(QtWidgets.QStyle.ControlElement.CE_PushButton, opt, painter, button)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        actions = index.data(ActionsRole)
+        if not actions or event_type not in (QtCore.QEvent.Type.MouseMove, QtCore.QEvent.Type.MouseButtonPress, QtCore.QEvent.Type.MouseButtonRelease):
+            if event_type == QtCore.QEvent.Type.MouseMove:
+                self._set_hovered(None)
+            return False
+
+        pos = event.position().toPoint()
+        name = next((name for name, rect in self._layout(option.rect, actions).items() if rect.contains(pos)), None)
+        key = (index.row(), name) if name else None
+        if event_type == QtCore.QEvent.Type.MouseMove:
+            self._set_hovered(key)
+            return False
+        if event.button() != QtCore.Qt.MouseButton.LeftButton:
+            return False
+        if event_type == QtCore.QEvent.Type.MouseButtonPress:
+            self._pressed = key
+            self._repaint(option.rect)
+            return key is not None
+
+        clicked = key is not None and key == self._pressed
+        self._pressed = None
+        self._repaint(option.rect)
+        if clicked:
+            self.action_clicked.emit(name, index.row())
+        return clicked
+
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.Type.Leave:
+            self._set_hovered(None)
+        return False
+
+    def _set_hovered(self, key: Optional[Tuple[int, str]]) -> None:
+        if key != self._hovered:
+            self._hovered = key
+            self.parent().viewport().update()
+
+    def _repaint(self, rect: QtCore.QRect) -> None:
+        self.parent().viewport().update(rect)
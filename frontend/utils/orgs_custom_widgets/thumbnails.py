@@ -0,0 +1,161 @@
+"""Persistent thumbnail store for organization logos and officer photos.
+
+Thumbnails are keyed by the SHA-1 of the source file's contents and the target
+size, so renamed or duplicated files share one thumbnail and edited files get a
+new one. Pre-warm the store for every image referenced by the organizations
+data file with::
+
+    python -m frontend.utils.orgs_custom_widgets.thumbnails
+
+Images packed in the resource bundle (``frontend.utils.asset_bundle``) carry
+their own pre-scaled copies, so they are counted but get no thumbnail.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from PyQt6 import QtCore, QtGui
+
+from frontend.utils import asset_bundle
+from frontend.utils.orgs_custom_widgets.image_cache import decode_scaled
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+THUMBNAIL_DIR = os.environ.get("VHUB_THUMBNAIL_DIR") or os.path.join(BASE_DIR, "frontend", "assets", "organization", ".thumbnails")
+
+LOGO_SIZE = (200, 200)
+CARD_IMAGE_SIZE = (200, 250)
+PHOTO_SIZE = (150, 150)
+
+class ThumbnailStore:
+    """Generates downscaled copies of images on first use and serves them from disk afterwards."""
+
+    _instance: Optional["ThumbnailStore"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, directory: str = THUMBNAIL_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(directory, "index.json")
+        self._hashes: Dict[str, Tuple[int, int, str]] = self._read_index()
+
+    @classmethod
+    def instance(cls) -> "ThumbnailStore":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def content_hash(self, path: str) -> Optional[str]:
+        """Return the SHA-1 of the file's contents, re-hashing only when its size or mtime changed."""
+        try:
+            stat = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            known = self._hashes.get(path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+
+        try:
+            with open(path, 'rb') as file:
+                digest = hashlib.sha1(file.read()).hexdigest()
+        except OSError:
+            return None
+        with self._lock:
+            self._hashes[path] = (stat.st_size, stat.st_mtime_ns, digest)
+            self._write_index()
+        return digest
+
+    def load(self, path: str, width: int, height: int) -> QtGui.QImage:
+        """Return the image at ``path`` scaled to fit ``width`` x ``height``, creating its thumbnail if needed."""
+        if path.startswith(":/"):
+            # Bundled images never change and carry their own pre-scaled copies.
+            return asset_bundle.load_scaled(path, width, height)
+        digest = self.content_hash(path)
+        if digest is None:
+            return QtGui.QImage()
+
+        stem = os.path.join(self.directory, f"{digest}_{width}x{height}")
+        for extension in (".jpg", ".png"):
+            if os.path.exists(stem + extension):
+                image = QtGui.QImage(stem + extension)
+                if not image.isNull():
+                    return image
+
+        image = decode_scaled(path, width, height)
+        if not image.isNull():
+            os.makedirs(self.directory, exist_ok=True)
+            if image.hasAlphaChannel():
+                image.save(stem + ".png", "PNG")
+            else:
+                image.save(stem + ".jpg", "JPG", 90)
+        return image
+
+    def _read_index(self) -> Dict[str, Tuple[int, int, str]]:
+        try:
+            with open(self._index_path, 'r') as file:
+                return {path: tuple(entry) for path, entry in json.load(file).items()}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self._index_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as file:
+                json.dump(self._hashes, file)
+            os.replace(tmp_path, self._index_path)
+        except OSError as e:
+            print(f"Error saving {self._index_path}: {str(e)}")
+
+def resolve_asset_path(rel_path: str) -> str:
+    """Resolve a data-file image path the same way the Organizations views do."""
+    return asset_bundle.resolve(rel_path)
+
+def referenced_images(organizations: List[Dict]) -> Iterator[Tuple[str, Tuple[int, int]]]:
+    """Yield every (image path, display size) referenced by the organizations data."""
+    for org in organizations:
+        for item in [org] + org.get("branches", []):
+            yield resolve_asset_path(item.get("logo_path", "No Photo")), LOGO_SIZE
+            officers = list(item.get("officers", []))
+            for semester_officers in item.get("officer_history", {}).values():
+                officers.extend(semester_officers)
+            for officer in officers:
+                yield resolve_asset_path(officer.get("card_image_path", "No Photo")), CARD_IMAGE_SIZE
+                yield resolve_asset_path(officer.get("photo_path", "No Photo")), PHOTO_SIZE
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from frontend.utils.orgs_data.repository import DATA_PATH, OrganizationRepository
+
+    parser = argparse.ArgumentParser(description="Pre-generate thumbnails for every image in the organizations data file.")
+    parser.add_argument("--data", default=DATA_PATH, help="organizations JSON file (default: %(default)s)")
+    parser.add_argument("--dir", default=THUMBNAIL_DIR, help="thumbnail directory (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    # Keep a reference so image format plugins stay loaded while thumbnails are generated.
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv[:1])
+    # Bundled images come with their own pre-scaled copies and need no thumbnails.
+    asset_bundle.register()
+    store = ThumbnailStore(args.dir)
+    created, bundled, missing = 0, 0, 0
+    repository = OrganizationRepository(args.data)
+    organizations = [repository.load_details(org) for org in repository.organizations()]
+    for path, (width, height) in sorted(set(referenced_images(organizations))):
+        if path == "No Photo":
+            continue
+        if path.startswith(":/"):
+            bundled += 1
+        elif store.load(path, width, height).isNull():
+            missing += 1
+            print(f"Skipped unreadable image: {path}")
+        else:
+            created += 1
+    print(f"{created} thumbnail(s) ready in {args.dir}, {bundled} image(s) served from bundle, {missing} image(s) skipped")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
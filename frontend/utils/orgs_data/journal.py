@@ -0,0 +1,88 @@
+"""Append-only journal of organization changes that have not reached the store yet.
+
+Every change is written as one JSON line and fsynced before the write-behind
+queue picks it up; once a batch is saved, an ``{"applied": seq}`` line marks
+it done. After a crash, the changes after the last such line are replayed.
+The file is emptied whenever everything in it has been applied and it has
+grown past ``COMPACT_BYTES``.
+"""
+import json
+import os
+import threading
+from typing import Dict, List
+
+from frontend.utils.orgs_data.records import to_json
+
+COMPACT_BYTES = 1 << 20
+
+def journal_path(data_path: str) -> str:
+    return f"{data_path}.journal"
+
+class Journal:
+    """An open journal file. ``recovered`` holds the changes a previous session never saved."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.recovered, self._applied, self._last_seq = self._read()
+        self._file = open(path, 'a', encoding='utf-8')
+        if self._file.tell() and not self._ends_with_newline():
+            # Close off a line cut short by a crash so the next entry starts cleanly.
+            self._write("")
+
+    def append(self, org_id: int, op: str, data: Dict) -> Dict:
+        """Durably record a change and return its entry."""
+        with self._lock:
+            self._last_seq += 1
+            entry = {"seq": self._last_seq, "org_id": org_id, "op": op, "data": data}
+            self._write(json.dumps(entry, default=to_json))
+            return entry
+
+    def checkpoint(self, seq: int) -> None:
+        """Mark every change up to ``seq`` as saved."""
+        with self._lock:
+            if seq <= self._applied:
+                return
+            self._applied = seq
+            if seq == self._last_seq and self._file.tell() > COMPACT_BYTES:
+                self._file.truncate(0)
+            # Also written after compacting, so numbering carries on from ``seq``.
+            self._write(json.dumps({"applied": seq}))
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def _write(self, line: str) -> None:
+        self._file.write(line + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b"\n"
+
+    def _read(self):
+        """Return the unapplied entries, the last applied sequence number and the highest one in the file."""
+        entries: List[Dict] = []
+        applied = last_seq = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A line cut short by a crash.
+                        continue
+                    if "applied" in record:
+                        applied = max(applied, record["applied"])
+                        last_seq = max(last_seq, applied)
+                    else:
+                        entries.append(record)
+                        last_seq = max(last_seq, record["seq"])
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error loading {self.path}: {str(e)}")
+        return [entry for entry in entries if entry["seq"] > applied], applied, last_seq
@@ -0,0 +1,156 @@
+import json
+import os
+import stat
+import tempfile
+import textwrap
+from typing import Dict, List, Optional, Set, Tuple
+
+from frontend.utils.orgs_data import summary_index
+from frontend.utils.orgs_data.records import to_json
+
+class JsonStore:
+    """Organizations kept in one JSON document.
+
+    Each top-level organization is encoded into its own cached JSON fragment,
+    so ``save`` only re-encodes the organizations it is told are dirty and then
+    replaces the file atomically.
+
+    When the sidecar index of ``summary_index`` matches the file, ``load``
+    returns only the organization summaries. The heavy sections of an
+    organization are parsed from its byte span by ``load_details``, and
+    organizations that were never opened are saved by copying their span
+    unchanged.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fragments: Dict[int, str] = {}
+        self._spans: Dict[int, summary_index.Span] = {}
+        self._span_stat: Optional[summary_index.FileStat] = None
+        self._mtime_ns: Optional[int] = None
+
+    def is_stale(self) -> bool:
+        """Return True if the file changed on disk since it was last loaded or saved."""
+        return self._stat_mtime() != self._mtime_ns
+
+    def load(self) -> Tuple[List[Dict], Set[int]]:
+        """Return the organizations in the file and the ids of those whose details were left unparsed."""
+        self._mtime_ns = self._stat_mtime()
+        file_stat = summary_index.file_stat(self.path)
+        indexed = summary_index.read_index(self.path, file_stat)
+        if indexed is not None and not self._spans_in_file(span for _summary, span in indexed):
+            indexed = None
+        if indexed is not None:
+            organizations = [summary for summary, _span in indexed]
+            spans = {summary["id"]: span for summary, span in indexed}
+            pending = set(spans)
+        else:
+            try:
+                with open(self.path, 'r', encoding='utf-8', newline='') as file:
+                    organizations, spans = summary_index.scan_organizations(file.read())
+                summary_index.write_index(self.path, organizations, spans, file_stat)
+            except (FileNotFoundError, ValueError) as e:
+                print(f"Error loading {self.path}: {str(e)}")
+                organizations, spans = [], {}
+            pending = set()
+        self._spans, self._span_stat = spans, file_stat
+        self._fragments = {}
+        return organizations, pending
+
+    def load_details(self, root_id: int) -> Dict:
+        """Return the fully parsed top-level organization with the given id."""
+        return json.loads(self._read_span_text(root_id))
+
+    def save(self, organizations: List[Dict], dirty: Set[int], pending: Set[int]) -> None:
+        """Write ``organizations`` atomically, re-encoding the ``dirty`` ones.
+
+        Organizations in ``pending`` were never loaded in full and are copied
+        from the current file. The sidecar index is rewritten to match.
+        """
+        for org_id in dirty:
+            self._fragments.pop(org_id, None)
+        text, spans = self._encode(organizations, pending)
+        self._write_atomic(text)
+        self._mtime_ns = self._stat_mtime()
+        self._spans, self._span_stat = spans, summary_index.file_stat(self.path)
+        summary_index.write_index(self.path, organizations, spans, self._span_stat)
+
+    def _encode(self, organizations: List[Dict], pending: Set[int]):
+        """Build the document from per-organization fragments, re-encoding only stale ones.
+
+        Returns the text and the byte span of each organization in it.
+        """
+        if not organizations:
+            return json.dumps({"organizations": []}, indent=4), {}
+        header = '{\n    "organizations": [\n'
+        indent = " " * 8
+        fragments, spans = [], {}
+        offset = len(header)
+        for org in organizations:
+            fragment = self._fragments.get(org["id"])
+            if fragment is None:
+                if org["id"] in pending:
+                    # Never opened, so the file still has its only full copy.
+                    fragment = indent + self._read_span_text(org["id"])
+                else:
+                    fragment = textwrap.indent(json.dumps(org, indent=4, default=to_json), indent)
+                self._fragments[org["id"]] = fragment
+            size = len(fragment.encode('utf-8'))
+            spans[org["id"]] = (offset + len(indent), size - len(indent))
+            offset += size + 2
+            fragments.append(fragment)
+        return header + ",\n".join(fragments) + "\n    ]\n}", spans
+
+    def _write_atomic(self, text: str) -> None:
+        directory = os.path.dirname(self.path)
+        fd, tmp_path = tempfile.mkstemp(prefix=".organizations_", suffix=".tmp", dir=directory)
+        try:
+            # No newline translation, so the spans computed from ``text`` are its byte offsets in the file.
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as file:
+                file.write(text)
+                file.flush()
+                os.fsync(file.fileno())
+            # mkstemp creates the file owner-only; keep the permissions of the file being replaced.
+            mode = stat.S_IMODE(os.stat(self.path).st_mode) if os.path.exists(self.path) else 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _read_span_text(self, root_id: int) -> str:
+        """Return the JSON text of a top-level organization as it is in the file."""
+        if summary_index.file_stat(self.path) != self._span_stat:
+            # The file was replaced behind our back while edits were pending; find the spans again.
+            with open(self.path, 'r', encoding='utf-8', newline='') as file:
+                _organizations, self._spans = summary_index.scan_organizations(file.read())
+            self._span_stat = summary_index.file_stat(self.path)
+        if root_id not in self._spans:
+            raise ValueError(f"organization {root_id} is no longer in the file")
+        offset, length = self._spans[root_id]
+        with open(self.path, 'rb') as file:
+            file.seek(offset)
+            return file.read(length).decode('utf-8')
+
+    def _spans_in_file(self, spans) -> bool:
+        """Return True if every span starts with '{' and ends with '}' in the file, as an object's span does."""
+        try:
+            with open(self.path, 'rb') as file:
+                for offset, length in spans:
+                    if length < 2:
+                        return False
+                    file.seek(offset)
+                    first = file.read(1)
+                    file.seek(offset + length - 1)
+                    if first != b"{" or file.read(1) != b"}":
+                        return False
+        except OSError:
+            return False
+        return True
+
+    def _stat_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
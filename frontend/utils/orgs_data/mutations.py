@@ -0,0 +1,69 @@
+"""Officer-side changes to organizations, described as data.
+
+Each change is an operation name plus a JSON-serializable payload, so the
+same change can be applied to the in-memory repository right away, kept in
+the local journal, replayed after a crash and later sent to a server.
+Applying an operation twice leaves the organization as applying it once.
+"""
+from typing import Callable, Dict
+
+from frontend.utils.orgs_data.records import member_id
+from frontend.utils.orgs_data.repository import OrganizationRepository
+
+Operation = Callable[[OrganizationRepository, Dict, Dict], object]
+
+def _update_org(repository: OrganizationRepository, org: Dict, data: Dict) -> Dict:
+    """``{"fields": {...}}``: overwrite top-level details such as brief, description and logo_path."""
+    org.update(data["fields"])
+    return org
+
+def _update_officer(repository: OrganizationRepository, org: Dict, data: Dict):
+    """``{"officer": {...}}``: copy an officer onto every listing with its id."""
+    return repository.records(org).update_officer(data["officer"])
+
+def _update_member(repository: OrganizationRepository, org: Dict, data: Dict):
+    """``{"id": ..., "position": ...}``: change a member's position."""
+    member = repository.records(org).member(data["id"])
+    if member is not None:
+        member[1] = data["position"]
+        repository.member_index(org).update(data["id"], member)
+    return member
+
+def _remove_member(repository: OrganizationRepository, org: Dict, data: Dict):
+    """``{"id": ...}``: remove a member."""
+    values = repository.records(org).remove_member(data["id"])
+    if values is not None:
+        repository.member_index(org).remove(data["id"])
+    return values
+
+def _accept_applicants(repository: OrganizationRepository, org: Dict, data: Dict):
+    """``{"ids": [...], "join_date": ...}``: make applicants active members, keeping their ids."""
+    members = repository.records(org).accept_applicants(data["ids"], data["join_date"])
+    member_index = repository.member_index(org)
+    for member in members:
+        member_index.add(member_id(member), member)
+    return members
+
+def _decline_applicants(repository: OrganizationRepository, org: Dict, data: Dict):
+    """``{"ids": [...]}``: remove applicants."""
+    return repository.records(org).remove_applicants(data["ids"])
+
+OPERATIONS: Dict[str, Operation] = {
+    "org.update": _update_org,
+    "officer.update": _update_officer,
+    "member.update": _update_member,
+    "member.remove": _remove_member,
+    "applicants.accept": _accept_applicants,
+    "applicants.decline": _decline_applicants,
+}
+
+def apply(repository: OrganizationRepository, org_id: int, op: str, data: Dict):
+    """Apply operation ``op`` to the organization or branch ``org_id`` in memory and return its result.
+
+    Runs under the repository lock, so a background save never sees half of a change.
+    """
+    with repository.lock:
+        org = repository.find(org_id)
+        if org is None:
+            return None
+        return OPERATIONS[op](repository, repository.load_details(org), data)
@@ -0,0 +1,143 @@
+import threading
+import time
+import weakref
+from typing import Callable, Dict, List, Optional
+
+from PyQt6 import QtCore
+
+from frontend.utils.orgs_data import mutations
+from frontend.utils.orgs_data.journal import Journal, journal_path
+from frontend.utils.orgs_data.repository import OrganizationRepository
+
+# Receives a batch of journal entries and returns True once they are stored.
+FlushTarget = Callable[[List[Dict]], bool]
+
+class OrganizationWriter:
+    """Write-behind queue between the views and the repository's store.
+
+    ``apply`` changes the in-memory organization at once, appends the change
+    to the local journal and returns; the views never wait on a write. A
+    background thread collects changes for ``delay_ms`` milliseconds (or
+    until ``batch_size`` are waiting), hands them to the flush target in one
+    batch and checkpoints the journal once the target accepts them. A failed
+    flush is retried with exponential backoff up to ``max_retry_ms``; the
+    changes stay in memory and in the journal meanwhile, and are replayed
+    from the journal the next time the app starts if it never succeeds.
+
+    The default target saves the repository; a backend target only needs
+    to accept the same batches of ``{"seq", "org_id", "op", "data"}`` entries.
+
+    There is one writer per repository, shared by every window through
+    ``for_repository``.
+    """
+
+    _instances: "weakref.WeakKeyDictionary[OrganizationRepository, OrganizationWriter]" = weakref.WeakKeyDictionary()
+    _instances_lock = threading.Lock()
+
+    def __init__(self, repository: OrganizationRepository, target: Optional[FlushTarget] = None,
+                 delay_ms: int = 400, batch_size: int = 200, max_retry_ms: int = 30000):
+        self.repository = repository
+        self.target = target or self._save_repository
+        self.delay_ms = delay_ms
+        self.batch_size = batch_size
+        self.max_retry_ms = max_retry_ms
+        self.journal = Journal(journal_path(repository.path))
+        self._queue: List[Dict] = []
+        self._cond = threading.Condition()
+        self._flush_requested = False
+        self._stopping = False
+        self._failures = 0
+        for entry in self.journal.recovered:
+            # Changes a previous session applied in memory but never saved.
+            mutations.apply(repository, entry["org_id"], entry["op"], entry["data"])
+            repository.mark_dirty(entry["org_id"])
+            self._queue.append(entry)
+        self._thread = threading.Thread(target=self._run, name="organization-writer", daemon=True)
+        self._thread.start()
+        if app := QtCore.QCoreApplication.instance():
+            app.aboutToQuit.connect(self.close)
+
+    @classmethod
+    def for_repository(cls, repository: OrganizationRepository) -> "OrganizationWriter":
+        """Return the writer shared by every window editing ``repository``."""
+        with cls._instances_lock:
+            writer = cls._instances.get(repository)
+            if writer is None:
+                writer = cls._instances[repository] = cls(repository)
+            return writer
+
+    def apply(self, org_id: int, op: str, data: Dict):
+        """Apply a change from ``mutations`` in memory, journal it and queue it; return the change's result."""
+        result = mutations.apply(self.repository, org_id, op, data)
+        self.repository.mark_dirty(org_id)
+        entry = self.journal.append(org_id, op, data)
+        with self._cond:
+            self._queue.append(entry)
+            self._cond.notify_all()
+        return result
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Flush queued changes now and wait up to ``timeout`` seconds; return True if none are left."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if not self._queue:
+                return True
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._queue and (remaining := deadline - time.monotonic()) > 0:
+                self._cond.wait(remaining)
+            return not self._queue
+
+    def close(self) -> None:
+        """Flush what can be flushed and stop the background thread; the journal keeps the rest."""
+        self.flush()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                # Let a burst of edits arrive before writing them together.
+                deadline = time.monotonic() + self.delay_ms / 1000
+                while (not self._flush_requested and not self._stopping and len(self._queue) < self.batch_size
+                       and (remaining := deadline - time.monotonic()) > 0):
+                    self._cond.wait(remaining)
+                batch = self._queue[:self.batch_size]
+            if self._flush_batch(batch):
+                with self._cond:
+                    del self._queue[:len(batch)]
+                    self._failures = 0
+                    if not self._queue:
+                        self._flush_requested = False
+                    self._cond.notify_all()
+                continue
+            with self._cond:
+                self._failures += 1
+                backoff_ms = min(self.max_retry_ms, self.delay_ms * 2 ** self._failures)
+                self._flush_requested = False
+                # New changes wait out the backoff too; only an explicit flush retries sooner.
+                deadline = time.monotonic() + backoff_ms / 1000
+                while (not self._stopping and not self._flush_requested
+                       and (remaining := deadline - time.monotonic()) > 0):
+                    self._cond.wait(remaining)
+
+    def _flush_batch(self, batch: List[Dict]) -> bool:
+        try:
+            if not self.target(batch):
+                return False
+        except Exception as e:
+            print(f"Error flushing organization changes: {str(e)}")
+            return False
+        self.journal.checkpoint(batch[-1]["seq"])
+        return True
+
+    def _save_repository(self, batch: List[Dict]) -> bool:
+        for org_id in {entry["org_id"] for entry in batch}:
+            self.repository.mark_dirty(org_id)
+        return self.repository.save()
@@ -0,0 +1,469 @@
+"""Compact, id-addressed records for the members, applicants and officers of an organization.
+
+Members and applicants are held column by column in a ``Roster``: names
+packed into one string buffer, positions and statuses as codes into one shared
+table of interned strings, join dates as day ordinals parsed once at load, and
+ids in an array. Officers are ``Officer`` records with fixed slots instead of dicts.
+Both are written back to the data file in their original JSON shape.
+
+Member and applicant rows carry their id as a trailing element
+(``[name, position, status, join_date, id]`` and ``[name, position, id]``);
+officers carry it under the ``"id"`` key. An applicant keeps its id when it is
+accepted as a member. The same officer listed under several semesters of
+``officer_history`` shares one id, so an edit reaches every listing.
+
+Ids are unique within their organization and are assigned in file order to
+rows that do not have one yet, so older data files get the same ids on every
+load until they are saved with them.
+"""
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+MEMBER_ID = 4
+APPLICANT_ID = 2
+
+# Column kinds of a Roster schema.
+TEXT, CODE, DATE, ID = range(4)
+
+MEMBER_SCHEMA = (("name", TEXT), ("position", CODE), ("status", CODE), ("join_date", DATE), ("id", ID))
+APPLICANT_SCHEMA = (("name", TEXT), ("position", CODE), ("id", ID))
+
+def member_id(member: Sequence) -> int:
+    """Return the stable id of a member row."""
+    return member[MEMBER_ID]
+
+def applicant_id(applicant: Sequence) -> int:
+    """Return the stable id of an applicant row."""
+    return applicant[APPLICANT_ID]
+
+class _Vocabulary:
+    """Interned strings shared by every roster, addressed by small integer codes."""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def code(self, value) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            code = len(self.values)
+            self.values.append(value)
+            self._codes[value] = code
+        return code
+
+VOCABULARY = _Vocabulary()
+
+@lru_cache(maxsize=4096)
+def format_ordinal(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+def _date_code(value) -> int:
+    """Encode a ``yyyy-MM-dd`` date as its ordinal, or any other value as a negative vocabulary code."""
+    try:
+        ordinal = date.fromisoformat(value).toordinal()
+        if format_ordinal(ordinal) == value:
+            return ordinal
+    except (TypeError, ValueError):
+        pass
+    return -VOCABULARY.code(value) - 1
+
+class _TextColumn:
+    """Strings packed end to end into one buffer, with an array of end offsets.
+
+    Appends are buffered and joined on the next read, so loading a roster is linear.
+    """
+
+    __slots__ = ("_text", "_ends", "_pending")
+
+    def __init__(self):
+        self._text = ""
+        self._ends = array("q")
+        self._pending: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, row: int) -> str:
+        self.pack()
+        return self._text[self._start(row):self._ends[row]]
+
+    def __setitem__(self, row: int, value: str) -> None:
+        self._splice(row, str(value))
+
+    def __delitem__(self, row: int) -> None:
+        self._splice(row, None)
+
+    def append(self, value: str) -> None:
+        value = str(value)
+        self._pending.append(value)
+        self._ends.append((self._ends[-1] if self._ends else 0) + len(value))
+
+    def _start(self, row: int) -> int:
+        return self._ends[row - 1] if row else 0
+
+    def pack(self) -> None:
+        """Join buffered appends into the text, releasing the separate strings."""
+        if self._pending:
+            self._text += "".join(self._pending)
+            self._pending = []
+
+    def _splice(self, row: int, value: Optional[str]) -> None:
+        self.pack()
+        start, end = self._start(row), self._ends[row]
+        self._text = self._text[:start] + (value or "") + self._text[end:]
+        shift = len(value or "") - (end - start)
+        tail = array("q", (offset + shift for offset in self._ends[row + 1:]))
+        if value is None:
+            self._ends[row:] = tail
+        else:
+            self._ends[row] = start + len(value)
+            self._ends[row + 1:] = tail
+
+class Roster:
+    """Column-oriented table of member or applicant rows with an id column.
+
+    ``roster[row]`` returns a ``RosterRow`` view that reads and writes through
+    to the columns, so code written against list rows keeps working. Models
+    and filters read single cells with ``value`` and ``key`` instead.
+    """
+
+    __slots__ = ("fields", "_kinds", "_columns", "_id_col", "_ids_sorted", "_rows_by_id")
+
+    def __init__(self, schema: Sequence[Tuple[str, int]], rows=()):
+        self.fields = tuple(name for name, _kind in schema)
+        self._kinds = tuple(kind for _name, kind in schema)
+        self._columns = [_TextColumn() if kind == TEXT else array("q" if kind == ID else "i") for kind in self._kinds]
+        self._id_col = self._kinds.index(ID)
+        self._ids_sorted = True
+        self._rows_by_id: Optional[Dict[int, int]] = None
+        for values in rows:
+            self.append(values)
+        for column in self._columns:
+            if isinstance(column, _TextColumn):
+                column.pack()
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, row: int) -> "RosterRow":
+        return RosterRow(self, self._columns[self._id_col][row])
+
+    def __iter__(self) -> Iterator["RosterRow"]:
+        for record_id in self._columns[self._id_col]:
+            yield RosterRow(self, record_id)
+
+    def value(self, row: int, col: int):
+        """Return one cell as it appears in the data file."""
+        kind, stored = self._kinds[col], self._columns[col][row]
+        if kind == CODE:
+            return VOCABULARY.values[stored]
+        if kind == DATE:
+            return format_ordinal(stored) if stored > 0 else VOCABULARY.values[-stored - 1]
+        return stored
+
+    def key(self, row: int, col: int):
+        """Return one cell as stored: a vocabulary code, a day ordinal (<= 0 if not a date) or the value."""
+        return self._columns[col][row]
+
+    def row_values(self, row: int) -> List:
+        return [self.value(row, col) for col in range(len(self._kinds))]
+
+    def rows(self) -> Iterator[List]:
+        """Yield every row as a plain list, e.g. for writing the data file."""
+        for row in range(len(self)):
+            yield self.row_values(row)
+
+    def set_value(self, row: int, col: int, value) -> None:
+        if self._kinds[col] == ID:
+            raise ValueError("record ids cannot be changed")
+        self._columns[col][row] = self._encode(col, value)
+
+    def append(self, values: Sequence) -> int:
+        """Add a row whose values follow the schema, id last; returns its row number."""
+        record_id = values[self._id_col]
+        ids = self._columns[self._id_col]
+        if ids and record_id <= ids[-1]:
+            self._ids_sorted = False
+        for col, value in enumerate(values[:len(self._kinds)]):
+            self._columns[col].append(self._encode(col, value))
+        if self._rows_by_id is not None:
+            self._rows_by_id[record_id] = len(ids) - 1
+        return len(ids) - 1
+
+    def delete(self, row: int) -> None:
+        for column in self._columns:
+            del column[row]
+        self._rows_by_id = None
+
+    def delete_rows(self, rows: Iterable[int]) -> None:
+        """Delete several rows in one pass over the columns."""
+        drop = set(rows)
+        if not drop:
+            return
+        keep = [row for row in range(len(self)) if row not in drop]
+        columns = []
+        for column in self._columns:
+            if isinstance(column, _TextColumn):
+                kept = _TextColumn()
+                for row in keep:
+                    kept.append(column[row])
+                kept.pack()
+            else:
+                kept = array(column.typecode, (column[row] for row in keep))
+            columns.append(kept)
+        self._columns = columns
+        self._rows_by_id = None
+
+    def row_of(self, record_id: int) -> Optional[int]:
+        """Return the row holding ``record_id``, or None."""
+        ids = self._columns[self._id_col]
+        if self._ids_sorted:
+            # Ids are assigned in increasing order, so a binary search usually suffices.
+            row = bisect_left(ids, record_id)
+            return row if row < len(ids) and ids[row] == record_id else None
+        if self._rows_by_id is None:
+            self._rows_by_id = {value: row for row, value in enumerate(ids)}
+        return self._rows_by_id.get(record_id)
+
+    def _encode(self, col: int, value):
+        kind = self._kinds[col]
+        if kind == CODE:
+            return VOCABULARY.code(value)
+        if kind == DATE:
+            return _date_code(value)
+        return value
+
+class RosterRow:
+    """List-like view of one roster row, addressed by id so it survives other rows being removed."""
+
+    __slots__ = ("roster", "record_id")
+
+    def __init__(self, roster: Roster, record_id: int):
+        self.roster = roster
+        self.record_id = record_id
+
+    def _row(self) -> int:
+        row = self.roster.row_of(self.record_id)
+        if row is None:
+            raise LookupError(f"record {self.record_id} was removed")
+        return row
+
+    def __len__(self) -> int:
+        return len(self.roster.fields)
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return self.roster.row_values(self._row())[col]
+        return self.roster.value(self._row(), col)
+
+    def __setitem__(self, col: int, value) -> None:
+        self.roster.set_value(self._row(), col, value)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.roster.row_values(self._row()))
+
+    def __repr__(self) -> str:
+        return repr(self.roster.row_values(self._row()))
+
+_MISSING = object()
+
+class Officer(MutableMapping):
+    """An officer listing with the usual keys in slots; any other keys go to a small overflow dict."""
+
+    __slots__ = ("name", "position", "card_image_path", "photo_path", "start_date", "id", "_extra")
+    _KEYS = __slots__[:-1]
+    # Values repeated across listings and organizations.
+    _INTERNED = frozenset(("position", "card_image_path", "photo_path", "start_date"))
+
+    def __init__(self, data=()):
+        self._extra: Optional[Dict[str, Any]] = None
+        self.update(data)
+
+    def __getitem__(self, key: str):
+        value = getattr(self, key, _MISSING) if key in self._KEYS else (self._extra or {}).get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value) -> None:
+        if key in self._KEYS:
+            setattr(self, key, sys.intern(value) if key in self._INTERNED and isinstance(value, str) else value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        try:
+            if key in self._KEYS:
+                delattr(self, key)
+            else:
+                del (self._extra or {})[key]
+        except (AttributeError, KeyError):
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._KEYS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _key in self)
+
+    def __repr__(self) -> str:
+        return f"Officer({dict(self)!r})"
+
+    def copy(self) -> "Officer":
+        return Officer(self)
+
+def to_json(value):
+    """``json.dumps`` fallback that writes records back in their original shape."""
+    if isinstance(value, Roster):
+        return list(value.rows())
+    if isinstance(value, Officer):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def iter_officers(org: Dict) -> Iterator:
+    """Yield every officer record of ``org``: current officers first, then each semester."""
+    yield from org.get("officers", [])
+    for officers in org.get("officer_history", {}).values():
+        yield from officers
+
+def assign_ids(org: Dict) -> None:
+    """Give every member, applicant and officer of ``org`` that lacks one a stable id."""
+    rows = [(member, MEMBER_ID) for member in org.get("members", [])]
+    rows += [(applicant, APPLICANT_ID) for applicant in org.get("applicants", [])]
+    next_id = max((row[slot] for row, slot in rows if len(row) > slot), default=0) + 1
+    for row, slot in rows:
+        if len(row) <= slot:
+            row.append(next_id)
+            next_id += 1
+
+    officers = list(iter_officers(org))
+    next_id = max((officer["id"] for officer in officers if "id" in officer), default=0) + 1
+    by_name: Dict[str, int] = {}
+    for officer in officers:
+        if "id" in officer:
+            by_name.setdefault(officer["name"], officer["id"])
+    for officer in officers:
+        if "id" not in officer:
+            # Older files identify officers by name across semesters.
+            if officer["name"] not in by_name:
+                by_name[officer["name"]] = next_id
+                next_id += 1
+            officer["id"] = by_name[officer["name"]]
+
+def compact(org: Dict) -> None:
+    """Assign ids and convert the member, applicant and officer lists of ``org`` to compact records.
+
+    Parts that are already compact are left as they are, so calling it again is cheap.
+    """
+    assign_ids(org)
+    for key, schema in (("members", MEMBER_SCHEMA), ("applicants", APPLICANT_SCHEMA)):
+        if isinstance(org.get(key), list):
+            org[key] = Roster(schema, org[key])
+    if "officers" in org:
+        org["officers"] = _officers(org["officers"])
+    for semester, officers in org.get("officer_history", {}).items():
+        org["officer_history"][semester] = _officers(officers)
+
+def _officers(officers: List) -> List[Officer]:
+    if all(isinstance(officer, Officer) for officer in officers):
+        return officers
+    return [officer if isinstance(officer, Officer) else Officer(officer) for officer in officers]
+
+class RecordIndex:
+    """id -> record lookups for one organization's members, applicants and officers.
+
+    Every mutation of those records goes through the index so it stays
+    current; the rosters keep their order for display and for the data file.
+    """
+
+    def __init__(self, org: Dict):
+        compact(org)
+        self.org = org
+        self._officers: Dict[int, List[Officer]] = {}
+        for officer in iter_officers(org):
+            self._officers.setdefault(officer["id"], []).append(officer)
+        self._next_id = max(
+            (roster.key(row, roster.fields.index("id")) for roster in (self.members, self.applicants) for row in range(len(roster))),
+            default=0
+        ) + 1
+
+    @property
+    def members(self) -> Roster:
+        return self._roster("members", MEMBER_SCHEMA)
+
+    @property
+    def applicants(self) -> Roster:
+        return self._roster("applicants", APPLICANT_SCHEMA)
+
+    def member(self, record_id: int) -> Optional[RosterRow]:
+        return _find(self.members, record_id)
+
+    def officer_records(self, record_id: int) -> List[Officer]:
+        """Return every listing of an officer: the current one and one per semester served."""
+        return self._officers.get(record_id, [])
+
+    def add_member(self, name: str, position: str, status: str, join_date: str, record_id: Optional[int] = None) -> RosterRow:
+        """Append a new member row, giving it a fresh id unless ``record_id`` is passed."""
+        if record_id is None:
+            record_id = self._next_id
+        self._next_id = max(self._next_id, record_id + 1)
+        self.members.append([name, position, status, join_date, record_id])
+        return RosterRow(self.members, record_id)
+
+    def remove_member(self, record_id: int) -> Optional[List]:
+        """Remove a member and return its values."""
+        return _pop(self.members, record_id)
+
+    def remove_applicants(self, record_ids: Iterable[int]) -> List[List]:
+        """Remove several applicants at once and return their values in roster order."""
+        roster = self.applicants
+        rows = sorted({row for row in map(roster.row_of, record_ids) if row is not None})
+        values = [roster.row_values(row) for row in rows]
+        roster.delete_rows(rows)
+        return values
+
+    def accept_applicants(self, record_ids: Iterable[int], join_date: str) -> List[RosterRow]:
+        """Move applicants to the members as active members who joined on ``join_date``, keeping their ids."""
+        return [
+            self.add_member(name, position, "Active", join_date, record_id)
+            for name, position, record_id in self.remove_applicants(record_ids)
+        ]
+
+    def _roster(self, key: str, schema) -> Roster:
+        roster = self.org.get(key)
+        if roster is None:
+            roster = self.org[key] = Roster(schema)
+        return roster
+
+    def update_officer(self, officer: Mapping[str, Any]) -> List[Officer]:
+        """Copy ``officer`` (an edited officer dict or listing) onto every listing with the same id and return the listings."""
+        records = self.officer_records(officer.get("id"))
+        for record in records:
+            if record is not officer:
+                record.clear()
+                record.update(officer)
+        return records
+
+def _find(roster: Roster, record_id: int) -> Optional[RosterRow]:
+    return None if roster.row_of(record_id) is None else RosterRow(roster, record_id)
+
+def _pop(roster: Roster, record_id: int) -> Optional[List]:
+    row = roster.row_of(record_id)
+    if row is None:
+        return None
+    values = roster.row_values(row)
+    roster.delete(row)
+    return values
@@ -0,0 +1,216 @@
+import os
+import threading
+from typing import Dict, List, Optional, Set, Union
+
+from frontend.utils.orgs_data import summary_index
+from frontend.utils.orgs_data.json_store import JsonStore
+from frontend.utils.orgs_data.records import RecordIndex, compact
+from frontend.utils.orgs_data.search_index import MEMBER_FIELDS, SearchIndex
+from frontend.utils.orgs_data.sqlite_store import SQLiteStore
+
+DATA_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "../../views/default/Organizations/organizations_data.json"
+))
+DB_PATH = os.path.splitext(DATA_PATH)[0] + ".sqlite3"
+
+def open_store(path: str) -> Union[JsonStore, SQLiteStore]:
+    """Return the store for ``path``: SQLite for ``.sqlite3``/``.db`` files, JSON otherwise."""
+    if path.endswith((".sqlite3", ".db")):
+        return SQLiteStore(path)
+    return JsonStore(path)
+
+class OrganizationRepository:
+    """Process-wide, in-memory copy of the organizations data.
+
+    The data lives in a store: the JSON file of ``json_store`` or, once it has
+    been migrated, the database of ``sqlite_store``. It is read once and kept
+    in memory, and only re-read when the store reports a change made outside
+    this repository.
+
+    ``mark_dirty`` records which top-level organization changed, so ``save``
+    only writes what changed.
+
+    Members, applicants and officers are converted to the compact records of
+    ``records`` as they are loaded, and written back in their stored shape.
+
+    A store may return only organization summaries up front. The heavy
+    sections of an organization (members, applicants, events, officer
+    history) are then read on the first ``load_details`` call.
+    """
+
+    _instance: Optional["OrganizationRepository"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str = DATA_PATH):
+        self.path = path
+        self.store = open_store(path)
+        self._lock = threading.RLock()
+        self._organizations: List[Dict] = []
+        self._branches: List[Dict] = []
+        self._by_id: Dict[int, Dict] = {}
+        self._root_of: Dict[int, int] = {}
+        self._dirty: Set[int] = set()
+        self._org_index: Optional[SearchIndex] = None
+        self._branch_index: Optional[SearchIndex] = None
+        self._member_indexes: Dict[int, SearchIndex] = {}
+        self._record_indexes: Dict[int, RecordIndex] = {}
+        self._pending_details: Set[int] = set()
+        self._loaded = False
+
+    @classmethod
+    def instance(cls) -> "OrganizationRepository":
+        """Return the shared repository used by every window in the process."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(DB_PATH if os.path.exists(DB_PATH) else DATA_PATH)
+            return cls._instance
+
+    @property
+    def lock(self) -> threading.RLock:
+        """The lock every repository method holds; hold it to change records without a save seeing half the change."""
+        return self._lock
+
+    def organizations(self) -> List[Dict]:
+        """Return all top-level organizations, reloading only if the file changed."""
+        with self._lock:
+            self._refresh_if_stale()
+            return self._organizations
+
+    def branches(self) -> List[Dict]:
+        """Return every branch of every organization, in file order."""
+        with self._lock:
+            self._refresh_if_stale()
+            return self._branches
+
+    def find(self, org_id: int) -> Optional[Dict]:
+        """Return the organization or branch with the given id."""
+        with self._lock:
+            self._refresh_if_stale()
+            return self._by_id.get(org_id)
+
+    def load_details(self, org: Dict) -> Dict:
+        """Return the current copy of ``org`` with its members, applicants, events and officer history loaded."""
+        with self._lock:
+            self._refresh_if_stale()
+            org = self._by_id.get(org["id"], org)
+            self._ensure_details(org["id"])
+            return org
+
+    def org_index(self) -> SearchIndex:
+        """Return the name index over top-level organizations, keyed by org id."""
+        with self._lock:
+            self._refresh_if_stale()
+            if self._org_index is None:
+                self._org_index = self._build_name_index(self._organizations)
+            return self._org_index
+
+    def branch_index(self) -> SearchIndex:
+        """Return the name index over all branches, keyed by branch id."""
+        with self._lock:
+            self._refresh_if_stale()
+            if self._branch_index is None:
+                self._branch_index = self._build_name_index(self._branches)
+            return self._branch_index
+
+    def member_index(self, org: Dict) -> SearchIndex:
+        """Return the member search index of an organization, keyed by member id.
+
+        Callers that add, remove or edit members keep the index current through
+        ``SearchIndex.add``, ``remove`` and ``update``.
+        """
+        with self._lock:
+            self._ensure_details(org["id"])
+            index = self._member_indexes.get(org["id"])
+            if index is None:
+                index = SearchIndex(MEMBER_FIELDS)
+                members = self.records(org).members
+                id_col = members.fields.index("id")
+                for row in range(len(members)):
+                    index.add(members.key(row, id_col), members.row_values(row))
+                self._member_indexes[org["id"]] = index
+            return index
+
+    def records(self, org: Dict) -> RecordIndex:
+        """Return the id -> record index of an organization's members, applicants and officers."""
+        with self._lock:
+            self._ensure_details(org["id"])
+            index = self._record_indexes.get(org["id"])
+            if index is None or index.org is not org:
+                index = RecordIndex(org)
+                self._record_indexes[org["id"]] = index
+            return index
+
+    def mark_dirty(self, org_id: int) -> None:
+        """Record that the organization (or branch) with the given id changed."""
+        with self._lock:
+            root_id = self._root_of.get(org_id, org_id)
+            self._ensure_details(root_id)
+            self._dirty.add(root_id)
+
+    def save(self) -> bool:
+        """Write the changed organizations to the store and return whether it succeeded.
+
+        The JSON store replaces its file atomically, so a crash mid-write leaves
+        the old file intact; the SQLite store writes them in one transaction.
+        """
+        with self._lock:
+            try:
+                self.store.save(self._organizations, self._dirty, self._pending_details)
+                self._dirty.clear()
+                return True
+            except Exception as e:
+                print(f"Error saving {self.path}: {str(e)}")
+                return False
+
+    def _ensure_details(self, org_id: int) -> None:
+        """Load the heavy sections of an organization (and its branches) if they were left in the store."""
+        root_id = self._root_of.get(org_id, org_id)
+        if root_id not in self._pending_details:
+            return
+        try:
+            full = self.store.load_details(root_id)
+        except Exception as e:
+            print(f"Error loading {self.path}: {str(e)}")
+            return
+        org = self._by_id[root_id]
+        summary_index.merge_details(org, full)
+        compact(org)
+        for branch in org.get("branches", []):
+            compact(branch)
+        self._pending_details.discard(root_id)
+
+    @staticmethod
+    def _build_name_index(orgs: List[Dict]) -> SearchIndex:
+        index = SearchIndex(("name",))
+        for org in orgs:
+            index.add(org["id"], (org["name"],))
+        return index
+
+    def _refresh_if_stale(self) -> None:
+        if self._loaded and (not self.store.is_stale() or self._dirty):
+            # Unsaved in-memory edits win over an external change until they are flushed.
+            return
+        self._load()
+        self._loaded = True
+
+    def _load(self) -> None:
+        try:
+            organizations, pending = self.store.load()
+        except Exception as e:
+            print(f"Error loading {self.path}: {str(e)}")
+            organizations, pending = [], set()
+        for org in organizations:
+            compact(org)
+            for branch in org.get("branches", []):
+                compact(branch)
+        self._organizations = organizations
+        self._branches = [branch for org in organizations for branch in org.get("branches", [])]
+        self._by_id = {org["id"]: org for org in organizations}
+        self._by_id.update({branch["id"]: branch for branch in self._branches})
+        self._root_of = {branch["id"]: org["id"] for org in organizations for branch in org.get("branches", [])}
+        self._pending_details = pending
+        self._dirty = set()
+        self._org_index = None
+        self._branch_index = None
+        self._member_indexes = {}
+        self._record_indexes = {}
@@ -0,0 +1,85 @@
+from typing import Dict, Hashable, Iterable, Optional, Sequence, Set, Tuple
+
+MEMBER_FIELDS = ("name", "position", "status", "join_date")
+
+class SearchIndex:
+    """Case-insensitive substring index over one or more text fields per record.
+
+    Every lowercased value is broken into all of its 1-, 2- and 3-character
+    grams. Queries of up to three characters are answered by a single posting
+    lookup; longer queries intersect the postings of their trigrams and verify
+    the surviving candidates with a plain ``in`` check, so results match the
+    linear ``search_text in value.lower()`` scans this index replaces.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, fields: Sequence[str] = ("name",)):
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._values: Dict[Hashable, Tuple[str, ...]] = {}
+        self._postings: Dict[str, Dict[str, Set[Hashable]]] = {field: {} for field in self.fields}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def add(self, key: Hashable, values: Sequence) -> None:
+        """Index a record; ``values`` are given in the same order as ``fields``."""
+        if key in self._values:
+            self.remove(key)
+        lowered = tuple(str(value).lower() for value in values[:len(self.fields)])
+        self._values[key] = lowered
+        for field, value in zip(self.fields, lowered):
+            postings = self._postings[field]
+            for gram in self._grams(value):
+                postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a record from the index; unknown keys are ignored."""
+        lowered = self._values.pop(key, None)
+        if lowered is None:
+            return
+        for field, value in zip(self.fields, lowered):
+            postings = self._postings[field]
+            for gram in self._grams(value):
+                keys = postings.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del postings[gram]
+
+    def update(self, key: Hashable, values: Sequence) -> None:
+        """Re-index a record whose fields changed."""
+        self.add(key, values)
+
+    def search(self, text: str, fields: Optional[Iterable[str]] = None) -> Set[Hashable]:
+        """Return the keys whose given fields (all fields by default) contain ``text``."""
+        text = text.lower()
+        if not text:
+            return set(self._values)
+        hits: Set[Hashable] = set()
+        for field in (self.fields if fields is None else fields):
+            hits |= self._search_field(field, text)
+        return hits
+
+    def _search_field(self, field: str, text: str) -> Set[Hashable]:
+        postings = self._postings[field]
+        if len(text) <= self.GRAM_SIZE:
+            return set(postings.get(text, ()))
+
+        trigrams = {text[i:i + self.GRAM_SIZE] for i in range(len(text) - self.GRAM_SIZE + 1)}
+        candidate_sets = sorted((postings.get(gram, set()) for gram in trigrams), key=len)
+        if not candidate_sets[0]:
+            return set()
+        candidates = candidate_sets[0].intersection(*candidate_sets[1:])
+        position = self.fields.index(field)
+        return {key for key in candidates if text in self._values[key][position]}
+
+    def _grams(self, value: str) -> Set[str]:
+        return {
+            value[i:i + size]
+            for size in range(1, self.GRAM_SIZE + 1)
+            for i in range(len(value) - size + 1)
+        }
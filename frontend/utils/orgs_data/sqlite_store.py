@@ -0,0 +1,340 @@
+"""Organizations kept in a SQLite database instead of one JSON document.
+
+Every section of an organization has its own indexed table, so opening an
+organization reads only its rows and saving it touches only the rows that
+changed. The database runs in WAL mode, which lets the student and officer
+windows (or two copies of the app) read while the other writes.
+
+Convert an existing data file once with::
+
+    python -m frontend.utils.orgs_data.sqlite_store
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from frontend.utils.orgs_data.records import (
+    APPLICANT_ID, APPLICANT_SCHEMA, MEMBER_ID, MEMBER_SCHEMA, Officer, Roster, compact, to_json
+)
+
+SCHEMA_VERSION = 1
+
+# Organization columns besides id, parent_id and seq; unknown keys go to ``extra``.
+ORG_COLUMNS = ("name", "is_joined", "is_branch", "logo_path", "details", "brief", "description")
+OFFICER_COLUMNS = Officer._KEYS
+EVENT_COLUMNS = ("name", "date", "description")
+MEMBER_COLUMNS = ("name", "position", "status", "join_date", "id")
+APPLICANT_COLUMNS = ("name", "position", "id")
+# Keys stored in their own tables rather than as organization columns.
+SECTIONS = ("branches", "events", "officers", "members", "applicants", "officer_history")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS organizations (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER REFERENCES organizations(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    is_joined INTEGER NOT NULL DEFAULT 0,
+    is_branch INTEGER NOT NULL DEFAULT 0,
+    logo_path TEXT,
+    details TEXT,
+    brief TEXT,
+    description TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS organizations_by_parent ON organizations(parent_id, seq);
+CREATE INDEX IF NOT EXISTS organizations_by_name ON organizations(name COLLATE NOCASE);
+CREATE VIEW IF NOT EXISTS branches AS SELECT * FROM organizations WHERE parent_id IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS members (
+    org_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    position TEXT,
+    status TEXT,
+    join_date TEXT,
+    PRIMARY KEY (org_id, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS members_by_seq ON members(org_id, seq);
+CREATE INDEX IF NOT EXISTS members_by_name ON members(org_id, name COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS applicants (
+    org_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    position TEXT,
+    PRIMARY KEY (org_id, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS applicants_by_seq ON applicants(org_id, seq);
+
+CREATE TABLE IF NOT EXISTS officers (
+    org_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    {", ".join(f"{column} {'INTEGER' if column == 'id' else 'TEXT'}" for column in OFFICER_COLUMNS)},
+    extra TEXT,
+    PRIMARY KEY (org_id, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS officer_history (
+    org_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    semester TEXT NOT NULL,
+    semester_seq INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    {", ".join(f"{column} {'INTEGER' if column == 'id' else 'TEXT'}" for column in OFFICER_COLUMNS)},
+    extra TEXT,
+    PRIMARY KEY (org_id, semester, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS officer_history_by_officer ON officer_history(org_id, id);
+
+CREATE TABLE IF NOT EXISTS events (
+    org_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    name TEXT,
+    date TEXT,
+    description TEXT,
+    extra TEXT,
+    PRIMARY KEY (org_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS events_by_date ON events(org_id, date);
+
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+def _extra(record: Dict, columns: Iterable[str]) -> Optional[str]:
+    extra = {key: value for key, value in record.items() if key not in columns}
+    return json.dumps(extra, default=to_json) if extra else None
+
+def _record(columns: Sequence[str], row: Sequence, extra: Optional[str]) -> Dict:
+    """Rebuild a dict from a row, leaving out columns that were absent (NULL) when it was saved."""
+    record = {column: value for column, value in zip(columns, row) if value is not None}
+    if extra:
+        record.update(json.loads(extra))
+    return record
+
+class SQLiteStore:
+    """Organizations stored in a SQLite database, with the operations of ``JsonStore``.
+
+    ``load`` reads only the organizations table; ``load_details`` reads the
+    sections of one top-level organization and its branches. ``save`` writes
+    the dirty organizations in one transaction: member and applicant rows are
+    upserted by id and only rewritten when they changed, while the short
+    officer, history and event lists are replaced.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # The repository serializes access under its own lock, from the GUI and search threads.
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._conn.executescript(_SCHEMA)
+        self._data_version: Optional[int] = None
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def is_stale(self) -> bool:
+        """Return True if another connection committed since this one last loaded."""
+        return self._current_data_version() != self._data_version
+
+    def load(self) -> Tuple[List[Dict], Set[int]]:
+        """Return the organization summaries; every organization's details are left for ``load_details``."""
+        with self._transaction("DEFERRED"):
+            self._data_version = self._current_data_version()
+            rows = self._conn.execute(
+                f"SELECT id, parent_id, {', '.join(ORG_COLUMNS)}, extra FROM organizations ORDER BY parent_id IS NOT NULL, seq"
+            ).fetchall()
+        organizations: List[Dict] = []
+        by_id: Dict[int, Dict] = {}
+        for org_id, parent_id, *values, extra in rows:
+            org = self._summary(org_id, values, extra)
+            by_id[org_id] = org
+            if parent_id is None:
+                org["branches"] = []
+                organizations.append(org)
+            elif parent_id in by_id:
+                by_id[parent_id]["branches"].append(org)
+        return organizations, {org["id"] for org in organizations}
+
+    def load_details(self, root_id: int) -> Dict:
+        """Return the top-level organization with the given id and its branches, with every section."""
+        with self._transaction("DEFERRED"):
+            org = self._details(root_id)
+            org.setdefault("officer_history", {})
+            branch_ids = [row[0] for row in self._conn.execute(
+                "SELECT id FROM organizations WHERE parent_id = ? ORDER BY seq", (root_id,))]
+            org["branches"] = [self._details(branch_id) for branch_id in branch_ids]
+        return org
+
+    def save(self, organizations: List[Dict], dirty: Set[int], pending: Set[int]) -> None:
+        """Write the ``dirty`` top-level organizations and their branches in one transaction."""
+        with self._transaction("IMMEDIATE"):
+            for seq, org in enumerate(organizations):
+                if org["id"] not in dirty or org["id"] in pending:
+                    continue
+                self._save_org(org, None, seq)
+                for branch_seq, branch in enumerate(org.get("branches", [])):
+                    self._save_org(branch, org["id"], branch_seq)
+        # Our own commits do not change data_version, so there is nothing to re-read.
+
+    @contextmanager
+    def _transaction(self, mode: str) -> Iterator[None]:
+        self._conn.execute(f"BEGIN {mode}")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _current_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @staticmethod
+    def _summary(org_id: int, values: Sequence, extra: Optional[str]) -> Dict:
+        org = {"id": org_id, **_record(ORG_COLUMNS, values, extra)}
+        org["is_joined"] = bool(org.get("is_joined"))
+        org["is_branch"] = bool(org.get("is_branch"))
+        return org
+
+    def _details(self, org_id: int) -> Dict:
+        row = self._conn.execute(
+            f"SELECT {', '.join(ORG_COLUMNS)}, extra FROM organizations WHERE id = ?", (org_id,)).fetchone()
+        if row is None:
+            raise ValueError(f"organization {org_id} is no longer in {self.path}")
+        org = self._summary(org_id, row[:-1], row[-1])
+        org["events"] = [_record(EVENT_COLUMNS, row[:-1], row[-1]) for row in self._conn.execute(
+            f"SELECT {', '.join(EVENT_COLUMNS)}, extra FROM events WHERE org_id = ? ORDER BY seq", (org_id,))]
+        org["officers"] = [_record(OFFICER_COLUMNS, row[:-1], row[-1]) for row in self._conn.execute(
+            f"SELECT {', '.join(OFFICER_COLUMNS)}, extra FROM officers WHERE org_id = ? ORDER BY seq", (org_id,))]
+        org["members"] = self._conn.execute(
+            f"SELECT {', '.join(MEMBER_COLUMNS)} FROM members WHERE org_id = ? ORDER BY seq", (org_id,)).fetchall()
+        org["applicants"] = self._conn.execute(
+            f"SELECT {', '.join(APPLICANT_COLUMNS)} FROM applicants WHERE org_id = ? ORDER BY seq", (org_id,)).fetchall()
+        for semester, *row, extra in self._conn.execute(
+                f"SELECT semester, {', '.join(OFFICER_COLUMNS)}, extra FROM officer_history "
+                f"WHERE org_id = ? ORDER BY semester_seq, seq", (org_id,)):
+            org.setdefault("officer_history", {}).setdefault(semester, []).append(_record(OFFICER_COLUMNS, row, extra))
+        return org
+
+    def _save_org(self, org: Dict, parent_id: Optional[int], seq: int) -> None:
+        columns = ("id", "parent_id", "seq") + ORG_COLUMNS + ("extra",)
+        values = (org["id"], parent_id, seq) + tuple(
+            bool(org.get(column)) if column in ("is_joined", "is_branch") else org.get(column) for column in ORG_COLUMNS)
+        values += (_extra(org, columns + SECTIONS),)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        self._conn.execute(
+            f"INSERT INTO organizations ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}",
+            values,
+        )
+        compact(org)
+        # Branches and new organizations may have no members or applicants yet.
+        self._save_rows("members", MEMBER_COLUMNS, org["id"], org.get("members") or Roster(MEMBER_SCHEMA), MEMBER_ID)
+        self._save_rows("applicants", APPLICANT_COLUMNS, org["id"], org.get("applicants") or Roster(APPLICANT_SCHEMA), APPLICANT_ID)
+        self._replace("officers", OFFICER_COLUMNS, org["id"], org.get("officers", []))
+        self._replace("events", EVENT_COLUMNS, org["id"], org.get("events", []))
+        self._save_history(org)
+
+    def _save_rows(self, table: str, columns: Sequence[str], org_id: int, roster, id_col: int) -> None:
+        """Upsert a roster by id, touching only rows that changed, and delete rows no longer in it.
+
+        Rows keep the ``seq`` they were first saved with and new rows go after
+        the last one, so removing a member does not renumber the rest.
+        """
+        values = [column for column in columns if column != "id"]
+        changed = " OR ".join(f"{table}.{column} IS NOT excluded.{column}" for column in values)
+        self._conn.executemany(
+            f"INSERT INTO {table} (org_id, seq, {', '.join(columns)}) "
+            f"VALUES (?1, (SELECT COALESCE(MAX(seq), -1) + 1 FROM {table} WHERE org_id = ?1), "
+            f"{', '.join(f'?{i + 2}' for i in range(len(columns)))}) "
+            f"ON CONFLICT(org_id, id) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in values)} "
+            f"WHERE {changed}",
+            ((org_id, *row) for row in roster.rows()),
+        )
+        ids = [roster.key(row, id_col) for row in range(len(roster))]
+        self._conn.execute(
+            f"DELETE FROM {table} WHERE org_id = ? AND id NOT IN (SELECT value FROM json_each(?))",
+            (org_id, json.dumps(ids)),
+        )
+
+    def _replace(self, table: str, columns: Sequence[str], org_id: int, records: List[Dict]) -> None:
+        self._conn.execute(f"DELETE FROM {table} WHERE org_id = ?", (org_id,))
+        self._conn.executemany(
+            f"INSERT INTO {table} (org_id, seq, {', '.join(columns)}, extra) VALUES ({', '.join('?' * (len(columns) + 3))})",
+            ((org_id, seq, *(record.get(column) for column in columns), _extra(record, columns))
+             for seq, record in enumerate(records)),
+        )
+
+    def _save_history(self, org: Dict) -> None:
+        self._conn.execute("DELETE FROM officer_history WHERE org_id = ?", (org["id"],))
+        self._conn.executemany(
+            f"INSERT INTO officer_history (org_id, semester, semester_seq, seq, {', '.join(OFFICER_COLUMNS)}, extra) "
+            f"VALUES ({', '.join('?' * (len(OFFICER_COLUMNS) + 5))})",
+            ((org["id"], semester, semester_seq, seq, *(officer.get(column) for column in OFFICER_COLUMNS),
+              _extra(officer, OFFICER_COLUMNS))
+             for semester_seq, (semester, officers) in enumerate(org.get("officer_history", {}).items())
+             for seq, officer in enumerate(officers)),
+        )
+
+def migrate(data_path: str, db_path: str) -> int:
+    """Copy every organization in the JSON file at ``data_path`` into a new database at ``db_path``.
+
+    The database is built next to its final path and renamed into place, so
+    an interrupted migration leaves no half-filled database behind. Returns
+    the number of organizations and branches copied.
+    """
+    from frontend.utils.orgs_data.json_store import JsonStore
+
+    source = JsonStore(data_path)
+    organizations, pending = source.load()
+    for org_id in pending:
+        org = next(org for org in organizations if org["id"] == org_id)
+        org.update(source.load_details(org_id))
+    tmp_path = f"{db_path}.migrating"
+    for path in (tmp_path, f"{tmp_path}-wal", f"{tmp_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+    store = SQLiteStore(tmp_path)
+    try:
+        store.save(organizations, {org["id"] for org in organizations}, set())
+        store._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        store.close()
+    for path in (f"{db_path}-wal", f"{db_path}-shm"):
+        # Left over from a database being replaced with --force.
+        if os.path.exists(path):
+            os.remove(path)
+    os.replace(tmp_path, db_path)
+    return len(organizations) + sum(len(org.get("branches", [])) for org in organizations)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from frontend.utils.orgs_data.repository import DATA_PATH, DB_PATH
+
+    parser = argparse.ArgumentParser(description="Move the organizations JSON file into a SQLite database.")
+    parser.add_argument("--data", default=DATA_PATH, help="JSON data file to read (default: %(default)s)")
+    parser.add_argument("--db", default=DB_PATH, help="database to create (default: %(default)s)")
+    parser.add_argument("--force", action="store_true", help="replace the database if it already exists")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.db) and not args.force:
+        print(f"Error migrating: {args.db} already exists (use --force to replace it)")
+        return 1
+    try:
+        count = migrate(args.data, args.db)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Error migrating {args.data}: {str(e)}")
+        return 1
+    print(f"Migrated {count} organizations and branches to {args.db}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
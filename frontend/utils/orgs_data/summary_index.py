@@ -0,0 +1,149 @@
+"""Sidecar index that lets the organizations file be opened without parsing all of it.
+
+The index sits next to the data file (``organizations_data.json.index``) and
+holds, for each top-level organization, a summary without its heavy sections
+plus the byte span of the organization in the data file. It records the data
+file's size and mtime and is ignored once they no longer match, so a stale
+index only costs one full parse, after which it is rewritten.
+"""
+import json
+import os
+import re
+import stat as stat_module
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from frontend.utils.orgs_data.records import to_json
+
+INDEX_VERSION = 2
+
+# Sections left out of summaries and read from the data file on first use.
+HEAVY_SECTIONS = frozenset(("members", "applicants", "events", "officer_history"))
+
+# (size, mtime_ns) of the data file an index or set of spans describes.
+FileStat = Tuple[int, int]
+# Byte offset and length of one organization's JSON object in the data file.
+Span = Tuple[int, int]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+def index_path(data_path: str) -> str:
+    return f"{data_path}.index"
+
+def file_stat(path: str) -> Optional[FileStat]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def summarize(org: Dict) -> Dict:
+    """Return ``org`` and its branches without their heavy sections."""
+    summary = {key: value for key, value in org.items() if key not in HEAVY_SECTIONS}
+    if "branches" in summary:
+        summary["branches"] = [summarize(branch) for branch in summary["branches"]]
+    return summary
+
+def merge_details(summary: Dict, full: Dict) -> None:
+    """Fill ``summary`` in place from the fully parsed ``full``.
+
+    Keys already on the summary keep their in-memory value; the others are
+    taken from ``full`` in file order. Branch dicts are merged the same way,
+    so references held to the summary and its branches stay valid.
+    """
+    for branch, full_branch in zip(summary.get("branches", []), full.get("branches", [])):
+        merge_details(branch, full_branch)
+    merged = {key: summary[key] if key in summary else value for key, value in full.items()}
+    merged.update((key, value) for key, value in summary.items() if key not in merged)
+    summary.clear()
+    summary.update(merged)
+
+def scan_organizations(text: str) -> Tuple[List[Dict], Dict[int, Span]]:
+    """Parse a data file, also returning the byte span of each top-level organization.
+
+    ``text`` must be the file as read with ``newline=''``, so that its
+    characters map one to one onto the UTF-8 bytes of the file.
+    """
+    decoder = json.JSONDecoder()
+    organizations: List[Dict] = []
+    spans: Dict[int, Span] = {}
+    ascii_only = text.isascii()
+    # Running character -> byte offset conversion for files with non-ASCII text.
+    char_pos = byte_pos = 0
+
+    def skip(pos: int) -> int:
+        return _WHITESPACE.match(text, pos).end()
+
+    def expect(pos: int, char: str) -> int:
+        if text[pos:pos + 1] != char:
+            raise ValueError(f"Expecting '{char}' at char {pos}")
+        return skip(pos + 1)
+
+    def to_bytes(pos: int) -> int:
+        nonlocal char_pos, byte_pos
+        if ascii_only:
+            return pos
+        byte_pos += len(text[char_pos:pos].encode("utf-8"))
+        char_pos = pos
+        return byte_pos
+
+    pos = expect(skip(0), "{")
+    while text[pos:pos + 1] != "}":
+        key, pos = decoder.raw_decode(text, pos)
+        pos = expect(skip(pos), ":")
+        if key == "organizations":
+            pos = expect(pos, "[")
+            while text[pos:pos + 1] != "]":
+                org, end = decoder.raw_decode(text, pos)
+                start = to_bytes(pos)
+                organizations.append(org)
+                spans[org["id"]] = (start, to_bytes(end) - start)
+                pos = skip(end)
+                if text[pos:pos + 1] == ",":
+                    pos = skip(pos + 1)
+            pos += 1
+        else:
+            _value, pos = decoder.raw_decode(text, pos)
+        pos = skip(pos)
+        if text[pos:pos + 1] == ",":
+            pos = skip(pos + 1)
+    return organizations, spans
+
+def read_index(data_path: str, stat: Optional[FileStat]) -> Optional[List[Tuple[Dict, Span]]]:
+    """Return (summary, span) per organization, or None if there is no index for this version of the file."""
+    if stat is None:
+        return None
+    try:
+        with open(index_path(data_path), 'r', encoding='utf-8') as file:
+            index = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION or [index.get("size"), index.get("mtime_ns")] != list(stat):
+        return None
+    return [(entry["summary"], (entry["offset"], entry["length"])) for entry in index.get("organizations", [])]
+
+def write_index(data_path: str, organizations: List[Dict], spans: Dict[int, Span], stat: Optional[FileStat]) -> None:
+    """Write the index for ``organizations`` as found at ``spans`` in the file with ``stat``."""
+    if stat is None:
+        return
+    index = {
+        "version": INDEX_VERSION,
+        "size": stat[0],
+        "mtime_ns": stat[1],
+        "organizations": [
+            {"offset": spans[org["id"]][0], "length": spans[org["id"]][1], "summary": summarize(org)}
+            for org in organizations
+        ],
+    }
+    path = index_path(data_path)
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=".organizations_index_", suffix=".tmp", dir=os.path.dirname(path))
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(index, file, default=to_json)
+        os.chmod(tmp_path, stat_module.S_IMODE(os.stat(data_path).st_mode))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error saving {path}: {str(e)}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,232 @@
+"""Where the desktop windows spend their time between launch and first paint.
+
+Start a window with ``VHUB_TRACE_STARTUP=1`` or ``--trace-startup`` to trace
+its startup, or give a file to write the trace to with
+``VHUB_TRACE_STARTUP=startup.folded`` or ``--trace-startup=startup.folded``.
+Module imports, ``setupUi``, the first data load and everything else wrapped
+in ``span`` are recorded until the window first paints. The trace is written
+as collapsed stacks, one ``frame;frame;frame microseconds`` line per stack,
+which flamegraph.pl, speedscope and inferno read directly; a one-line summary
+goes to stderr.
+
+This module does not import PyQt6 until a window is watched, so the views
+install it before their own imports.
+"""
+import atexit
+import importlib.abc
+import importlib.machinery
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+ENV_VAR = "VHUB_TRACE_STARTUP"
+FLAG = "--trace-startup"
+ROOT = "startup"
+FILE_LOADERS = (importlib.machinery.SourceFileLoader, importlib.machinery.SourcelessFileLoader,
+                importlib.machinery.ExtensionFileLoader)
+
+class StartupTracer:
+    """Nested timing spans, kept as self time per stack.
+
+    Spans are only recorded on the main thread; imports and work on worker
+    threads run untraced.
+    """
+
+    def __init__(self, output: Optional[str] = None):
+        """``output`` is a file path, ``"-"`` for stderr, or None to keep the trace in memory only."""
+        self.output = output
+        self.origin = time.perf_counter()
+        self.finished = False
+        # Open spans as [name, start, time spent in child spans].
+        self._open: List[list] = [[ROOT, self.origin, 0.0]]
+        self.self_times: Dict[Tuple[str, ...], float] = defaultdict(float)
+        self.totals: Dict[str, float] = defaultdict(float)
+        self._import_hook = _ImportTimer(self)
+
+    def begin(self, name: str) -> None:
+        if not self.finished and _on_main_thread():
+            self._open.append([name, time.perf_counter(), 0.0])
+
+    def end(self, name: str) -> None:
+        """Close the innermost span, which must be ``name``."""
+        if self.finished or not _on_main_thread() or self._open[-1][0] != name:
+            return
+        stack = tuple(span[0] for span in self._open)
+        _name, start, children = self._open.pop()
+        elapsed = time.perf_counter() - start
+        self.self_times[stack] += elapsed - children
+        self.totals[name] += elapsed
+        self._open[-1][2] += elapsed
+
+    @contextmanager
+    def span(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    def finish(self) -> None:
+        """Stop tracing, close any spans left open and write the trace."""
+        if self.finished:
+            return
+        while len(self._open) > 1:
+            self.end(self._open[-1][0])
+        _name, start, children = self._open[0]
+        elapsed = time.perf_counter() - start
+        self.self_times[(ROOT,)] += elapsed - children
+        self.totals[ROOT] = elapsed
+        self.finished = True
+        self._import_hook.remove()
+        if self.output is not None:
+            self.write(self.output)
+            print(f"[startup] {self.summary()}", file=sys.stderr)
+
+    def phases_ms(self) -> Dict[str, float]:
+        """Total milliseconds per span name, with imports summed under ``import``."""
+        phases: Dict[str, float] = defaultdict(float)
+        for stack, seconds in self.self_times.items():
+            # Top-level imports only, so nested imports are not counted twice.
+            if len(stack) > 1 and stack[1].startswith("import "):
+                phases["import"] += seconds * 1000
+        for name, seconds in self.totals.items():
+            if not name.startswith("import "):
+                phases[name] = seconds * 1000
+        return dict(phases)
+
+    def summary(self) -> str:
+        phases = self.phases_ms()
+        total = phases.pop(ROOT, 0.0)
+        parts = [f"{name} {ms:.1f} ms" for name, ms in sorted(phases.items(), key=lambda item: -item[1])]
+        return f"{total:.1f} ms to first paint: " + ", ".join(parts)
+
+    def folded(self) -> List[str]:
+        """The trace as collapsed stacks in whole microseconds."""
+        return [f"{';'.join(stack)} {round(seconds * 1e6)}"
+                for stack, seconds in self.self_times.items() if round(seconds * 1e6) > 0]
+
+    def write(self, output: str) -> None:
+        lines = "\n".join(self.folded()) + "\n"
+        if output == "-":
+            sys.stderr.write(lines)
+            return
+        try:
+            with open(output, 'w', encoding='utf-8') as file:
+                file.write(lines)
+        except OSError as e:
+            print(f"Error writing startup trace {output}: {str(e)}")
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Times module loading by wrapping the loader of each module imported while tracing.
+
+    Extension modules such as PyQt6.QtWidgets do their work in ``create_module``
+    and Python modules in ``exec_module``, so both are timed under the same span.
+    """
+
+    def __init__(self, tracer: StartupTracer):
+        self.tracer = tracer
+        self._finding = False
+        sys.meta_path.insert(0, self)
+
+    def remove(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        if self._finding or not _on_main_thread():
+            return None
+        self._finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding = False
+        loader = spec.loader
+        # File loaders belong to one module; builtin, frozen and zip loaders are shared, so leave those alone.
+        if isinstance(loader, FILE_LOADERS):
+            name = f"import {fullname}"
+            create_module, exec_module = loader.create_module, loader.exec_module
+
+            def timed_create_module(spec):
+                with self.tracer.span(name):
+                    return create_module(spec)
+
+            def timed_exec_module(module):
+                with self.tracer.span(name):
+                    exec_module(module)
+
+            loader.create_module, loader.exec_module = timed_create_module, timed_exec_module
+        return spec
+
+_tracer: Optional[StartupTracer] = None
+
+def _on_main_thread() -> bool:
+    return threading.current_thread() is threading.main_thread()
+
+def _requested_output(argv: List[str]) -> Optional[str]:
+    """Return where the trace was asked to go by ``FLAG`` in ``argv`` or ``ENV_VAR``, removing the flag."""
+    for arg in list(argv[1:]):
+        if arg == FLAG or arg.startswith(FLAG + "="):
+            argv.remove(arg)
+            return arg.partition("=")[2] or "-"
+    value = os.environ.get(ENV_VAR, "")
+    if value in ("", "0"):
+        return None
+    return "-" if value == "1" else value
+
+def start(output: Optional[str] = None) -> StartupTracer:
+    """Start tracing now; the trace ends at the first paint of a watched window or at exit."""
+    global _tracer
+    if _tracer is None or _tracer.finished:
+        _tracer = StartupTracer(output)
+        atexit.register(_tracer.finish)
+    return _tracer
+
+def install(argv: Optional[List[str]] = None) -> Optional[StartupTracer]:
+    """Start tracing if ``ENV_VAR`` or ``FLAG`` asks for it; otherwise do nothing."""
+    output = _requested_output(sys.argv if argv is None else argv)
+    return start(output) if output is not None else None
+
+def tracer() -> Optional[StartupTracer]:
+    return _tracer
+
+def span(name: str):
+    """Time a block as ``name`` while a startup trace is running."""
+    if _tracer is None or _tracer.finished:
+        return nullcontext()
+    return _tracer.span(name)
+
+def finish_on_first_paint(widget) -> None:
+    """Time from now until ``widget`` first paints as ``first paint``, then end the trace."""
+    if _tracer is None or _tracer.finished:
+        return
+    from PyQt6 import QtCore
+
+    class FirstPaint(QtCore.QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QtCore.QEvent.Type.Paint:
+                watched.removeEventFilter(self)
+                self.deleteLater()
+                # Let this paint finish before the trace is closed.
+                QtCore.QTimer.singleShot(0, finish)
+            return False
+
+    def finish():
+        _tracer.end("first paint")
+        _tracer.finish()
+
+    _tracer.begin("first paint")
+    widget.installEventFilter(FirstPaint(widget))
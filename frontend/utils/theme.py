@@ -0,0 +1,47 @@
+"""Application-wide stylesheet for the Organizations module.
+
+The whole theme lives in one QSS file that is installed on the QApplication,
+so Qt parses it once instead of once per widget. Widgets pick their look
+with ``set_role`` (or an object name) rather than ``setStyleSheet``.
+"""
+import os
+from functools import lru_cache
+from typing import Optional
+
+from PyQt6 import QtCore, QtWidgets
+
+QSS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "assets", "qss", "organizations.qss"))
+
+@lru_cache(maxsize=None)
+def load_stylesheet(path: str = QSS_PATH) -> str:
+    """Return the contents of the theme file, or an empty sheet if it cannot be read."""
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read()
+    except OSError as e:
+        print(f"Error loading stylesheet {path}: {str(e)}")
+        return ""
+
+def install(app: Optional[QtWidgets.QApplication] = None, path: str = QSS_PATH) -> None:
+    """Add the theme to ``app`` (the running application by default); repeated calls are free.
+
+    Other views share the QApplication, so a stylesheet they set is kept and
+    the theme is appended after it.
+    """
+    app = app or QtWidgets.QApplication.instance()
+    if app is None:
+        return
+    stylesheet = load_stylesheet(path)
+    current = app.styleSheet()
+    if not stylesheet or stylesheet in current:
+        return
+    app.setStyleSheet(f"{current}\n{stylesheet}" if current else stylesheet)
+
+def set_role(widget: QtWidgets.QWidget, role: str) -> None:
+    """Give ``widget`` a theme role, re-polishing it if it was already styled."""
+    if widget.property("role") == role:
+        return
+    widget.setProperty("role", role)
+    if widget.testAttribute(QtCore.Qt.WidgetAttribute.WA_WState_Polished):
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
@@ -1,47 +1,40 @@
-from PyQt6 import QtWidgets, QtCore, QtGui
-from PyQt6.QtWidgets import QStyledItemDelegate, QHBoxLayout, QPushButton, QMessageBox, QFileDialog
 import sys
 import os
-import json
 import shutil
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
 
-from frontend.utils.orgs_custom_widgets.cards import JoinedOrgCard, EventCard, CollegeOrgCard, OfficerCard
+# Started before the imports below so they show up in the trace.
+from frontend.utils import startup_trace
+startup_trace.install()
+
+from PyQt6 import QtWidgets, QtCore, QtGui
+from PyQt6.QtWidgets import QMessageBox, QFileDialog
+from frontend.utils import asset_bundle, object_census, theme
+from frontend.utils.lazy_pages import LazyPages
+from frontend.utils.orgs_custom_widgets.card_pool import CardPool
+from frontend.utils.orgs_custom_widgets.cards import EventCard, OfficerCard
 from frontend.utils.orgs_custom_widgets.dialogs import OfficerDialog
-from frontend.utils.orgs_custom_widgets.tables import ViewMembers, ViewApplicants
+from frontend.utils.orgs_custom_widgets.image_loader import ImageLoader, placeholder
+from frontend.utils.orgs_custom_widgets.live_search import LiveSearch
+from frontend.utils.orgs_custom_widgets.org_grid import OrgCardView
+from frontend.utils.orgs_custom_widgets.tables import ActionDelegate, MemberFilterBar, MemberFilterProxy, ViewMembers, ViewApplicants
 from frontend.utils.orgs_custom_widgets.dialogs import EditMemberDialog
+from frontend.utils.orgs_data.repository import OrganizationRepository
+from frontend.utils.orgs_data.records import APPLICANT_ID, member_id
+from frontend.utils.orgs_data.persistence import OrganizationWriter
+from frontend.ui.org_details_ui import Ui_OrgDetailsPage
 from frontend.ui.org_main_ui import Ui_MainWindow
-
-class ActionDelegate(QStyledItemDelegate):
-    edit_clicked = QtCore.pyqtSignal(int)
-    kick_clicked = QtCore.pyqtSignal(int)
-
-    def createEditor(self, parent, option, index):
-        editor = QtWidgets.QWidget(parent)
-        layout = QHBoxLayout(editor)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-
-        edit_btn = QPushButton("Edit", editor)
-        edit_btn.clicked.connect(lambda: self.edit_clicked.emit(index.row()))
-        layout.addWidget(edit_btn)
-
-        kick_btn = QPushButton("Kick", editor)
-        kick_btn.clicked.connect(lambda: self.kick_clicked.emit(index.row()))
-        layout.addWidget(kick_btn)
-
-        return editor
-
-    def updateEditorGeometry(self, editor, option, index):
-        editor.setGeometry(option.rect)
+from frontend.ui.org_members_ui import Ui_OrgMembersPage
 
 class EditOrgDialog(QtWidgets.QDialog):
     def __init__(self, org_data: Dict, parent: QtWidgets.QMainWindow):
         super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
         self.org_data = org_data
         self.parent_window = parent
+        self.logo_path = org_data["logo_path"]
         self.setWindowTitle("Edit Organization/Branch Details")
         self.setFixedSize(600, 500)
 
@@ -91,225 +84,248 @@ class EditOrgDialog(QtWidgets.QDialog):
             self, "Select Logo Image", "", "Image Files (*.png *.jpg *.jpeg *.bmp)"
         )
         if file_path:
-            self.org_data["logo_path"] = file_path
+            self.logo_path = file_path
             self.parent_window.set_circular_logo(self.preview_label, file_path)
 
     def confirm(self):
-        self.org_data["brief"] = self.brief_edit.toPlainText()
-        self.org_data["description"] = self.desc_edit.toPlainText()
+        fields = {
+            "brief": self.brief_edit.toPlainText(),
+            "description": self.desc_edit.toPlainText(),
+            "logo_path": self.logo_path,
+        }
+        self.parent_window.apply_change("org.update", fields=fields)
 
-        self.parent_window.ui.brief_label.setText(self.org_data["brief"])
-        self.parent_window.ui.obj_label.setText(self.org_data["description"])
-        self.parent_window.set_circular_logo(self.parent_window.ui.logo, self.org_data["logo_path"])
-
-        self.parent_window.save_data()
+        self.parent_window.ui.brief_label.setText(fields["brief"])
+        self.parent_window.ui.obj_label.setText(fields["description"])
+        self.parent_window.set_circular_logo(self.parent_window.ui.logo, fields["logo_path"])
 
         self.accept()
 
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self, officer_name: str = "Ruben, Stephen Joseph"):
         super().__init__()
+        theme.install()
+        asset_bundle.register()
         self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
+        with startup_trace.span("setupUi"):
+            self.ui.setupUi(self)
         self.officer_name = officer_name
         self.joined_org_count: int = 0
         self.college_org_count: int = 0
         self.officer_count: int = 0
         self.manage_applicants_btn = None
+        self.bulk_applicant_btns: List[QtWidgets.QPushButton] = []
         self.is_managing: bool = False
         self.current_org: Optional[Dict] = None
+        self.showing_branches: bool = False
         self.edit_btn: Optional[QtWidgets.QPushButton] = None
-        self.table = self.findChild(QtWidgets.QTableView, "list_view")
+        self.table: Optional[QtWidgets.QTableView] = None
+        self.member_search: Optional[LiveSearch] = None
+        self.member_model = ViewMembers([], parent=self)
+        self.member_proxy = MemberFilterProxy(self.member_model, self)
+        for signal in (self.member_proxy.modelReset, self.member_proxy.rowsInserted, self.member_proxy.rowsRemoved):
+            signal.connect(self._on_member_rows_changed)
+        self.applicant_model = ViewApplicants([], parent=self)
+        self.writer = OrganizationWriter.for_repository(OrganizationRepository.instance())
+        # The details and members pages are built the first time they are opened.
+        self.pages = LazyPages(self.ui, self)
+        self.pages.add(1, Ui_OrgDetailsPage, self._setup_details_page)
+        self.pages.add(2, Ui_OrgMembersPage, self._setup_members_page)
         
+        self._setup_card_views()
         self._setup_connections()
-        self._setup_no_member_label()
-        self.load_orgs()
+        self.object_census = object_census.install(self)
+        with startup_trace.span("first data load"):
+            self.load_orgs()
 
     def _setup_connections(self) -> None:
         """Set up signal-slot connections."""
         self.ui.comboBox.currentIndexChanged.connect(self._on_combobox_changed)
+        self.ui.search_btn.clicked.connect(self._perform_search)
+
+        self.card_search = LiveSearch(self.ui.search_line, self._match_cards, self)
+        self.card_search.results_ready.connect(lambda _text, result: self._show_cards(*result))
+
+    def _setup_details_page(self) -> None:
+        """Set up the organization details page once it is built."""
+        self.officer_no_record_label = self._add_no_record_label(self.ui.officer_cards_grid)
+        self.officer_no_record_label.hide()
+        self.ui.verticalLayout_14.addStretch()
         self.ui.view_members_btn.clicked.connect(self._to_members_page)
-        self.ui.back_btn_member.clicked.connect(self._return_to_prev_page)
         self.ui.back_btn.clicked.connect(self._return_to_prev_page)
-        self.ui.search_btn.clicked.connect(self._perform_search)
-        self.ui.search_btn_3.clicked.connect(self._perform_member_search)
         self.ui.officer_history_dp.currentIndexChanged.connect(self._on_officer_history_changed)
 
+    def _setup_members_page(self) -> None:
+        """Set up the member table, its action buttons, filters and search once the members page is built."""
+        self.table = self.findChild(QtWidgets.QTableView, "list_view")
+        self.action_delegate = ActionDelegate(self.table)
+        self.action_delegate.action_clicked.connect(self._on_action_clicked)
+        self.table.setItemDelegate(self.action_delegate)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table.setSortingEnabled(True)
+        self.member_filters = MemberFilterBar(self.member_proxy, self.ui.search_container)
+        self.ui.horizontalLayout_9.insertWidget(0, self.member_filters)
+        self._setup_no_member_label()
+        self.ui.back_btn_member.clicked.connect(self._return_to_prev_page)
+        self.ui.search_btn_3.clicked.connect(self._perform_member_search)
+        self.member_search = LiveSearch(self.ui.search_line_3, self._filter_members, self)
+        self.member_search.results_ready.connect(lambda _text, members: self._show_members(members))
+
+    def _setup_card_views(self) -> None:
+        """Place virtualized card views in the joined and college organization grids."""
+        self.joined_org_view = OrgCardView(False, self._get_logo_path, self.ui.joined_org_scroll)
+        self.college_org_view = OrgCardView(True, self._get_logo_path, self.ui.college_org_scroll)
+        self.joined_no_record_label = self._add_no_record_label(self.ui.joined_org_grid)
+        self.college_no_record_label = self._add_no_record_label(self.ui.college_org_grid)
+        for view, grid_layout in ((self.joined_org_view, self.ui.joined_org_grid), (self.college_org_view, self.ui.college_org_grid)):
+            view.details_clicked.connect(self.show_org_details)
+            grid_layout.addWidget(view, 1, 0, 1, 5)
+
+        self.officer_pool = CardPool(self._create_officer_card)
+        self.event_pool = CardPool(self._create_event_card)
+
+    def _create_officer_card(self, slot: int) -> OfficerCard:
+        """Create the officer card for grid slot ``slot``; it is rebound on later refreshes."""
+        card = OfficerCard(None, self)
+        self.ui.officer_cards_grid.addWidget(card, slot // 3, slot % 3, alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
+        return card
+
+    def _create_event_card(self, slot: int) -> EventCard:
+        """Create the event card for list slot ``slot``, keeping the trailing stretch last."""
+        card = EventCard(None, self)
+        self.ui.verticalLayout_14.insertWidget(slot, card)
+        return card
+
     def _setup_no_member_label(self) -> None:
         """Initialize the 'No Record(s) Found' label for members."""
         self.no_member_label = QtWidgets.QLabel("No Record(s) Found", self.ui.list_container)
         self.no_member_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.no_member_label.setStyleSheet("font-size: 20px;")
+        theme.set_role(self.no_member_label, "empty-state")
         self.no_member_label.hide()
 
     @staticmethod
     def _get_logo_path(rel_path: str) -> str:
-        """Resolve absolute logo path, return relative path if file doesn't exist."""
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
-        abs_path = os.path.join(base_dir, rel_path)
-        return abs_path if os.path.exists(abs_path) else rel_path
+        """Resolve a logo path to its bundled resource, else its absolute path, else the path as given."""
+        return asset_bundle.resolve(rel_path)
 
     @staticmethod
     def _load_data() -> List[Dict]:
-        """Load organization and branch data from JSON file."""
-        json_path = os.path.join(os.path.dirname(__file__), 'organizations_data.json')
-        try:
-            with open(json_path, 'r') as file:
-                data = json.load(file)
-                return data.get('organizations', [])
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading {json_path}: {str(e)}")
-            return []
-
-    def save_data(self) -> None:
-        """Save updated organization data back to JSON file."""
-        organizations = self._load_data()
-        for org in organizations:
-            if org["id"] == self.current_org["id"]:
-                org["brief"] = self.current_org["brief"]
-                org["description"] = self.current_org["description"]
-                org["logo_path"] = self.current_org["logo_path"]
-                org["officers"] = self.current_org["officers"]
-                org["officer_history"] = self.current_org.get("officer_history", {})
-                org["members"] = self.current_org["members"]
-                org["applicants"] = self.current_org.get("applicants", [])
-                break
-
-        json_path = os.path.join(os.path.dirname(__file__), 'organizations_data.json')
-        try:
-            with open(json_path, 'w') as file:
-                json.dump({"organizations": organizations}, file, indent=4)
-        except Exception as e:
-            print(f"Error saving {json_path}: {str(e)}")
-
-    def _clear_grid(self, grid_layout: QtWidgets.QGridLayout) -> None:
-        """Remove all widgets from the given grid layout."""
-        for i in reversed(range(grid_layout.count())):
-            if widget := grid_layout.itemAt(i).widget():
-                widget.setParent(None)
-
-    def _add_no_record_label(self, grid_layout: QtWidgets.QGridLayout) -> None:
+        """Return organization and branch data from the shared in-memory repository."""
+        return OrganizationRepository.instance().organizations()
+
+    def apply_change(self, op: str, **data):
+        """Apply a ``mutations`` operation to the current organization now and queue it for a background write."""
+        repository = OrganizationRepository.instance()
+        org = repository.find(self.current_org["id"])
+        if org is not None and org is not self.current_org:
+            # The store changed since this org was opened; patch the fresh copy and edit that.
+            org["brief"] = self.current_org["brief"]
+            org["description"] = self.current_org["description"]
+            org["logo_path"] = self.current_org["logo_path"]
+            org["officers"] = self.current_org["officers"]
+            org["officer_history"] = self.current_org.get("officer_history", {})
+            org["members"] = self.current_org["members"]
+            org["applicants"] = self.current_org.get("applicants", [])
+            self.current_org = org
+        return self.writer.apply(self.current_org["id"], op, data)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        """Flush pending edits before the window closes."""
+        self.writer.flush()
+        super().closeEvent(event)
+
+    def _add_no_record_label(self, grid_layout: QtWidgets.QGridLayout) -> QtWidgets.QLabel:
         """Add 'No Record(s) Found' label to the grid layout."""
         no_record_label = QtWidgets.QLabel("No Record(s) Found")
         no_record_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        no_record_label.setStyleSheet("font-size: 20px;")
+        theme.set_role(no_record_label, "empty-state")
         grid_layout.addWidget(no_record_label, 0, 0, 1, 5)
-
-    def _update_scroll_areas(self) -> None:
-        """Update scroll areas and geometry."""
-        self.ui.joined_org_scrollable.adjustSize()
-        self.ui.college_org_scrollable.adjustSize()
-        self.ui.joined_org_scrollable.updateGeometry()
-        self.ui.college_org_scrollable.updateGeometry()
-        self.update()
+        return no_record_label
 
     def _perform_search(self) -> None:
         """Handle organization/branch search based on combo box selection."""
+        self.card_search.cancel()
         search_text = self.ui.search_line.text().strip().lower()
         self.load_orgs(search_text) if self.ui.comboBox.currentIndex() == 0 else self.load_branches(search_text)
 
     def _perform_member_search(self) -> None:
         """Handle member search based on input text."""
+        self.member_search.cancel()
         search_text = self.ui.search_line_3.text().strip().lower()
-        self.load_members(search_text)
+        self._show_members(self._filter_members(search_text))
 
     def load_orgs(self, search_text: str = "") -> None:
         """Load and display organizations, filtered by search text."""
-        organizations = self._load_data()
-        self._clear_grid(self.ui.joined_org_grid)
-        self._clear_grid(self.ui.college_org_grid)
-        self.joined_org_count = 0
-        self.college_org_count = 0
-
-        filtered_joined = [org for org in organizations if org["is_joined"] and not org["is_branch"] and (search_text in org["name"].lower() or not search_text)]
-        filtered_college = [org for org in organizations if not org["is_branch"] and (search_text in org["name"].lower() or not search_text)]
-
-        for org in filtered_joined:
-            self._add_joined_org(org)
-        for org in filtered_college:
-            self._add_college_org(org)
-
-        if self.joined_org_count == 0:
-            self._add_no_record_label(self.ui.joined_org_grid)
-        if self.college_org_count == 0:
-            self._add_no_record_label(self.ui.college_org_grid)
-
-        self._update_scroll_areas()
+        self._show_cards(*self._filter_orgs(search_text))
 
     def load_branches(self, search_text: str = "") -> None:
         """Load and display branches, filtered by search text."""
-        organizations = self._load_data()
-        self._clear_grid(self.ui.joined_org_grid)
-        self._clear_grid(self.ui.college_org_grid)
-        self.joined_org_count = 0
-        self.college_org_count = 0
-
+        self._show_cards(*self._filter_branches(search_text))
+
+    def _filter_orgs(self, search_text: str) -> Tuple[List[Dict], List[Dict]]:
+        """Return the joined and college organizations matching the search text."""
+        repository = OrganizationRepository.instance()
+        # Also runs on the live search worker; mutations change the index under this lock.
+        with repository.lock:
+            organizations = self._load_data()
+            matches = repository.org_index().search(search_text)
+            filtered_joined = [org for org in organizations if org["is_joined"] and not org["is_branch"] and org["id"] in matches]
+            filtered_college = [org for org in organizations if not org["is_branch"] and org["id"] in matches]
+        return filtered_joined, filtered_college
+
+    def _filter_branches(self, search_text: str) -> Tuple[List[Dict], List[Dict]]:
+        """Return the joined and college branches matching the search text."""
+        repository = OrganizationRepository.instance()
         filtered_joined_branches = []
         filtered_college_branches = []
 
-        for org in organizations:
-            for branch in org.get("branches", []):
-                if search_text in branch["name"].lower() or not search_text:
+        with repository.lock:
+            matches = repository.branch_index().search(search_text)
+            for branch in repository.branches():
+                if branch["id"] in matches:
                     if branch["is_joined"]:
                         filtered_joined_branches.append(branch)
                     filtered_college_branches.append(branch)
 
-        for branch in filtered_joined_branches:
-            self._add_joined_org(branch)
-        for branch in filtered_college_branches:
-            self._add_college_org(branch)
+        return filtered_joined_branches, filtered_college_branches
 
-        if self.joined_org_count == 0:
-            self._add_no_record_label(self.ui.joined_org_grid)
-        if self.college_org_count == 0:
-            self._add_no_record_label(self.ui.college_org_grid)
+    def _match_cards(self, search_text: str) -> Tuple[List[Dict], List[Dict]]:
+        """Filter organizations or branches for the live search; runs on a worker thread."""
+        return self._filter_branches(search_text) if self.showing_branches else self._filter_orgs(search_text)
 
-        self._update_scroll_areas()
+    def _show_cards(self, joined: List[Dict], college: List[Dict]) -> None:
+        """Show already filtered organizations or branches in both card views."""
+        self.joined_org_count = len(joined)
+        self.college_org_count = len(college)
+        for view, label, orgs in ((self.joined_org_view, self.joined_no_record_label, joined),
+                                  (self.college_org_view, self.college_no_record_label, college)):
+            view.set_orgs(orgs)
+            view.setVisible(bool(orgs))
+            label.setVisible(not orgs)
 
     def load_members(self, search_text: str = "") -> None:
-        """Load members into the table view, filtered by search text."""
+        """Load the current org's members into the table view, with action buttons when managing."""
         if not self.current_org:
             return
 
-        members = self.current_org.get("members", [])
-        filtered_members = [mem for mem in members if search_text in mem[0].lower() or not search_text]
-
-        model = ViewMembers(filtered_members, self.is_managing)
-        self.table.setModel(model)
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
-        self.table.verticalHeader().hide()
+        self._use_table_model(self.member_proxy)
+        self.member_model.set_records(OrganizationRepository.instance().records(self.current_org).members, self.is_managing)
 
         # Remove existing Manage Applicants button if present
         if self.manage_applicants_btn:
             self.ui.verticalLayout_16.removeWidget(self.manage_applicants_btn)
             self.manage_applicants_btn.deleteLater()
             self.manage_applicants_btn = None
+            for button in self.bulk_applicant_btns:
+                button.deleteLater()
+            self.bulk_applicant_btns = []
             # Restore original header layout
             self.ui.verticalLayout_16.removeItem(self.ui.verticalLayout_16.itemAt(0))  # Remove header_hlayout
             self.ui.verticalLayout_16.insertWidget(0, self.ui.label_2)
             self.ui.verticalLayout_16.addWidget(self.ui.line_5)
 
         if self.is_managing:
-            for row in range(len(filtered_members)):
-                action_widget = QtWidgets.QWidget()
-                hlayout = QtWidgets.QHBoxLayout(action_widget)
-                hlayout.setContentsMargins(5, 5, 5, 5)
-                hlayout.setSpacing(5)
-
-                edit_btn = QtWidgets.QPushButton("Edit")
-                edit_btn.setStyleSheet("background-color: green; color: white; border-radius: 5px;")
-                edit_btn.clicked.connect(lambda checked, r=row: self.edit_member(r))
-
-                kick_btn = QtWidgets.QPushButton("Kick")
-                kick_btn.setStyleSheet("background-color: red; color: white; border-radius: 5px;")
-                kick_btn.clicked.connect(lambda checked, r=row: self.kick_member(r))
-
-                hlayout.addWidget(edit_btn)
-                hlayout.addWidget(kick_btn)
-
-                self.table.setIndexWidget(model.index(row, model.columnCount() - 1), action_widget)
-
             # Add Manage Applicants button only if user is an officer
             self.ui.verticalLayout_16.removeWidget(self.ui.label_2)
             self.ui.verticalLayout_16.removeWidget(self.ui.line_5)
@@ -318,158 +334,178 @@ class MainWindow(QtWidgets.QMainWindow):
             header_hlayout.addWidget(self.ui.label_2)
             header_hlayout.addStretch()
             self.manage_applicants_btn = QtWidgets.QPushButton("Manage Applicants")
-            self.manage_applicants_btn.setStyleSheet("background-color: #084924; color: white; border-radius: 5px;")
+            theme.set_role(self.manage_applicants_btn, "primary")
             self.manage_applicants_btn.clicked.connect(self.manage_applicants)
             header_hlayout.addWidget(self.manage_applicants_btn)
+            # Bulk actions on the selected applicants, shown on the applicant list
+            for text, role, handler in (("Accept Selected", "success", self.accept_applicants), ("Decline Selected", "danger", self.decline_applicants)):
+                button = QtWidgets.QPushButton(text)
+                theme.set_role(button, role)
+                button.clicked.connect(lambda _checked, handler=handler: handler(self._selected_rows()))
+                button.hide()
+                header_hlayout.addWidget(button)
+                self.bulk_applicant_btns.append(button)
             self.ui.verticalLayout_16.insertLayout(0, header_hlayout)
             self.ui.verticalLayout_16.addWidget(self.ui.line_5)
 
-        if not filtered_members:
-            self.table.hide()
-            self.no_member_label.show()
-        else:
-            self.table.show()
-            self.no_member_label.hide()
+        self._show_members(self._filter_members(search_text))
 
-    def manage_applicants(self):
-        """Load applicants into the table view with action buttons."""
-        if not self.current_org:
-            return
+    def _filter_members(self, search_text: str) -> Optional[Set[int]]:
+        """Return the ids of members whose name contains the search text, or None for all; runs on a worker thread."""
+        if not self.current_org or not search_text:
+            return None
+        repository = OrganizationRepository.instance()
+        with repository.lock:
+            return repository.member_index(self.current_org).search(search_text, fields=("name",))
+
+    def _show_members(self, matches: Optional[Set[int]]) -> None:
+        """Narrow the member table to the search matches, keeping its sort and filters."""
+        self.member_proxy.set_matches(matches)
 
-        applicants = self.current_org.get("applicants", [])
+    def _on_member_rows_changed(self, *_args) -> None:
+        """Swap between the member table and the empty label as filters change the shown rows."""
+        if self.table is not None and self.table.model() is self.member_proxy:
+            self._show_table(self.member_proxy.rowCount() > 0)
 
-        model = ViewApplicants(applicants)
+    def _use_table_model(self, model: QtCore.QAbstractTableModel) -> None:
+        """Show ``model`` in the member table unless it is already shown."""
+        if self.table.model() is model:
+            return
+        old_selection = self.table.selectionModel()
         self.table.setModel(model)
+        if old_selection is not None:
+            # setModel() makes a new selection model but leaves the old one to the caller.
+            old_selection.deleteLater()
+        self.table.selectionModel().selectionChanged.connect(self._update_bulk_applicant_btns)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
         self.table.verticalHeader().hide()
 
-        for row in range(len(applicants)):
-            action_widget = QtWidgets.QWidget()
-            hlayout = QtWidgets.QHBoxLayout(action_widget)
-            hlayout.setContentsMargins(5, 5, 5, 5)
-            hlayout.setSpacing(5)
+    def _show_table(self, has_rows: bool) -> None:
+        """Show the table, or the 'No Record(s) Found' label when it has no rows."""
+        self.table.setVisible(has_rows)
+        self.no_member_label.setVisible(not has_rows)
 
-            details_btn = QtWidgets.QPushButton("Details")
-            details_btn.setStyleSheet("background-color: #FFD700; color: black; border-radius: 5px;")
-
-            accept_btn = QtWidgets.QPushButton("Accept")
-            accept_btn.setStyleSheet("background-color: green; color: white; border-radius: 5px;")
-            accept_btn.clicked.connect(lambda checked, r=row: self.accept_applicant(r))
-
-            decline_btn = QtWidgets.QPushButton("Decline")
-            decline_btn.setStyleSheet("background-color: red; color: white; border-radius: 5px;")
-            decline_btn.clicked.connect(lambda checked, r=row: self.decline_applicant(r))
+    def manage_applicants(self):
+        """Load applicants into the table view with action buttons."""
+        if not self.current_org:
+            return
 
-            hlayout.addWidget(details_btn)
-            hlayout.addWidget(accept_btn)
-            hlayout.addWidget(decline_btn)
+        applicants = OrganizationRepository.instance().records(self.current_org).applicants
 
-            self.table.setIndexWidget(model.index(row, model.columnCount() - 1), action_widget)
+        self.applicant_model.set_records(applicants)
+        self._use_table_model(self.applicant_model)
 
         self.ui.label_2.setText("Applicant List")
         self.ui.stacked_widget.setCurrentIndex(2)
-        self.no_member_label.setVisible(not applicants)
+        self._show_table(bool(applicants))
+        for button in self.bulk_applicant_btns:
+            button.show()
+        self._update_bulk_applicant_btns()
+
+    def _selected_rows(self) -> List[int]:
+        """Return the selected table rows in ascending order."""
+        return sorted(index.row() for index in self.table.selectionModel().selectedRows())
+
+    def _update_bulk_applicant_btns(self) -> None:
+        """Enable the bulk applicant buttons only while applicants are selected."""
+        has_selection = self.table.model() is self.applicant_model and self.table.selectionModel().hasSelection()
+        for button in self.bulk_applicant_btns:
+            button.setEnabled(has_selection)
+
+    def _on_action_clicked(self, action: str, row: int) -> None:
+        """Dispatch a click on a painted Actions button to its handler."""
+        handler = {
+            "edit": self.edit_member,
+            "kick": self.kick_member,
+            "accept": self.accept_applicant,
+            "decline": self.decline_applicant,
+        }.get(action)
+        if handler:
+            handler(row)
 
     def accept_applicant(self, row: int):
         """Confirm and move applicant to members list."""
-        applicant = self.current_org["applicants"][row]
-        confirm = QtWidgets.QMessageBox.question(
-            self,
-            "Confirm Accept",
-            f"Are you sure you want to accept {applicant[0]} as a member?",
-            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
-        )
-        if confirm == QtWidgets.QMessageBox.StandardButton.Yes:
-            # Remove from applicants
-            self.current_org["applicants"].pop(row)
-            # Add to members with default status + join date
-            self.current_org["members"].append([
-                applicant[0], applicant[1], "Active",
-                QtCore.QDate.currentDate().toString("yyyy-MM-dd")
-            ])
-            self.save_data()
-            self.manage_applicants()
+        self.accept_applicants([row])
 
     def decline_applicant(self, row: int):
         """Confirm and remove applicant from list."""
-        applicant = self.current_org["applicants"][row]
-        confirm = QtWidgets.QMessageBox.question(
-            self,
-            "Confirm Decline",
-            f"Are you sure you want to decline {applicant[0]}'s application?",
-            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
+        self.decline_applicants([row])
+
+    def accept_applicants(self, rows: List[int]) -> None:
+        """Confirm once, then move the applicants at ``rows`` to the members list with one save."""
+        record_ids = self._confirm_applicants(
+            rows, "Confirm Accept",
+            "Are you sure you want to accept {} as a member?",
+            "Are you sure you want to accept {} applicants as members?"
+        )
+        if not record_ids:
+            return
+        # Members join as active, today, keeping their applicant ids
+        join_date = QtCore.QDate.currentDate().toString("yyyy-MM-dd")
+        members = self.member_model.roster()
+        first = len(members)
+        self.apply_change("applicants.accept", ids=record_ids, join_date=join_date)
+        # The member model reads the roster the new members were appended to.
+        if members is OrganizationRepository.instance().records(self.current_org).members:
+            self.member_model.insert_rows(first, len(members) - first)
+        self._applicants_removed(rows)
+
+    def decline_applicants(self, rows: List[int]) -> None:
+        """Confirm once, then remove the applicants at ``rows`` with one save."""
+        record_ids = self._confirm_applicants(
+            rows, "Confirm Decline",
+            "Are you sure you want to decline {}'s application?",
+            "Are you sure you want to decline {} applications?"
         )
-        if confirm == QtWidgets.QMessageBox.StandardButton.Yes:
-            self.current_org["applicants"].pop(row)
-            self.save_data()
-            self.manage_applicants()
+        if not record_ids:
+            return
+        self.apply_change("applicants.decline", ids=record_ids)
+        self._applicants_removed(rows)
+
+    def _confirm_applicants(self, rows: List[int], title: str, one: str, many: str) -> List[int]:
+        """Ask once about the applicants at ``rows`` and return their ids, or an empty list if declined."""
+        applicants = self.applicant_model.roster()
+        rows = [row for row in rows if row < len(applicants)]
+        if not self.current_org or not rows:
+            return []
+        text = one.format(applicants.value(rows[0], 0)) if len(rows) == 1 else many.format(len(rows))
+        confirm = QMessageBox.question(self, title, text, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if confirm != QMessageBox.StandardButton.Yes:
+            return []
+        return [applicants.key(row, APPLICANT_ID) for row in rows]
+
+    def _applicants_removed(self, rows: List[int]) -> None:
+        """Drop the handled rows from the applicant table in one update."""
+        self.applicant_model.remove_rows(rows)
+        self._show_table(self.applicant_model.rowCount() > 0)
+        self._update_bulk_applicant_btns()
 
     def _on_combobox_changed(self, index: int) -> None:
         """Handle combo box change to switch between organizations and branches."""
+        self.card_search.cancel()
+        self.showing_branches = index != 0
         self.ui.joined_label.setText("Joined Organization(s)" if index == 0 else "Joined Branch(es)")
         self.ui.college_label.setText("College Organization(s)" if index == 0 else "College Branch(es)")
         self.load_orgs() if index == 0 else self.load_branches()
-        self.ui.joined_org_scrollable.verticalScrollBar().setValue(0)
-        self.ui.college_org_scrollable.verticalScrollBar().setValue(0)
-
-    def _add_joined_org(self, org_data: Dict) -> None:
-        """Add a joined organization card to the grid."""
-        card = JoinedOrgCard(self._get_logo_path(org_data["logo_path"]), org_data["details"], org_data, self)
-        col = self.joined_org_count % 5
-        row = self.joined_org_count // 5
-        self.ui.joined_org_grid.addWidget(card, row, col, alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
-        self.joined_org_count += 1
-        self.ui.joined_org_grid.setRowMinimumHeight(row, 300)
-
-    def _add_college_org(self, org_data: Dict) -> None:
-        """Add a college organization card to the grid."""
-        card = CollegeOrgCard(
-            self._get_logo_path(org_data["logo_path"]), org_data["description"],
-            org_data["details"], org_data, self
-        )
-        col = self.college_org_count % 5
-        row = self.college_org_count // 5
-        self.ui.college_org_grid.addWidget(card, row, col, alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
-        self.college_org_count += 1
-        self.ui.college_org_grid.setRowMinimumHeight(row, 300)
+        self.joined_org_view.scrollToTop()
+        self.college_org_view.scrollToTop()
 
     def set_circular_logo(self, logo_label: QtWidgets.QLabel, logo_path: str, size: int = 200, border_width: int = 4) -> None:
         """Set a circular logo with a border on the given label."""
         logo_label.setFixedSize(size, size)
-        if logo_path == "No Photo" or QtGui.QPixmap(logo_path).isNull():
-            logo_label.setText("No Logo")
-            return
 
-        pixmap = QtGui.QPixmap(logo_path).scaled(size, size, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
-        centered_pixmap = QtGui.QPixmap(size, size)
-        centered_pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-        
-        with QtGui.QPainter(centered_pixmap) as painter:
-            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-            x = (size - pixmap.width()) // 2
-            y = (size - pixmap.height()) // 2
-            painter.drawPixmap(x, y, pixmap)
-
-        mask = QtGui.QPixmap(size, size)
-        mask.fill(QtCore.Qt.GlobalColor.transparent)
-        with QtGui.QPainter(mask) as painter:
-            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-            path = QtGui.QPainterPath()
-            path.addEllipse(0, 0, size, size)
-            painter.fillPath(path, QtCore.Qt.GlobalColor.white)
-
-        centered_pixmap.setMask(mask.createMaskFromColor(QtCore.Qt.GlobalColor.white, QtCore.Qt.MaskMode.MaskOutColor))
-
-        final_pixmap = QtGui.QPixmap(size, size)
-        final_pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-        with QtGui.QPainter(final_pixmap) as painter:
-            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-            painter.setBrush(QtGui.QBrush(centered_pixmap))
-            painter.setPen(QtGui.QPen(QtGui.QColor(8, 73, 36), border_width))
-            painter.drawEllipse(border_width // 2, border_width // 2, size - border_width, size - border_width)
-
-        logo_label.setPixmap(final_pixmap)
+        def show(pixmap: QtGui.QPixmap) -> None:
+            if pixmap.isNull():
+                logo_label.setText("No Logo")
+            else:
+                logo_label.setPixmap(pixmap)
+
+        pixmap = ImageLoader.instance().request_avatar(logo_label, logo_path, size, border_width, show)
+        if pixmap is None:
+            logo_label.setPixmap(placeholder(size, size, radius=size / 2))
+        else:
+            show(pixmap)
 
     def _on_officer_history_changed(self, index: int) -> None:
         """Handle officer history combobox change to display officers for selected semester."""
@@ -480,37 +516,23 @@ class MainWindow(QtWidgets.QMainWindow):
         self.load_officers(officers)
 
     def load_officers(self, officers: List[Dict]) -> None:
-        """Load officer cards into the officer grid."""
-        self._clear_grid(self.ui.officer_cards_grid)
-        self.officer_count = 0
+        """Bind officers to the pooled officer cards, creating cards only when the grid grows."""
         self.ui.officers_scroll_area.verticalScrollBar().setValue(0)
+        self.officer_no_record_label.setVisible(not officers)
+        self.officer_pool.show(officers)
+        self.officer_count = len(officers)
 
-        if not officers:
-            self._add_no_record_label(self.ui.officer_cards_grid)
-            return
-
-        for officer in officers:
-            card = OfficerCard(officer, self)
-            col = self.officer_count % 3
-            row = self.officer_count // 3
-            self.ui.officer_cards_grid.addWidget(card, row, col, alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
-            self.officer_count += 1
-            self.ui.officer_cards_grid.setRowMinimumHeight(row, 400)
+        used_rows = (self.officer_count + 2) // 3
+        for row in range((len(self.officer_pool) + 2) // 3):
+            self.ui.officer_cards_grid.setRowMinimumHeight(row, 400 if row < used_rows else 0)
 
     def show_officer_dialog(self, officer_data: Dict) -> None:
         """Display officer details in a dialog."""
         OfficerDialog(officer_data, self).exec()
 
     def load_events(self, events: List[Dict]) -> None:
-        """Load event cards into the events layout."""
-        while self.ui.verticalLayout_14.count():
-            if item := self.ui.verticalLayout_14.takeAt(0).widget():
-                item.deleteLater()
-
-        for event in events:
-            self.ui.verticalLayout_14.addWidget(EventCard(event, self))
-
-        self.ui.verticalLayout_14.addStretch()
+        """Bind events to the pooled event cards, creating cards only when the list grows."""
+        self.event_pool.show(events)
         self.ui.scroll_area_events.verticalScrollBar().setValue(0)
 
     def open_edit_dialog(self):
@@ -521,7 +543,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def show_org_details(self, org_data: Dict) -> None:
         """Display organization details on the details page."""
+        # Summaries are loaded up front; members, events and officer history on first open.
+        org_data = OrganizationRepository.instance().load_details(org_data)
         self.current_org = org_data
+        self.pages.ensure(1)
+        if self.member_search:
+            self.member_search.cancel()
 
         # Remove existing edit button if present
         if self.edit_btn:
@@ -545,6 +572,9 @@ class MainWindow(QtWidgets.QMainWindow):
         
         self.load_officers(org_data.get("officers", []))
         self.load_events(org_data.get("events", []))
+        for officer in org_data.get("officers", []):
+            # Officer dialogs show a 150px avatar; render it before the dialog is opened.
+            ImageLoader.instance().prefetch_avatar(self, officer.get("photo_path", "No Photo"), 150, 4)
         self.ui.label.setText("A.Y. 2025-2026 - 1st Semester")
 
         # Officer check: Add edit button if user is an officer
@@ -566,6 +596,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _to_members_page(self) -> None:
         """Navigate to the members page."""
+        self.pages.ensure(2)
         self.load_members()
         self.ui.stacked_widget.setCurrentIndex(2)
 
@@ -585,20 +616,8 @@ class MainWindow(QtWidgets.QMainWindow):
         """Update the officer data in the current organization and save."""
         if not self.current_org:
             return
-        # Update current officers
-        if "officers" in self.current_org:
-            for i, off in enumerate(self.current_org["officers"]):
-                if off["name"] == updated_officer["name"]:
-                    self.current_org["officers"][i] = updated_officer
-                    break
-        # Update in officer history if present
-        if "officer_history" in self.current_org:
-            for semester, offs in self.current_org["officer_history"].items():
-                for i, off in enumerate(offs):
-                    if off["name"] == updated_officer["name"]:
-                        self.current_org["officer_history"][semester][i] = updated_officer
-                        break
-        self.save_data()
+        # Every listing of this officer (current and past semesters) shares its id
+        self.apply_change("officer.update", officer=dict(updated_officer))
         # Refresh officers display
         current_index = self.ui.officer_history_dp.currentIndex()
         selected_semester = self.ui.officer_history_dp.itemText(current_index)
@@ -607,60 +626,45 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def edit_member(self, row: int) -> None:
         """Open dialog to edit member's position."""
-        if not self.current_org:
+        if not self.current_org or row >= self.member_proxy.rowCount():
             return
-        # Get filtered members based on current search text
-        search_text = self.ui.search_line_3.text().strip().lower()
-        members = self.current_org.get("members", [])
-        filtered_members = [mem for mem in members if search_text in mem[0].lower() or not search_text]
-        
-        if row >= len(filtered_members):
-            return
-        
-        # Map filtered member back to original member index
-        filtered_member = filtered_members[row]
-        original_index = next((i for i, mem in enumerate(members) if mem[0] == filtered_member[0]), None)
-        
-        if original_index is None:
+
+        # Map the shown row back to the source row; the member's id finds its record
+        source_row = self.member_proxy.source_row(row)
+        member = OrganizationRepository.instance().records(self.current_org).member(member_id(self.member_model.record(source_row)))
+        if member is None:
             return
-        
-        member = self.current_org["members"][original_index]
+
         dialog = EditMemberDialog(member, self)
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
-            new_position = dialog.updated_position
-            self.current_org["members"][original_index][1] = new_position
-            self.save_data()
-            self.load_members(self.ui.search_line_3.text().strip().lower())
+            self.apply_change("member.update", id=member_id(member), position=dialog.updated_position)
+            self.member_model.update_row(source_row)
 
     def kick_member(self, row: int) -> None:
         """Remove a member from the organization."""
-        if not self.current_org:
-            return
-        search_text = self.ui.search_line_3.text().strip().lower()
-        members = self.current_org.get("members", [])
-        filtered_members = [mem for mem in members if search_text in mem[0].lower() or not search_text]
-        
-        if row >= len(filtered_members):
+        if not self.current_org or row >= self.member_proxy.rowCount():
             return
-        
-        filtered_member = filtered_members[row]
-        original_index = next((i for i, mem in enumerate(members) if mem[0] == filtered_member[0]), None)
-        
-        if original_index is None:
-            return
-        
+
+        source_row = self.member_proxy.source_row(row)
+        member = self.member_model.record(source_row)
         confirm = QMessageBox.question(
             self, "Confirm Kick",
-            f"Are you sure you want to kick {members[original_index][0]}?",
+            f"Are you sure you want to kick {member[0]}?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if confirm == QMessageBox.StandardButton.Yes:
-            del self.current_org["members"][original_index]
-            self.save_data()
-            self.load_members(search_text)
+            record_id = member_id(member)
+            source_row = OrganizationRepository.instance().records(self.current_org).members.row_of(record_id)
+            if source_row is None:
+                return
+            self.apply_change("member.remove", id=record_id)
+            self.member_model.remove_row(source_row)
 
 if __name__ == "__main__":
-    app = QtWidgets.QApplication(sys.argv)
-    window = MainWindow()
+    with startup_trace.span("QApplication"):
+        app = QtWidgets.QApplication(sys.argv)
+    with startup_trace.span("build window"):
+        window = MainWindow()
+    startup_trace.finish_on_first_paint(window)
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
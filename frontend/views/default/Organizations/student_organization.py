@@ -1,235 +1,253 @@
-from PyQt6 import QtWidgets, QtCore, QtGui
 import sys
 import os
-import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
 
-from frontend.utils.orgs_custom_widgets.cards import JoinedOrgCard, EventCard, CollegeOrgCard, OfficerCard
+# Started before the imports below so they show up in the trace.
+from frontend.utils import startup_trace
+startup_trace.install()
+
+from PyQt6 import QtWidgets, QtCore, QtGui
+from frontend.utils import asset_bundle, object_census, theme
+from frontend.utils.lazy_pages import LazyPages
+from frontend.utils.orgs_custom_widgets.card_pool import CardPool
+from frontend.utils.orgs_custom_widgets.cards import EventCard, OfficerCard
 from frontend.utils.orgs_custom_widgets.dialogs import OfficerDialog
-from frontend.utils.orgs_custom_widgets.tables import ViewMembers
+from frontend.utils.orgs_custom_widgets.image_loader import ImageLoader, placeholder
+from frontend.utils.orgs_custom_widgets.live_search import LiveSearch
+from frontend.utils.orgs_custom_widgets.org_grid import OrgCardView
+from frontend.utils.orgs_custom_widgets.tables import MemberFilterBar, MemberFilterProxy, ViewMembers
+from frontend.utils.orgs_data.repository import OrganizationRepository
+from frontend.ui.org_details_ui import Ui_OrgDetailsPage
 from frontend.ui.org_main_ui import Ui_MainWindow
+from frontend.ui.org_members_ui import Ui_OrgMembersPage
 
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
+        theme.install()
+        asset_bundle.register()
         self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
+        with startup_trace.span("setupUi"):
+            self.ui.setupUi(self)
         self.joined_org_count: int = 0
         self.college_org_count: int = 0
         self.officer_count: int = 0
         self.current_org: Optional[Dict] = None
-        self.table = self.findChild(QtWidgets.QTableView, "list_view")
+        self.showing_branches: bool = False
+        self.table: Optional[QtWidgets.QTableView] = None
+        self.member_search: Optional[LiveSearch] = None
+        self.member_model = ViewMembers([], parent=self)
+        self.member_proxy = MemberFilterProxy(self.member_model, self)
+        for signal in (self.member_proxy.modelReset, self.member_proxy.rowsInserted, self.member_proxy.rowsRemoved):
+            signal.connect(self._on_member_rows_changed)
+        # The details and members pages are built the first time they are opened.
+        self.pages = LazyPages(self.ui, self)
+        self.pages.add(1, Ui_OrgDetailsPage, self._setup_details_page)
+        self.pages.add(2, Ui_OrgMembersPage, self._setup_members_page)
         
+        self._setup_card_views()
         self._setup_connections()
-        self._setup_no_member_label()
-        self.load_orgs()
+        self.object_census = object_census.install(self)
+        with startup_trace.span("first data load"):
+            self.load_orgs()
 
     def _setup_connections(self) -> None:
         """Set up signal-slot connections."""
         self.ui.comboBox.currentIndexChanged.connect(self._on_combobox_changed)
+        self.ui.search_btn.clicked.connect(self._perform_search)
+
+        self.card_search = LiveSearch(self.ui.search_line, self._match_cards, self)
+        self.card_search.results_ready.connect(lambda _text, result: self._show_cards(*result))
+
+    def _setup_details_page(self) -> None:
+        """Set up the organization details page once it is built."""
+        self.officer_no_record_label = self._add_no_record_label(self.ui.officer_cards_grid)
+        self.officer_no_record_label.hide()
+        self.ui.verticalLayout_14.addStretch()
         self.ui.view_members_btn.clicked.connect(self._to_members_page)
-        self.ui.back_btn_member.clicked.connect(self._return_to_prev_page)
         self.ui.back_btn.clicked.connect(self._return_to_prev_page)
-        self.ui.search_btn.clicked.connect(self._perform_search)
-        self.ui.search_btn_3.clicked.connect(self._perform_member_search)
         self.ui.officer_history_dp.currentIndexChanged.connect(self._on_officer_history_changed)
 
+    def _setup_members_page(self) -> None:
+        """Set up the member table, filters and search once the members page is built."""
+        self.table = self.findChild(QtWidgets.QTableView, "list_view")
+        self.table.setModel(self.member_proxy)
+        self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
+        self.member_filters = MemberFilterBar(self.member_proxy, self.ui.search_container)
+        self.ui.horizontalLayout_9.insertWidget(0, self.member_filters)
+        self._setup_no_member_label()
+        self.ui.back_btn_member.clicked.connect(self._return_to_prev_page)
+        self.ui.search_btn_3.clicked.connect(self._perform_member_search)
+        self.member_search = LiveSearch(self.ui.search_line_3, self._filter_members, self)
+        self.member_search.results_ready.connect(lambda _text, members: self._show_members(members))
+
+    def _setup_card_views(self) -> None:
+        """Place virtualized card views in the joined and college organization grids."""
+        self.joined_org_view = OrgCardView(False, self._get_logo_path, self.ui.joined_org_scroll)
+        self.college_org_view = OrgCardView(True, self._get_logo_path, self.ui.college_org_scroll)
+        self.joined_no_record_label = self._add_no_record_label(self.ui.joined_org_grid)
+        self.college_no_record_label = self._add_no_record_label(self.ui.college_org_grid)
+        for view, grid_layout in ((self.joined_org_view, self.ui.joined_org_grid), (self.college_org_view, self.ui.college_org_grid)):
+            view.details_clicked.connect(self.show_org_details)
+            grid_layout.addWidget(view, 1, 0, 1, 5)
+
+        self.officer_pool = CardPool(self._create_officer_card)
+        self.event_pool = CardPool(self._create_event_card)
+
+    def _create_officer_card(self, slot: int) -> OfficerCard:
+        """Create the officer card for grid slot ``slot``; it is rebound on later refreshes."""
+        card = OfficerCard(None, self)
+        self.ui.officer_cards_grid.addWidget(card, slot // 3, slot % 3, alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
+        return card
+
+    def _create_event_card(self, slot: int) -> EventCard:
+        """Create the event card for list slot ``slot``, keeping the trailing stretch last."""
+        card = EventCard(None, self)
+        self.ui.verticalLayout_14.insertWidget(slot, card)
+        return card
+
     def _setup_no_member_label(self) -> None:
         """Initialize the 'No Record(s) Found' label for members."""
         self.no_member_label = QtWidgets.QLabel("No Record(s) Found", self.ui.list_container)
         self.no_member_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.no_member_label.setStyleSheet("font-size: 20px;")
+        theme.set_role(self.no_member_label, "empty-state")
         self.no_member_label.hide()
 
     @staticmethod
     def _get_logo_path(rel_path: str) -> str:
-        """Resolve absolute logo path, return relative path if file doesn't exist."""
-        base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
-        abs_path = os.path.join(base_dir, rel_path)
-        return abs_path if os.path.exists(abs_path) else rel_path
+        """Resolve a logo path to its bundled resource, else its absolute path, else the path as given."""
+        return asset_bundle.resolve(rel_path)
 
     @staticmethod
     def _load_data() -> List[Dict]:
-        """Load organization and branch data from JSON file."""
-        json_path = os.path.join(os.path.dirname(__file__), 'organizations_data.json')
-        try:
-            with open(json_path, 'r') as file:
-                data = json.load(file)
-                return data.get('organizations', [])
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading {json_path}: {str(e)}")
-            return []
-
-    def _clear_grid(self, grid_layout: QtWidgets.QGridLayout) -> None:
-        """Remove all widgets from the given grid layout."""
-        for i in reversed(range(grid_layout.count())):
-            if widget := grid_layout.itemAt(i).widget():
-                widget.setParent(None)
-
-    def _add_no_record_label(self, grid_layout: QtWidgets.QGridLayout) -> None:
+        """Return organization and branch data from the shared in-memory repository."""
+        return OrganizationRepository.instance().organizations()
+
+    def _add_no_record_label(self, grid_layout: QtWidgets.QGridLayout) -> QtWidgets.QLabel:
         """Add 'No Record(s) Found' label to the grid layout."""
         no_record_label = QtWidgets.QLabel("No Record(s) Found")
         no_record_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        no_record_label.setStyleSheet("font-size: 20px;")
+        theme.set_role(no_record_label, "empty-state")
         grid_layout.addWidget(no_record_label, 0, 0, 1, 5)
-
-    def _update_scroll_areas(self) -> None:
-        """Update scroll areas and geometry."""
-        self.ui.joined_org_scrollable.adjustSize()
-        self.ui.college_org_scrollable.adjustSize()
-        self.ui.joined_org_scrollable.updateGeometry()
-        self.ui.college_org_scrollable.updateGeometry()
-        self.update()
+        return no_record_label
 
     def _perform_search(self) -> None:
         """Handle organization/branch search based on combo box selection."""
+        self.card_search.cancel()
         search_text = self.ui.search_line.text().strip().lower()
         self.load_orgs(search_text) if self.ui.comboBox.currentIndex() == 0 else self.load_branches(search_text)
 
     def _perform_member_search(self) -> None:
         """Handle member search based on input text."""
+        self.member_search.cancel()
         search_text = self.ui.search_line_3.text().strip().lower()
-        self.load_members(search_text)
+        self._show_members(self._filter_members(search_text))
 
     def load_orgs(self, search_text: str = "") -> None:
         """Load and display organizations, filtered by search text."""
-        organizations = self._load_data()
-        self._clear_grid(self.ui.joined_org_grid)
-        self._clear_grid(self.ui.college_org_grid)
-        self.joined_org_count = 0
-        self.college_org_count = 0
-
-        filtered_joined = [org for org in organizations if org["is_joined"] and not org["is_branch"] and (search_text in org["name"].lower() or not search_text)]
-        filtered_college = [org for org in organizations if not org["is_branch"] and (search_text in org["name"].lower() or not search_text)]
-
-        for org in filtered_joined:
-            self._add_joined_org(org)
-        for org in filtered_college:
-            self._add_college_org(org)
-
-        if self.joined_org_count == 0:
-            self._add_no_record_label(self.ui.joined_org_grid)
-        if self.college_org_count == 0:
-            self._add_no_record_label(self.ui.college_org_grid)
-
-        self._update_scroll_areas()
+        self._show_cards(*self._filter_orgs(search_text))
 
     def load_branches(self, search_text: str = "") -> None:
         """Load and display branches, filtered by search text."""
-        organizations = self._load_data()
-        self._clear_grid(self.ui.joined_org_grid)
-        self._clear_grid(self.ui.college_org_grid)
-        self.joined_org_count = 0
-        self.college_org_count = 0
-
+        self._show_cards(*self._filter_branches(search_text))
+
+    def _filter_orgs(self, search_text: str) -> Tuple[List[Dict], List[Dict]]:
+        """Return the joined and college organizations matching the search text."""
+        repository = OrganizationRepository.instance()
+        # Also runs on the live search worker; mutations change the index under this lock.
+        with repository.lock:
+            organizations = self._load_data()
+            matches = repository.org_index().search(search_text)
+            filtered_joined = [org for org in organizations if org["is_joined"] and not org["is_branch"] and org["id"] in matches]
+            filtered_college = [org for org in organizations if not org["is_branch"] and org["id"] in matches]
+        return filtered_joined, filtered_college
+
+    def _filter_branches(self, search_text: str) -> Tuple[List[Dict], List[Dict]]:
+        """Return the joined and college branches matching the search text."""
+        repository = OrganizationRepository.instance()
         filtered_joined_branches = []
         filtered_college_branches = []
 
-        for org in organizations:
-            for branch in org.get("branches", []):
-                if search_text in branch["name"].lower() or not search_text:
+        with repository.lock:
+            matches = repository.branch_index().search(search_text)
+            for branch in repository.branches():
+                if branch["id"] in matches:
                     if branch["is_joined"]:
                         filtered_joined_branches.append(branch)
                     filtered_college_branches.append(branch)
 
-        for branch in filtered_joined_branches:
-            self._add_joined_org(branch)
-        for branch in filtered_college_branches:
-            self._add_college_org(branch)
+        return filtered_joined_branches, filtered_college_branches
 
-        if self.joined_org_count == 0:
-            self._add_no_record_label(self.ui.joined_org_grid)
-        if self.college_org_count == 0:
-            self._add_no_record_label(self.ui.college_org_grid)
+    def _match_cards(self, search_text: str) -> Tuple[List[Dict], List[Dict]]:
+        """Filter organizations or branches for the live search; runs on a worker thread."""
+        return self._filter_branches(search_text) if self.showing_branches else self._filter_orgs(search_text)
 
-        self._update_scroll_areas()
+    def _show_cards(self, joined: List[Dict], college: List[Dict]) -> None:
+        """Show already filtered organizations or branches in both card views."""
+        self.joined_org_count = len(joined)
+        self.college_org_count = len(college)
+        for view, label, orgs in ((self.joined_org_view, self.joined_no_record_label, joined),
+                                  (self.college_org_view, self.college_no_record_label, college)):
+            view.set_orgs(orgs)
+            view.setVisible(bool(orgs))
+            label.setVisible(not orgs)
 
     def load_members(self, search_text: str = "") -> None:
         """Load and filter members into the table view."""
         if not self.current_org:
             return
-
-        members_data = self.current_org.get("members", [])
-        filtered_members = [
-            member for member in members_data
-            if any(search_text in str(field).lower() for field in member)
-        ] if search_text else members_data
-
-        model = ViewMembers(filtered_members)
-        self.ui.list_view.setModel(model)
-        self.ui.list_view.horizontalHeader().setStretchLastSection(True)
-        self.ui.list_view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
-
-        self.ui.list_view.setVisible(bool(filtered_members))
-        self.no_member_label.setVisible(not filtered_members)
+        self.member_model.set_records(OrganizationRepository.instance().records(self.current_org).members)
+        self._show_members(self._filter_members(search_text))
+
+    def _filter_members(self, search_text: str) -> Optional[Set[int]]:
+        """Return the ids of members with any field containing the search text, or None for all."""
+        if not self.current_org or not search_text:
+            return None
+        repository = OrganizationRepository.instance()
+        with repository.lock:
+            return repository.member_index(self.current_org).search(search_text)
+
+    def _show_members(self, matches: Optional[Set[int]]) -> None:
+        """Narrow the member table to the search matches, keeping its sort and filters."""
+        self.member_proxy.set_matches(matches)
+
+    def _on_member_rows_changed(self, *_args) -> None:
+        """Swap between the member table and the empty label as filters change the shown rows."""
+        if self.table is None:
+            return
+        has_rows = self.member_proxy.rowCount() > 0
+        self.ui.list_view.setVisible(has_rows)
+        self.no_member_label.setVisible(not has_rows)
 
     def _on_combobox_changed(self, index: int) -> None:
         """Handle combo box change to switch between organizations and branches."""
+        self.card_search.cancel()
+        self.showing_branches = index != 0
         self.ui.joined_label.setText("Joined Organization(s)" if index == 0 else "Joined Branch(es)")
         self.ui.college_label.setText("College Organization(s)" if index == 0 else "College Branch(es)")
         self.load_orgs() if index == 0 else self.load_branches()
-        self.ui.joined_org_scrollable.verticalScrollBar().setValue(0)
-        self.ui.college_org_scrollable.verticalScrollBar().setValue(0)
-
-    def _add_joined_org(self, org_data: Dict) -> None:
-        """Add a joined organization card to the grid."""
-        card = JoinedOrgCard(self._get_logo_path(org_data["logo_path"]), org_data["details"], org_data, self)
-        col = self.joined_org_count % 5
-        row = self.joined_org_count // 5
-        self.ui.joined_org_grid.addWidget(card, row, col, alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
-        self.joined_org_count += 1
-        self.ui.joined_org_grid.setRowMinimumHeight(row, 300)
-
-    def _add_college_org(self, org_data: Dict) -> None:
-        """Add a college organization card to the grid."""
-        card = CollegeOrgCard(
-            self._get_logo_path(org_data["logo_path"]), org_data["description"],
-            org_data["details"], org_data, self
-        )
-        col = self.college_org_count % 5
-        row = self.college_org_count // 5
-        self.ui.college_org_grid.addWidget(card, row, col, alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
-        self.college_org_count += 1
-        self.ui.college_org_grid.setRowMinimumHeight(row, 300)
+        self.joined_org_view.scrollToTop()
+        self.college_org_view.scrollToTop()
 
     def set_circular_logo(self, logo_label: QtWidgets.QLabel, logo_path: str, size: int = 200, border_width: int = 4) -> None:
         """Set a circular logo with a border on the given label."""
         logo_label.setFixedSize(size, size)
-        if logo_path == "No Photo" or QtGui.QPixmap(logo_path).isNull():
-            logo_label.setText("No Logo")
-            return
 
-        pixmap = QtGui.QPixmap(logo_path).scaled(size, size, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
-        centered_pixmap = QtGui.QPixmap(size, size)
-        centered_pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-        
-        with QtGui.QPainter(centered_pixmap) as painter:
-            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-            x = (size - pixmap.width()) // 2
-            y = (size - pixmap.height()) // 2
-            painter.drawPixmap(x, y, pixmap)
-
-        mask = QtGui.QPixmap(size, size)
-        mask.fill(QtCore.Qt.GlobalColor.transparent)
-        with QtGui.QPainter(mask) as painter:
-            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-            path = QtGui.QPainterPath()
-            path.addEllipse(0, 0, size, size)
-            painter.fillPath(path, QtCore.Qt.GlobalColor.white)
-
-        centered_pixmap.setMask(mask.createMaskFromColor(QtCore.Qt.GlobalColor.white, QtCore.Qt.MaskMode.MaskOutColor))
-
-        final_pixmap = QtGui.QPixmap(size, size)
-        final_pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-        with QtGui.QPainter(final_pixmap) as painter:
-            painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-            painter.setBrush(QtGui.QBrush(centered_pixmap))
-            painter.setPen(QtGui.QPen(QtGui.QColor(8, 73, 36), border_width))
-            painter.drawEllipse(border_width // 2, border_width // 2, size - border_width, size - border_width)
-
-        logo_label.setPixmap(final_pixmap)
+        def show(pixmap: QtGui.QPixmap) -> None:
+            if pixmap.isNull():
+                logo_label.setText("No Logo")
+            else:
+                logo_label.setPixmap(pixmap)
+
+        pixmap = ImageLoader.instance().request_avatar(logo_label, logo_path, size, border_width, show)
+        if pixmap is None:
+            logo_label.setPixmap(placeholder(size, size, radius=size / 2))
+        else:
+            show(pixmap)
 
     def _on_officer_history_changed(self, index: int) -> None:
         """Handle officer history combobox change to display officers for selected semester."""
@@ -240,42 +258,33 @@ class MainWindow(QtWidgets.QMainWindow):
         self.load_officers(officers)
 
     def load_officers(self, officers: List[Dict]) -> None:
-        """Load officer cards into the officer grid."""
-        self._clear_grid(self.ui.officer_cards_grid)
-        self.officer_count = 0
+        """Bind officers to the pooled officer cards, creating cards only when the grid grows."""
         self.ui.officers_scroll_area.verticalScrollBar().setValue(0)
+        self.officer_no_record_label.setVisible(not officers)
+        self.officer_pool.show(officers)
+        self.officer_count = len(officers)
 
-        if not officers:
-            self._add_no_record_label(self.ui.officer_cards_grid)
-            return
-
-        for officer in officers:
-            card = OfficerCard(officer, self)
-            col = self.officer_count % 3
-            row = self.officer_count // 3
-            self.ui.officer_cards_grid.addWidget(card, row, col, alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter)
-            self.officer_count += 1
-            self.ui.officer_cards_grid.setRowMinimumHeight(row, 400)
+        used_rows = (self.officer_count + 2) // 3
+        for row in range((len(self.officer_pool) + 2) // 3):
+            self.ui.officer_cards_grid.setRowMinimumHeight(row, 400 if row < used_rows else 0)
 
     def show_officer_dialog(self, officer_data: Dict) -> None:
         """Display officer details in a dialog."""
         OfficerDialog(officer_data, self).exec()
 
     def load_events(self, events: List[Dict]) -> None:
-        """Load event cards into the events layout."""
-        while self.ui.verticalLayout_14.count():
-            if item := self.ui.verticalLayout_14.takeAt(0).widget():
-                item.deleteLater()
-
-        for event in events:
-            self.ui.verticalLayout_14.addWidget(EventCard(event, self))
-
-        self.ui.verticalLayout_14.addStretch()
+        """Bind events to the pooled event cards, creating cards only when the list grows."""
+        self.event_pool.show(events)
         self.ui.scroll_area_events.verticalScrollBar().setValue(0)
 
     def show_org_details(self, org_data: Dict) -> None:
         """Display organization details on the details page."""
+        # Summaries are loaded up front; members, events and officer history on first open.
+        org_data = OrganizationRepository.instance().load_details(org_data)
         self.current_org = org_data
+        self.pages.ensure(1)
+        if self.member_search:
+            self.member_search.cancel()
         self.ui.header_label_2.setText("Organization" if not org_data["is_branch"] else "Branch")
         self.ui.status_btn.setText("Active")
         self.ui.org_name.setText(org_data["name"])
@@ -292,11 +301,15 @@ class MainWindow(QtWidgets.QMainWindow):
         
         self.load_officers(org_data.get("officers", []))
         self.load_events(org_data.get("events", []))
+        for officer in org_data.get("officers", []):
+            # Officer dialogs show a 150px avatar; render it before the dialog is opened.
+            ImageLoader.instance().prefetch_avatar(self, officer.get("photo_path", "No Photo"), 150, 4)
         self.ui.label.setText("A.Y. 2025-2026 - 1st Semester")
         self.ui.stacked_widget.setCurrentIndex(1)
 
     def _to_members_page(self) -> None:
         """Navigate to the members page."""
+        self.pages.ensure(2)
         self.load_members()
         self.ui.stacked_widget.setCurrentIndex(2)
 
@@ -309,7 +322,10 @@ class MainWindow(QtWidgets.QMainWindow):
             self.ui.stacked_widget.setCurrentIndex(0)
 
 if __name__ == "__main__":
-    app = QtWidgets.QApplication(sys.argv)
-    window = MainWindow()
+    with startup_trace.span("QApplication"):
+        app = QtWidgets.QApplication(sys.argv)
+    with startup_trace.span("build window"):
+        window = MainWindow()
+    startup_trace.finish_on_first_paint(window)
     window.show()
     sys.exit(app.exec())
\ No newline at end of file